@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+
+# Compares the Base58 codec with the previous implementation and the base58 package.
+# Usage: python benchmarks/base58_codec.py [number]
+
+from hdwallet.libs import base58 as codec
+
+import base58
+import os
+import sys
+import timeit
+
+
+NUMBER: int = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+ALPHABET: str = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+PAYLOADS: dict = {
+    "address": b"\x00" + os.urandom(24),
+    "wif": b"\x80" + os.urandom(37),
+    "xkey": bytes.fromhex("0488ade4") + os.urandom(78)
+}
+
+
+def legacy_encode(data: bytes) -> str:
+    enc, val = "", 0
+    for (i, c) in enumerate(data[::-1]):
+        val += (256 ** i) * c
+    while val >= len(ALPHABET):
+        val, mod = divmod(val, len(ALPHABET))
+        enc = ALPHABET[mod] + enc
+    if val:
+        enc = ALPHABET[val] + enc
+    return ALPHABET[0] * (len(data) - len(data.lstrip(b"\0"))) + enc
+
+
+def legacy_decode(data: str) -> bytes:
+    val, prefix = 0, 0
+    for c in bytes(data, "ascii"):
+        val = (val * len(ALPHABET)) + ALPHABET.encode("utf-8").find(c)
+        if val == 0:
+            prefix += 1
+    dec = bytearray()
+    while val > 0:
+        val, mod = divmod(val, 256)
+        dec.append(mod)
+    dec.extend(bytearray(prefix))
+    return bytes(dec[::-1])
+
+
+def measure(function) -> float:
+    return min(timeit.repeat(function, number=NUMBER, repeat=3)) / NUMBER * 1e6
+
+
+for name, payload in PAYLOADS.items():
+    encoded: str = codec.encode(payload)
+    assert encoded == legacy_encode(payload) == base58.b58encode(payload).decode()
+    print(
+        f"{name:>8} encode: legacy {measure(lambda: legacy_encode(payload)):7.2f} us, "
+        f"base58 {measure(lambda: base58.b58encode(payload)):7.2f} us, "
+        f"hdwallet {measure(lambda: codec.encode(payload)):7.2f} us"
+    )
+    print(
+        f"{name:>8} decode: legacy {measure(lambda: legacy_decode(encoded)):7.2f} us, "
+        f"base58 {measure(lambda: base58.b58decode(encoded)):7.2f} us, "
+        f"hdwallet {measure(lambda: codec.decode(encoded)):7.2f} us"
+    )
+
+batch: list = [PAYLOADS["address"]] * 1000
+print(
+    f"   batch encode (1000 addresses): loop {measure(lambda: [codec.encode(data) for data in batch]) / 1e3:7.2f} ms, "
+    f"encode_many {measure(lambda: codec.encode_many(batch)) / 1e3:7.2f} ms"
+)
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+
+# Compares the RIPEMD-160 backends on raw hashing and on BIP44 address dumps.
+# Usage: python benchmarks/ripemd160.py [addresses]
+
+from hdwallet import (
+    HDWallet, crypto
+)
+from hdwallet.cryptocurrencies import Bitcoin as Cryptocurrency
+from hdwallet.derivations import BIP44Derivation
+from hdwallet.hds import BIP44HD
+from hdwallet.mnemonics import BIP39Mnemonic
+
+import sys
+import timeit
+
+
+ADDRESSES: int = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+PUBLIC_KEY: bytes = bytes.fromhex("02" + "11" * 32)
+
+
+def dump_addresses() -> None:
+    hdwallet: HDWallet = HDWallet(
+        cryptocurrency=Cryptocurrency, hd=BIP44HD
+    ).from_mnemonic(
+        mnemonic=BIP39Mnemonic(
+            mnemonic="abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon about"
+        )
+    ).from_derivation(
+        derivation=BIP44Derivation(address=(0, ADDRESSES - 1))
+    )
+    hdwallet.dumps(include={"address", "fingerprint", "parent_fingerprint"})
+
+
+default_backend: str = crypto.RIPEMD160_BACKEND
+for backend in crypto.RIPEMD160_BACKENDS:
+    crypto.RIPEMD160_BACKEND = backend
+    hash160: float = min(timeit.repeat(
+        lambda: crypto.hash160(PUBLIC_KEY), number=10000, repeat=3
+    )) / 10000
+    address: float = timeit.timeit(dump_addresses, number=1) / ADDRESSES
+    print(
+        f"{backend:>12}: hash160 {hash160 * 1e6:8.2f} us, "
+        f"address {address * 1e3:7.3f} ms ({ADDRESSES} addresses)"
+    )
+crypto.RIPEMD160_BACKEND = default_backend
@@ -20,7 +20,6 @@ from .info import (
     __keywords__,
     __websites__
 )
-from .hdwallet import HDWallet
 
 __all__: List[str] = [
     "__name__",
@@ -37,3 +36,12 @@ __all__: List[str] = [
     "__websites__",
     "HDWallet"
 ]
+
+
+def __getattr__(name: str):
+    # HDWallet pulls in the whole derivation stack, so it is only
+    # imported once it is actually used
+    if name == "HDWallet":
+        from .hdwallet import HDWallet
+        return HDWallet
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -215,7 +215,7 @@ class ADDRESSES:
         :rtype: bool
         """
 
-        return name in cls.names()
+        return name in cls.dictionary
 
 
 __all__: List[str] = [
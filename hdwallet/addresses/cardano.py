@@ -5,7 +5,7 @@
 # file COPYING or https://opensource.org/license/mit
 
 from typing import (
-    Any, Union
+    Any, Dict, Iterable, List, Tuple, Union
 )
 
 import cbor2
@@ -290,6 +290,34 @@ class CardanoAddress(IAddress):
         :rtype: str
         """
 
+        return cls.encode_byron_legacy_many(
+            keys=[(public_key, path, chain_code)], path_key=path_key, address_type=address_type
+        )[0]
+
+    @classmethod
+    def encode_byron_legacy_many(
+        cls,
+        keys: Iterable[Tuple[Union[bytes, str, IPublicKey], str, Union[bytes, str]]],
+        path_key: Union[bytes, str],
+        address_type: str = Cardano.ADDRESS_TYPES.PUBLIC_KEY
+    ) -> List[str]:
+        """
+        Encodes many public keys of one wallet into Byron legacy addresses.
+
+        The path key and address type are checked once for the whole batch and the
+        CBOR encoding of every path index is computed once and shared across paths.
+
+        :param keys: The ``(public_key, path, chain_code)`` tuples to encode.
+        :type keys: Iterable[Tuple[Union[bytes, str, IPublicKey], str, Union[bytes, str]]]
+        :param path_key: The HD path key used for encryption, shared by the batch.
+        :type path_key: Union[bytes, str]
+        :param address_type: The type of Byron address to generate (default: Cardano.ADDRESS_TYPES.PUBLIC_KEY).
+        :type address_type: str
+
+        :return: The encoded Byron legacy addresses, in input order.
+        :rtype: List[str]
+        """
+
         if address_type not in [
             Cardano.ADDRESS_TYPES.PUBLIC_KEY, Cardano.ADDRESS_TYPES.REDEMPTION
         ]:
@@ -299,37 +327,41 @@ class CardanoAddress(IAddress):
                 ], got=address_type
             )
 
-        chain_code: bytes = get_bytes(chain_code)
         path_key: bytes = get_bytes(path_key)
         if len(path_key) != 32:
             raise Error("Invalid HD path key length", expected=32, got=len(path_key))
 
-        public_key: IPublicKey = validate_and_get_public_key(
-            public_key=public_key, public_key_cls=KholawEd25519PublicKey
-        )
-
-        plain_text: bytes = (
-            integer_to_bytes(0x9F, bytes_num=1) +
-            b"".join([cbor2.dumps(p) for p in path_to_indexes(path=path)]) +
-            integer_to_bytes(0xFF, bytes_num=1)
-        )
+        encoded_indexes: Dict[int, bytes] = { }
+        addresses: List[str] = []
+        for public_key, path, chain_code in keys:
+            public_key: IPublicKey = validate_and_get_public_key(
+                public_key=public_key, public_key_cls=KholawEd25519PublicKey
+            )
 
-        cipher_text_bytes, tag_bytes = chacha20_poly1305_encrypt(
-            key=path_key,
-            nonce=cls.chacha20_poly1305_nonce,
-            assoc_data=cls.chacha20_poly1305_associated_data,
-            plain_text=plain_text
-        )
+            plain_text: bytes = integer_to_bytes(0x9F, bytes_num=1)
+            for index in path_to_indexes(path=path):
+                if index not in encoded_indexes:
+                    encoded_indexes[index] = cbor2.dumps(index)
+                plain_text += encoded_indexes[index]
+            plain_text += integer_to_bytes(0xFF, bytes_num=1)
+
+            cipher_text_bytes, tag_bytes = chacha20_poly1305_encrypt(
+                key=path_key,
+                nonce=cls.chacha20_poly1305_nonce,
+                assoc_data=cls.chacha20_poly1305_associated_data,
+                plain_text=plain_text
+            )
 
-        address_attributes: dict = {
-            1: cbor2.dumps(cipher_text_bytes + tag_bytes)
-        }
-        return cls.encode_byron(
-            public_key=public_key,
-            chain_code=chain_code,
-            address_attributes=address_attributes,
-            address_type=address_type
-        )
+            address_attributes: dict = {
+                1: cbor2.dumps(cipher_text_bytes + tag_bytes)
+            }
+            addresses.append(cls.encode_byron(
+                public_key=public_key,
+                chain_code=get_bytes(chain_code),
+                address_attributes=address_attributes,
+                address_type=address_type
+            ))
+        return addresses
 
     @classmethod
     def decode_byron(cls, address: str, address_type: str = Cardano.ADDRESS_TYPES.PUBLIC_KEY) -> str:
@@ -8,7 +8,6 @@ from typing import (
     Any, Union
 )
 
-from ..libs.ripemd160 import ripemd160
 from ..libs.bech32 import (
     bech32_encode, bech32_decode
 )
@@ -16,7 +15,9 @@ from ..ecc import (
     IPublicKey, SLIP10Secp256k1PublicKey, validate_and_get_public_key
 )
 from ..cryptocurrencies import Cosmos
-from ..crypto import sha256
+from ..crypto import (
+    sha256, ripemd160
+)
 from ..utils import bytes_to_string
 from .iaddress import IAddress
 
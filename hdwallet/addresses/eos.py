@@ -11,7 +11,7 @@ from typing import (
 from ..libs.base58 import (
     ensure_string, encode, decode
 )
-from ..libs.ripemd160 import ripemd160
+from ..crypto import ripemd160
 from ..ecc import (
     IPublicKey, SLIP10Secp256k1PublicKey, validate_and_get_public_key
 )
@@ -4,9 +4,16 @@
 # Distributed under the MIT software license, see the accompanying
 # file COPYING or https://opensource.org/license/mit
 import inspect
-from bip38 import cryptocurrencies
 
-BIP38_CRYPTOCURRENCIES = {
-	name: cls for name, cls in inspect.getmembers(cryptocurrencies, inspect.isclass)
-    if issubclass(cls, cryptocurrencies.ICryptocurrency)
-}
\ No newline at end of file
+
+def __getattr__(name: str):
+    # bip38 is only needed by the dump commands, so it is not imported
+    # until they ask for the cryptocurrency table
+    if name == "BIP38_CRYPTOCURRENCIES":
+        from bip38 import cryptocurrencies
+        table = globals()["BIP38_CRYPTOCURRENCIES"] = {
+            name: cls for name, cls in inspect.getmembers(cryptocurrencies, inspect.isclass)
+            if issubclass(cls, cryptocurrencies.ICryptocurrency)
+        }
+        return table
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -16,15 +16,6 @@ from ..const import (
 
 from .. import __version__
 
-from .generate.entropy import generate_entropy
-from .generate.mnemonic import generate_mnemonic
-from .generate.seed import generate_seed
-from .dump import dump
-from .dumps import dumps
-from .list.cryptocurrencies import list_cryptocurrencies
-from .list.languages import list_languages
-from .list.strengths import list_strengths
-
 
 def current_version(
     context: click.core.Context, option: click.core.Option, value: bool
@@ -80,6 +71,7 @@ def generate(context: click.core.Context) -> None:
     "-s", "--strength", type=int, default=None, help="Set Strength for entropy", show_default=True
 )
 def cli_entropy(**kwargs) -> None:
+    from .generate.entropy import generate_entropy
     return generate_entropy(**kwargs)
 
 
@@ -111,6 +103,7 @@ def cli_entropy(**kwargs) -> None:
     "-cs", "--checksum", type=bool, default=False, help="Set Checksum for Monero", show_default=True
 )
 def cli_mnemonic(**kwargs) -> None:
+    from .generate.mnemonic import generate_mnemonic
     return generate_mnemonic(**kwargs)
 
 
@@ -136,6 +129,7 @@ def cli_mnemonic(**kwargs) -> None:
     "-mt", "--mnemonic-type", type=str, default="standard", help="Set Mnemonic type for Electrum-V2", show_default=True
 )
 def cli_seed(**kwargs) -> None:
+    from .generate.seed import generate_seed
     return generate_seed(**kwargs)
 
 
@@ -269,6 +263,7 @@ def cli_seed(**kwargs) -> None:
     "-ex", "--exclude", type=str, default="", help="Set Exclude keys from dumped", show_default=True
 )
 def cli_dump(**kwargs) -> None:  # cli_dumps(max_content_width=120)
+    from .dump import dump
     return dump(**kwargs)
 
 
@@ -402,7 +397,10 @@ def cli_dump(**kwargs) -> None:  # cli_dumps(max_content_width=120)
     "-ex", "--exclude", type=str, default="", help="Set Exclude keys from dumped", show_default=True
 )
 @click.option(
-    "-f", "--format", type=str, default="csv", help="Show dumps format type", show_default=True
+    "-f", "--format", type=str, default="csv", help="Show dumps format type (csv, json or ndjson)", show_default=True
+)
+@click.option(
+    "-o", "--output", type=str, default=None, help="Set Output file to write dumps into", show_default=True
 )
 @click.option(
     "-in", "--include", type=str, default=None, help="Set Include keys from dumped", show_default=True
@@ -413,7 +411,11 @@ def cli_dump(**kwargs) -> None:  # cli_dumps(max_content_width=120)
 @click.option(
     "-de", "--delimiter", type=str, default=" ", help="Set Delimiter for CSV", show_default=True
 )
+@click.option(
+    "-wo", "--workers", type=int, default=1, help="Set Workers processes for dumps", show_default=True
+)
 def cli_dumps(**kwargs) -> None:  # cli_dumps(max_content_width=120)
+    from .dumps import dumps
     return dumps(**kwargs)
 
 
@@ -436,6 +438,7 @@ def cli_list() -> None:
     short_help="List Available cryptocurrencies of HDWallet"
 )
 def cli_cryptocurrencies() -> None:
+    from .list.cryptocurrencies import list_cryptocurrencies
     return list_cryptocurrencies()
 
 
@@ -446,6 +449,7 @@ def cli_cryptocurrencies() -> None:
     short_help="List Languages of mnemonic words"
 )
 def cli_languages() -> None:
+    from .list.languages import list_languages
     return list_languages()
 
 
@@ -456,4 +460,5 @@ def cli_languages() -> None:
     short_help="List Strengths of mnemonic words"
 )
 def cli_strengths() -> None:
+    from .list.strengths import list_strengths
     return list_strengths()
@@ -5,7 +5,7 @@
 # file COPYING or https://opensource.org/license/mit
 
 from typing import (
-    Type, List, Tuple
+    Type, Optional, Iterator, List
 )
 from bip38 import BIP38
 
@@ -20,9 +20,7 @@ from ..seeds import SEEDS
 from ..hds import (
     BIP32HD, BIP44HD, BIP49HD, BIP84HD, BIP86HD, BIP141HD, CardanoHD, ElectrumV1HD, ElectrumV2HD, MoneroHD, HDS
 )
-from ..derivations import (
-    IDerivation, DERIVATIONS
-)
+from ..derivations import DERIVATIONS
 from ..cryptocurrencies import (
     ICryptocurrency, get_cryptocurrency
 )
@@ -30,6 +28,9 @@ from ..hdwallet import HDWallet
 from . import BIP38_CRYPTOCURRENCIES
 
 
+OUTPUT_BUFFER_SIZE: int = 1024 * 1024
+
+
 def dumps(**kwargs) -> None:
     try:
         cryptocurrency: Type[ICryptocurrency] = get_cryptocurrency(
@@ -263,125 +264,63 @@ def dumps(**kwargs) -> None:
             _include: str = "at:path,addresses:chain,public_key,wif"
 
 
-        hdwallet_csv = csv.DictWriter(
-            sys.stdout, fieldnames=_include.split(","), extrasaction="ignore", delimiter=kwargs.get("delimiter")
-        )
-
-        if kwargs.get("include_header"):
-            hdwallet_csv.writeheader()
-
-        def drive(*args) -> List[str]:
-            def drive_helper(derivations, current_derivation: List[Tuple[int, bool]] = []) -> List[str]:
-                if not derivations:
-
-                    derivation_name: str = hdwallet._derivation.name()
-                    if derivation_name in [
-                        "BIP44", "BIP49", "BIP84", "BIP86"
-                    ]:
-                        _derivation: IDerivation = DERIVATIONS.derivation(
-                            name=kwargs.get("derivation")
-                        ).__call__(
-                            coin_type=current_derivation[1][0],
-                            account=current_derivation[2][0],
-                            change=current_derivation[3][0],
-                            address=current_derivation[4][0]
-                        )
-                    elif derivation_name == "CIP1852":
-                        _derivation: IDerivation = DERIVATIONS.derivation(
-                            name=kwargs.get("derivation")
-                        ).__call__(
-                            coin_type=current_derivation[1][0],
-                            account=current_derivation[2][0],
-                            role=current_derivation[3][0],
-                            address=current_derivation[4][0]
-                        )
-                    elif derivation_name == 'Electrum':
-                        _derivation: IDerivation = DERIVATIONS.derivation(
-                            name=kwargs.get("derivation")
-                        ).__call__(
-                            change=current_derivation[0][0],
-                            address=current_derivation[1][0]
-                        )
-                    elif derivation_name == "Monero":
-                        _derivation: IDerivation = DERIVATIONS.derivation(
-                            name=kwargs.get("derivation")
-                        ).__call__(
-                            minor=current_derivation[0][0],
-                            major=current_derivation[1][0]
-                        )
-                    elif derivation_name == "HDW":
-                        _derivation: IDerivation = DERIVATIONS.derivation(
-                            name=kwargs.get("derivation")
-                        ).__call__(
-                            account=current_derivation[0][0],
-                            ecc=current_derivation[1][0],
-                            address=current_derivation[2][0]
-                        )
-                    else:
-                        _derivation: IDerivation = DERIVATIONS.derivation(
-                            name=kwargs.get("derivation")
-                        ).__call__(
-                            path="m/" + "/".join(
-                                [str(item[0]) + "'" if item[1] else str(item[0]) for item in current_derivation]
-                            )
-                        )
-
-                    hdwallet.update_derivation(
-                        derivation=_derivation
-                    )
-                    if kwargs.get("format") == "csv":
-                        new_dump: dict = { }
-                        dump: dict = hdwallet.dump(exclude={"root"})
-                        for key in [keys.split(":") for keys in _include.split(",")]:
-                            if len(key) == 2:
-                                new_dump.setdefault(f"{key[0]}:{key[1]}", dump[key[0]][key[1]])
-                            else:
-                                new_dump.setdefault(f"{key[0]}", dump[key[0]])
-                        hdwallet_csv.writerow(new_dump)
-
-                    elif kwargs.get("format") == "json":
-                        excludes = kwargs.get("exclude").split(",")
-                        dump: dict = hdwallet.dump(exclude={"root", *excludes})
-                        click.echo(json.dumps(dump, indent=4, ensure_ascii=False))
-
-                    return [_derivation.path()]
-
-                path: List[str] = []
-                if len(derivations[0]) == 3:
-                    for value in range(derivations[0][0], derivations[0][1] + 1):
-                        path += drive_helper(
-                            derivations[1:], current_derivation + [(value, derivations[0][2])]
-                        )
-                else:
-                    path += drive_helper(
-                        derivations[1:], current_derivation + [derivations[0]]
-                    )
-                return path
-            return drive_helper(args)
+        if kwargs.get("format") not in ["csv", "json", "ndjson"]:
+            click.echo(click.style(
+                f"Wrong format, (expected= json | ndjson | csv, got='{kwargs.get('format')}')"
+            ), err=True)
+            sys.exit()
 
-        if kwargs.get("format") == "csv":
-            if hdwallet._derivation is None:
-                return None
+        if hdwallet._derivation is None:
+            return None
 
-            drive(*hdwallet._derivation.derivations())
+        output = (
+            open(kwargs.get("output"), "w", encoding="utf-8", newline="", buffering=OUTPUT_BUFFER_SIZE)
+            if kwargs.get("output") else sys.stdout
+        )
 
-        elif kwargs.get("format") == "json":
-            if hdwallet._derivation is None:
-                return None
+        def derivations(exclude: set, include: Optional[set] = None) -> Iterator[dict]:
+            if kwargs.get("workers", 1) <= 1:
+                return hdwallet.iter_dumps(exclude=exclude, include=include)
+            return iter(hdwallet.dumps(
+                exclude={"root", *exclude}, include=include, workers=kwargs.get("workers")
+            ))
 
-            excludes = kwargs.get("exclude").split(",")
-            if "root" not in excludes:
-                click.echo(json.dumps(
-                    hdwallet.dump(exclude={'derivation', *excludes}), indent=4, ensure_ascii=False
-                ))
+        try:
+            if kwargs.get("format") == "csv":
+                includes: List[List[str]] = [keys.split(":") for keys in _include.split(",")]
 
+                hdwallet_csv = csv.DictWriter(
+                    output, fieldnames=_include.split(","), extrasaction="ignore", delimiter=kwargs.get("delimiter")
+                )
+                if kwargs.get("include_header"):
+                    hdwallet_csv.writeheader()
+
+                # Sections are selected down to the requested keys, so e.g. addresses:p2pkh
+                # never encodes the other address types
+                for dump in derivations(exclude=set(), include=set(_include.split(","))):
+                    new_dump: dict = { }
+                    for key in includes:
+                        if len(key) == 2:
+                            new_dump.setdefault(f"{key[0]}:{key[1]}", dump[key[0]][key[1]])
+                        else:
+                            new_dump.setdefault(f"{key[0]}", dump[key[0]])
+                    hdwallet_csv.writerow(new_dump)
 
-            drive(*hdwallet._derivation.derivations())
-        else:
-            click.echo(click.style(
-                f"Wrong format, (expected= json | csv, got='{kwargs.get('format')}')"
-            ), err=True)
-            sys.exit()
+            else:
+                indent: Optional[int] = 4 if kwargs.get("format") == "json" else None
+                excludes: set = set(kwargs.get("exclude").split(","))
+                if "root" not in excludes:
+                    output.write(json.dumps(
+                        hdwallet.dump(exclude={'derivation', *excludes}), indent=indent, ensure_ascii=False
+                    ) + "\n")
+
+                for dump in derivations(exclude=excludes):
+                    output.write(json.dumps(dump, indent=indent, ensure_ascii=False) + "\n")
+        finally:
+            if output is not sys.stdout:
+                output.close()
+            else:
+                output.flush()
 
     except Exception as exception:
         click.echo(click.style(
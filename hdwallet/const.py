@@ -5,7 +5,7 @@
 # file COPYING or https://opensource.org/license/mit
 
 from typing import (
-    Optional, Union, Literal, List, Any
+    Optional, Union, Literal, List, Tuple, FrozenSet, Any
 )
 from types import SimpleNamespace
 
@@ -147,11 +147,27 @@ class HDs(NestedNamespace):
 
 class Addresses(NestedNamespace):
 
+    # Lookup indexes, built on first use and kept out of the namespace __dict__
+    __slots__ = ("_addresses", "_index")
+
+    def index(self) -> FrozenSet[str]:
+        try:
+            return self._index
+        except AttributeError:
+            self._addresses: Tuple[str, ...] = tuple(self.__dict__.values())
+            self._index: FrozenSet[str] = frozenset(self._addresses)
+            return self._index
+
+    def is_address(self, address: str) -> bool:
+        return address in self.index()
+
     def get_addresses(self) -> List[str]:
-        return list(self.__dict__.values())
+        self.index()
+        return list(self._addresses)
 
     def length(self) -> int:
-        return len(self.get_addresses())
+        self.index()
+        return len(self._addresses)
 
 
 class AddressTypes(NestedNamespace):
@@ -168,11 +184,25 @@ class AddressPrefixes(NestedNamespace):
 
 class Networks(NestedNamespace):
 
+    # Lookup indexes, built on first use and kept out of the namespace __dict__
+    __slots__ = ("_networks", "_index")
+
+    def index(self) -> FrozenSet[str]:
+        try:
+            return self._index
+        except AttributeError:
+            self._networks: Tuple[str, ...] = tuple(
+                network.lower() for network in self.__dict__.keys()
+            )
+            self._index: FrozenSet[str] = frozenset(self._networks)
+            return self._index
+
     def is_network(self, network: str) -> bool:
-        return network in self.get_networks()
+        return network in self.index()
 
     def get_networks(self) -> List[str]:
-        return [network.lower() for network in self.__dict__.keys()]
+        self.index()
+        return list(self._networks)
 
     def get_network(self, network: str) -> Any:  # INetwork
         if not self.is_network(network=network):
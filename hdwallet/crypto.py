@@ -1,10 +1,10 @@
 #!/usr/bin/env python3
 
 from typing import (
-    Optional, Union, Tuple
+    Optional, Union, Tuple, Dict, Callable
 )
 from Crypto.Hash import (
-    SHA512, SHA3_256, keccak
+    SHA512, SHA3_256, RIPEMD160, keccak
 )
 from Crypto.Cipher import ChaCha20_Poly1305
 from Crypto.Protocol.KDF import PBKDF2
@@ -19,6 +19,8 @@ from .utils import (
     get_bytes, encode, integer_to_bytes
 )
 
+RIPEMD160_ABC_DIGEST: bytes = bytes.fromhex("8eb208f7e05d987a9b044a8e98c6b087f15a0bfc")
+
 
 def hmac_sha256(key: Union[bytes, str], data: Union[bytes, str]) -> bytes:
     """
@@ -64,6 +66,43 @@ def hmac_sha512(key: Union[bytes, str], data: Union[bytes, str]) -> bytes:
     ).digest()
 
 
+def hmac_sha512_context(key: Union[bytes, str]) -> hmac.HMAC:
+    """
+    Create an HMAC-SHA512 context keyed once, for hashing several messages under
+    the same key through :func:`hmac_sha512_digest`.
+
+    The context holds key material, so keep it scoped to the derivation that
+    created it rather than caching it.
+
+    :param key: The key for the HMAC algorithm, as bytes or a string.
+    :type key: Union[bytes, str]
+
+    :return: The keyed HMAC-SHA512 context.
+    :rtype: hmac.HMAC
+    """
+
+    return hmac.new(encode(key), digestmod=hashlib.sha512)
+
+
+def hmac_sha512_digest(context: hmac.HMAC, data: Union[bytes, str]) -> bytes:
+    """
+    Generate an HMAC-SHA512 hash of the given data from a keyed context, leaving
+    the context itself unchanged for the next message.
+
+    :param context: The context created by :func:`hmac_sha512_context`.
+    :type context: hmac.HMAC
+    :param data: The data to be hashed, as bytes or a string.
+    :type data: Union[bytes, str]
+
+    :return: The resulting HMAC-SHA512 hash as bytes.
+    :rtype: bytes
+    """
+
+    _hmac: hmac.HMAC = context.copy()
+    _hmac.update(encode(data))
+    return _hmac.digest()
+
+
 def blake2b(data: Union[bytes, str], digest_size: int, key: Union[bytes, str] = b"", salt: Union[bytes, str] = b"") -> bytes:
     """
     Generate a BLAKE2b hash of the given data with optional key and salt.
@@ -373,9 +412,37 @@ def ripemd160(data: Union[str, bytes]) -> bytes:
     :rtype: bytes
     """
 
-    if "ripemd160" in hashlib.algorithms_available:
-        hashlib.new("ripemd160", get_bytes(data)).digest()
-    return r160(get_bytes(data))
+    return RIPEMD160_BACKENDS[RIPEMD160_BACKEND](get_bytes(data))
+
+
+def get_ripemd160_backends() -> Dict[str, Callable[[bytes], bytes]]:
+    """
+    Probe the available RIPEMD-160 implementations, fastest first.
+
+    OpenSSL builds may list ``ripemd160`` in hashlib but still refuse it (legacy provider),
+    so each candidate is checked against a known digest before it is accepted.
+
+    :return: The working backends by name ("hashlib", "pycryptodome" and the pure Python "pure").
+    :rtype: Dict[str, Callable[[bytes], bytes]]
+    """
+
+    def hashlib_ripemd160(data: bytes) -> bytes:
+        return hashlib.new("ripemd160", data).digest()
+
+    def pycryptodome_ripemd160(data: bytes) -> bytes:
+        return RIPEMD160.new(data).digest()
+
+    backends: Dict[str, Callable[[bytes], bytes]] = { }
+    for name, backend in [
+        ("hashlib", hashlib_ripemd160), ("pycryptodome", pycryptodome_ripemd160)
+    ]:
+        try:
+            if backend(b"abc") == RIPEMD160_ABC_DIGEST:
+                backends[name] = backend
+        except ValueError:
+            continue
+    backends["pure"] = r160
+    return backends
 
 
 def sha512(data: Union[str, bytes]) -> bytes:
@@ -422,3 +489,7 @@ def sha3_256(data: Union[str, bytes]) -> bytes:
     if "sha3_256" in hashlib.algorithms_available:
         return hashlib.new("sha3_256", encode(data)).digest()
     return SHA3_256.new(encode(data)).digest()
+
+
+RIPEMD160_BACKENDS: Dict[str, Callable[[bytes], bytes]] = get_ripemd160_backends()
+RIPEMD160_BACKEND: str = next(iter(RIPEMD160_BACKENDS))
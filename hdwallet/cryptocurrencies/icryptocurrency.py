@@ -80,7 +80,7 @@ class ICryptocurrency:
                 network = network.__name__.lower()
             if not cls.NETWORKS.is_network(network=network):
                 raise NetworkError(
-                    f"Wrong {cls.NAME} network", expected=cls.NETWORKS.networks(), got=network
+                    f"Wrong {cls.NAME} network", expected=cls.NETWORKS.get_networks(), got=network
                 )
 
             bip44_derivation: BIP44Derivation = BIP44Derivation(
@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+
+# Copyright © 2020-2024, Meheret Tesfaye Batu <meherett.batu@gmail.com>
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or https://opensource.org/license/mit
+
+from typing import (
+    Dict, Tuple
+)
+from importlib import import_module
+
+import inspect
+import os
+import pkgutil
+
+
+# Cryptocurrency name -> (module, class name, symbol), in module order. Generated by
+# running ``python -m hdwallet.cryptocurrencies.manifest`` after adding a cryptocurrency,
+# so the registry can resolve names and symbols without importing every module.
+MANIFEST: Dict[str, Tuple[str, str, str]] = {
+    "Adcoin": ("adcoin", "Adcoin", "ACC"),
+    "Akash-Network": ("akashnetwork", "AkashNetwork", "AKT"),
+    "Algorand": ("algorand", "Algorand", "ALGO"),
+    "Anon": ("anon", "Anon", "ANON"),
+    "Aptos": ("aptos", "Aptos", "APT"),
+    "Arbitrum": ("arbitum", "Arbitrum", "ARB"),
+    "Argoneum": ("argoneum", "Argoneum", "AGM"),
+    "Artax": ("artax", "Artax", "XAX"),
+    "Aryacoin": ("aryacoin", "Aryacoin", "AYA"),
+    "Asiacoin": ("asiacoin", "Asiacoin", "AC"),
+    "Auroracoin": ("auroracoin", "Auroracoin", "AUR"),
+    "Avalanche": ("avalanche", "Avalanche", "AVAX"),
+    "Avian": ("avian", "Avian", "AVN"),
+    "Axe": ("axe", "Axe", "AXE"),
+    "Axelar": ("axelar", "Axelar", "AXL"),
+    "Band-Protocol": ("bandprotocol", "BandProtocol", "BAND"),
+    "Bata": ("bata", "Bata", "BTA"),
+    "Beetle-Coin": ("beetlecoin", "BeetleCoin", "BEET"),
+    "Bela-Coin": ("belacoin", "BelaCoin", "BELA"),
+    "Binance": ("binance", "Binance", "BNB"),
+    "Bit-Cloud": ("bitcloud", "BitCloud", "BTDX"),
+    "Bitcoin": ("bitcoin", "Bitcoin", "BTC"),
+    "Bitcoin-Atom": ("bitcoinatom", "BitcoinAtom", "BCA"),
+    "Bitcoin-Cash": ("bitcoincash", "BitcoinCash", "BCH"),
+    "Bitcoin-Cash-SLP": ("bitcoincashslp", "BitcoinCashSLP", "SLP"),
+    "Bitcoin-Gold": ("bitcoingold", "BitcoinGold", "BTG"),
+    "Bitcoin-Green": ("bitcoingreen", "BitcoinGreen", "BITG"),
+    "Bitcoin-Plus": ("bitcoinplus", "BitcoinPlus", "XBC"),
+    "Bitcoin-Private": ("bitcoinprivate", "BitcoinPrivate", "BTCP"),
+    "Bitcoin-SV": ("bitcoinsv", "BitcoinSV", "BSV"),
+    "BitcoinZ": ("bitcoinz", "BitcoinZ", "BTCZ"),
+    "Bitcore": ("bitcore", "Bitcore", "BTX"),
+    "Bit-Send": ("bitsend", "BitSend", "BSD"),
+    "Blackcoin": ("blackcoin", "Blackcoin", "BLK"),
+    "Blocknode": ("blocknode", "Blocknode", "BND"),
+    "Block-Stamp": ("blockstamp", "BlockStamp", "BST"),
+    "Bolivarcoin": ("bolivarcoin", "Bolivarcoin", "BOLI"),
+    "Brit-Coin": ("britcoin", "BritCoin", "BRIT"),
+    "Canada-eCoin": ("canadaecoin", "CanadaECoin", "CDN"),
+    "Cannacoin": ("cannacoin", "Cannacoin", "CCN"),
+    "Cardano": ("cardano", "Cardano", "ADA"),
+    "Celo": ("celo", "Celo", "CELO"),
+    "Chihuahua": ("chihuahua", "Chihuahua", "HUA"),
+    "Clams": ("clams", "Clams", "CLAM"),
+    "Club-Coin": ("clubcoin", "ClubCoin", "CLUB"),
+    "Compcoin": ("compcoin", "Compcoin", "CMP"),
+    "Cosmos": ("cosmos", "Cosmos", "ATOM"),
+    "CPU-Chain": ("cpuchain", "CPUChain", "CPU"),
+    "Crane-Pay": ("cranepay", "CranePay", "CRP"),
+    "Crave": ("crave", "Crave", "CRAVE"),
+    "Dash": ("dash", "Dash", "DASH"),
+    "DeepOnion": ("deeponion", "DeepOnion", "ONION"),
+    "Defcoin": ("defcoin", "Defcoin", "DFC"),
+    "Denarius": ("denarius", "Denarius", "DNR"),
+    "Diamond": ("diamond", "Diamond", "DMD"),
+    "Digi-Byte": ("digibyte", "DigiByte", "DGB"),
+    "Digitalcoin": ("digitalcoin", "Digitalcoin", "DGC"),
+    "Divi": ("divi", "Divi", "DIVI"),
+    "Dogecoin": ("dogecoin", "Dogecoin", "DOGE"),
+    "eCash": ("ecash", "ECash", "XEC"),
+    "E-coin": ("ecoin", "ECoin", "ECN"),
+    "EDR-Coin": ("edrcoin", "EDRCoin", "EDRC"),
+    "e-Gulden": ("egulden", "EGulden", "EFL"),
+    "Einsteinium": ("einsteinium", "Einsteinium", "EMC2"),
+    "Elastos": ("elastos", "Elastos", "ELA"),
+    "Energi": ("energi", "Energi", "NRG"),
+    "EOS": ("eos", "EOS", "EOS"),
+    "Ergo": ("ergo", "Ergo", "ERG"),
+    "Ethereum": ("ethereum", "Ethereum", "ETH"),
+    "Europe-Coin": ("europecoin", "EuropeCoin", "ERC"),
+    "Evrmore": ("evrmore", "Evrmore", "EVR"),
+    "Exclusive-Coin": ("exclusivecoin", "ExclusiveCoin", "EXCL"),
+    "Fantom": ("fantom", "Fantom", "FTM"),
+    "Feathercoin": ("feathercoin", "Feathercoin", "FTC"),
+    "Fetch.ai": ("fetchai", "FetchAI", "FET"),
+    "Filecoin": ("filecoin", "Filecoin", "FIL"),
+    "Firo": ("firo", "Firo", "FIRO"),
+    "Firstcoin": ("firstcoin", "Firstcoin", "FRST"),
+    "FIX": ("fix", "FIX", "FIX"),
+    "Flashcoin": ("flashcoin", "Flashcoin", "FLASH"),
+    "Flux": ("flux", "Flux", "FLUX"),
+    "Foxdcoin": ("foxdcoin", "Foxdcoin", "FOXD"),
+    "Fuji-Coin": ("fujicoin", "FujiCoin", "FJC"),
+    "Game-Credits": ("gamecredits", "GameCredits", "GAME"),
+    "GCR-Coin": ("gcrcoin", "GCRCoin", "GCR"),
+    "Go-Byte": ("gobyte", "GoByte", "GBX"),
+    "Gridcoin": ("gridcoin", "Gridcoin", "GRC"),
+    "Groestl-Coin": ("groestlcoin", "GroestlCoin", "GRS"),
+    "Gulden": ("gulden", "Gulden", "NLG"),
+    "Harmony": ("harmony", "Harmony", "ONE"),
+    "Helleniccoin": ("helleniccoin", "Helleniccoin", "HNC"),
+    "Hempcoin": ("hempcoin", "Hempcoin", "THC"),
+    "Horizen": ("horizen", "Horizen", "ZEN"),
+    "Huobi-Token": ("huobitoken", "HuobiToken", "HT"),
+    "Hush": ("hush", "Hush", "HUSH"),
+    "Icon": ("icon", "Icon", "ICX"),
+    "Injective": ("injective", "Injective", "INJ"),
+    "InsaneCoin": ("insanecoin", "InsaneCoin", "INSN"),
+    "Internet-Of-People": ("internetofpeople", "InternetOfPeople", "IOP"),
+    "IRISnet": ("irisnet", "IRISnet", "IRIS"),
+    "IX-Coin": ("ixcoin", "IXCoin", "IXC"),
+    "Jumbucks": ("jumbucks", "Jumbucks", "JBS"),
+    "Kava": ("kava", "Kava", "KAVA"),
+    "Kobocoin": ("kobocoin", "Kobocoin", "KOBO"),
+    "Komodo": ("komodo", "Komodo", "KMD"),
+    "Landcoin": ("landcoin", "Landcoin", "LDCN"),
+    "LBRY-Credits": ("lbrycredits", "LBRYCredits", "LBC"),
+    "Linx": ("linx", "Linx", "LINX"),
+    "Litecoin": ("litecoin", "Litecoin", "LTC"),
+    "Litecoin-Cash": ("litecoincash", "LitecoinCash", "LCC"),
+    "LitecoinZ": ("litecoinz", "LitecoinZ", "LTZ"),
+    "Lkrcoin": ("lkrcoin", "Lkrcoin", "LKR"),
+    "Lynx": ("lynx", "Lynx", "LYNX"),
+    "Mazacoin": ("mazacoin", "Mazacoin", "MZC"),
+    "Megacoin": ("megacoin", "Megacoin", "MEC"),
+    "Metis": ("metis", "Metis", "METIS"),
+    "Minexcoin": ("minexcoin", "Minexcoin", "MNX"),
+    "Monacoin": ("monacoin", "Monacoin", "MONA"),
+    "Monero": ("monero", "Monero", "XMR"),
+    "Monk": ("monk", "Monk", "MONK"),
+    "MultiversX": ("multiversx", "MultiversX", "EGLD"),
+    "Myriadcoin": ("myriadcoin", "Myriadcoin", "XMY"),
+    "Namecoin": ("namecoin", "Namecoin", "NMC"),
+    "Nano": ("nano", "Nano", "XNO"),
+    "Navcoin": ("navcoin", "Navcoin", "NAV"),
+    "Near": ("near", "Near", "NEAR"),
+    "Neblio": ("neblio", "Neblio", "NEBL"),
+    "Neo": ("neo", "Neo", "NEO"),
+    "Neoscoin": ("neoscoin", "Neoscoin", "NEOS"),
+    "Neurocoin": ("neurocoin", "Neurocoin", "NRO"),
+    "New-York-Coin": ("newyorkcoin", "NewYorkCoin", "NYC"),
+    "Nine-Chronicles": ("ninechronicles", "NineChronicles", "NCG"),
+    "NIX": ("nix", "NIX", "NIX"),
+    "Novacoin": ("novacoin", "Novacoin", "NVC"),
+    "NuBits": ("nubits", "NuBits", "NBT"),
+    "NuShares": ("nushares", "NuShares", "NSR"),
+    "OK-Cash": ("okcash", "OKCash", "OK"),
+    "OKT-Chain": ("oktchain", "OKTChain", "OKT"),
+    "Omni": ("omni", "Omni", "OMNI"),
+    "Onix": ("onix", "Onix", "ONX"),
+    "Ontology": ("ontology", "Ontology", "ONT"),
+    "Optimism": ("optimism", "Optimism", "OP"),
+    "Osmosis": ("osmosis", "Osmosis", "OSMO"),
+    "Particl": ("particl", "Particl", "PART"),
+    "Peercoin": ("peercoin", "Peercoin", "PPC"),
+    "Pesobit": ("pesobit", "Pesobit", "PSB"),
+    "Phore": ("phore", "Phore", "PHR"),
+    "Pi-Network": ("pinetwork", "PiNetwork", "PI"),
+    "Pinkcoin": ("pinkcoin", "Pinkcoin", "PINK"),
+    "Pivx": ("pivx", "Pivx", "PIVX"),
+    "Polygon": ("polygon", "Polygon", "MATIC"),
+    "PoSW-Coin": ("poswcoin", "PoSWCoin", "POSW"),
+    "Potcoin": ("potcoin", "Potcoin", "POT"),
+    "Project-Coin": ("projectcoin", "ProjectCoin", "PRJ"),
+    "Putincoin": ("putincoin", "Putincoin", "PUT"),
+    "Qtum": ("qtum", "Qtum", "QTUM"),
+    "Rapids": ("rapids", "Rapids", "RPD"),
+    "Ravencoin": ("ravencoin", "Ravencoin", "RVN"),
+    "Reddcoin": ("reddcoin", "Reddcoin", "RDD"),
+    "Ripple": ("ripple", "Ripple", "XRP"),
+    "Ritocoin": ("ritocoin", "Ritocoin", "RITO"),
+    "RSK": ("rsk", "RSK", "RBTC"),
+    "Rubycoin": ("rubycoin", "Rubycoin", "RBY"),
+    "Safecoin": ("safecoin", "Safecoin", "SAFE"),
+    "Saluscoin": ("saluscoin", "Saluscoin", "SLS"),
+    "Scribe": ("scribe", "Scribe", "SCRIBE"),
+    "Secret": ("secret", "Secret", "SCRT"),
+    "Shadow-Cash": ("shadowcash", "ShadowCash", "SDC"),
+    "Shentu": ("shentu", "Shentu", "CTK"),
+    "Slimcoin": ("slimcoin", "Slimcoin", "SLM"),
+    "Smileycoin": ("smileycoin", "Smileycoin", "SMLY"),
+    "Solana": ("solana", "Solana", "SOL"),
+    "Solarcoin": ("solarcoin", "Solarcoin", "SLR"),
+    "Stafi": ("stafi", "Stafi", "FIS"),
+    "Stash": ("stash", "Stash", "STASH"),
+    "Stellar": ("stellar", "Stellar", "XLM"),
+    "Stratis": ("stratis", "Stratis", "STRAT"),
+    "Sugarchain": ("sugarchain", "Sugarchain", "SUGAR"),
+    "Sui": ("sui", "Sui", "SUI"),
+    "Syscoin": ("syscoin", "Syscoin", "SYS"),
+    "Terra": ("terra", "Terra", "LUNA"),
+    "Tezos": ("tezos", "Tezos", "XTZ"),
+    "Theta": ("theta", "Theta", "THETA"),
+    "Thought-AI": ("thoughtai", "ThoughtAI", "THT"),
+    "TOA-Coin": ("toacoin", "TOACoin", "TOA"),
+    "Tron": ("tron", "Tron", "TRX"),
+    "TWINS": ("twins", "TWINS", "TWINS"),
+    "Ultimate-Secure-Cash": ("ultimatesecurecash", "UltimateSecureCash", "USC"),
+    "Unobtanium": ("unobtanium", "Unobtanium", "UNO"),
+    "Vcash": ("vcash", "Vcash", "VC"),
+    "VeChain": ("vechain", "VeChain", "VET"),
+    "Verge": ("verge", "Verge", "XVG"),
+    "Vertcoin": ("vertcoin", "Vertcoin", "VTC"),
+    "Viacoin": ("viacoin", "Viacoin", "VIA"),
+    "Vivo": ("vivo", "Vivo", "VIVO"),
+    "Voxels": ("voxels", "Voxels", "VOX"),
+    "Virtual-Cash": ("vpncoin", "VPNCoin", "VASH"),
+    "Wagerr": ("wagerr", "Wagerr", "WGR"),
+    "Whitecoin": ("whitecoin", "Whitecoin", "XWC"),
+    "Wincoin": ("wincoin", "Wincoin", "WC"),
+    "XinFin": ("xinfin", "XinFin", "XDC"),
+    "XUEZ": ("xuez", "XUEZ", "XUEZ"),
+    "Ycash": ("ycash", "Ycash", "YEC"),
+    "Zcash": ("zcash", "Zcash", "ZEC"),
+    "ZClassic": ("zclassic", "ZClassic", "ZCL"),
+    "Zetacoin": ("zetacoin", "Zetacoin", "ZET"),
+    "Zilliqa": ("zilliqa", "Zilliqa", "ZIL"),
+    "ZooBC": ("zoobc", "ZooBC", "ZBC")
+}
+
+
+def generate() -> Dict[str, Tuple[str, str, str]]:
+    """
+    Build the manifest by importing every cryptocurrency module of the package.
+
+    :return: The cryptocurrency name to module, class name and symbol manifest.
+    :rtype: Dict[str, Tuple[str, str, str]]
+    """
+
+    from .icryptocurrency import ICryptocurrency
+
+    manifest: Dict[str, Tuple[str, str, str]] = { }
+    for module_info in sorted(pkgutil.iter_modules([os.path.dirname(__file__)]), key=lambda info: info.name):
+        if module_info.name in ["icryptocurrency", "manifest"]:
+            continue
+        module = import_module(f".{module_info.name}", __package__)
+        for class_name, cls in vars(module).items():
+            if (
+                inspect.isclass(cls) and issubclass(cls, ICryptocurrency) and
+                cls is not ICryptocurrency and cls.__module__ == module.__name__
+            ):
+                manifest[cls.NAME] = (module_info.name, class_name, cls.SYMBOL)
+    return manifest
+
+
+def write(path: str = __file__) -> None:
+    """
+    Regenerate the ``MANIFEST`` literal of this file in place.
+
+    :param path: The manifest source file path.
+    :type path: str
+
+    :return: No return
+    :rtype: NoneType
+    """
+
+    with open(path, "r", encoding="utf-8") as file:
+        source: str = file.read()
+    start: int = source.index("MANIFEST: Dict[str, Tuple[str, str, str]] = {\n")
+    end: int = source.index("\n}\n", start)
+    entries: str = ",\n".join(
+        f'    "{name}": ("{module}", "{class_name}", "{symbol}")'
+        for name, (module, class_name, symbol) in generate().items()
+    )
+    with open(path, "w", encoding="utf-8") as file:
+        file.write(
+            source[:start] + "MANIFEST: Dict[str, Tuple[str, str, str]] = {\n" + entries + source[end:]
+        )
+
+
+if __name__ == "__main__":
+    write()
@@ -122,7 +122,7 @@ class DERIVATIONS:
         :rtype: bool
         """
 
-        return name in cls.names()
+        return name in cls.dictionary
 
 
 __all__: List[str] = [
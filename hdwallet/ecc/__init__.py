@@ -115,7 +115,7 @@ class ECCS:
         :rtype: bool
         """
 
-        return name in cls.names()
+        return name in cls.dictionary
 
 
 def validate_and_get_public_key(
@@ -4,6 +4,8 @@
 # Distributed under the MIT software license, see the accompanying
 # file COPYING or https://opensource.org/license/mit
 
+from typing import Union
+
 from .ipoint import IPoint
 from .ipublic_key import IPublicKey
 from .iprivate_key import IPrivateKey
@@ -24,3 +26,26 @@ class IEllipticCurveCryptography:
     POINT: IPoint
     PUBLIC_KEY: IPublicKey
     PRIVATE_KEY: IPrivateKey
+
+    @classmethod
+    def public_key_tweak_add(cls, public_key: IPublicKey, tweak: Union[bytes, int]) -> IPublicKey:
+        """
+        Add the generator point multiplied by a tweak to a public key.
+
+        This is the public key step of non-hardened child derivation. Curves with a native
+        tweak-add primitive override it, others compute ``point + GENERATOR * tweak``.
+
+        :param public_key: The public key to tweak.
+        :type public_key: IPublicKey
+        :param tweak: The tweak scalar, as big-endian bytes or an integer.
+        :type tweak: Union[bytes, int]
+
+        :return: The tweaked public key.
+        :rtype: IPublicKey
+        """
+
+        if isinstance(tweak, bytes):
+            tweak = int.from_bytes(tweak, "big")
+        return cls.PUBLIC_KEY.from_point(
+            public_key.point() + (cls.GENERATOR * tweak)
+        )
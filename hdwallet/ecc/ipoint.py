@@ -6,7 +6,9 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import (
+    Any, List, Sequence
+)
 from abc import (
     ABC, abstractmethod
 )
@@ -14,6 +16,8 @@ from abc import (
 
 class IPoint(ABC):
 
+    __slots__ = ()
+
     @staticmethod
     @abstractmethod
     def name() -> str:
@@ -52,6 +56,50 @@ class IPoint(ABC):
         :rtype: IPoint
         """
 
+    @classmethod
+    def normalize(cls, points: Sequence["IPoint"]) -> List["IPoint"]:
+        """
+        Bring many points to their affine form at once, so that the coordinate
+        and byte accessors of each point no longer need a field inversion or
+        decoding of their own. Backends with nothing to batch return the points as is.
+
+        :param points: The points to normalize.
+        :type points: Sequence[IPoint]
+
+        :return: The same points, normalized.
+        :rtype: List[IPoint]
+        """
+
+        return list(points)
+
+    @classmethod
+    def raw_encoded_many(cls, points: Sequence["IPoint"]) -> List[bytes]:
+        """
+        Get the encoded raw byte representation of many points, normalizing them together.
+
+        :param points: The points to serialize.
+        :type points: Sequence[IPoint]
+
+        :return: The encoded raw bytes of every point, in order.
+        :rtype: List[bytes]
+        """
+
+        return [point.raw_encoded() for point in cls.normalize(points)]
+
+    @classmethod
+    def raw_decoded_many(cls, points: Sequence["IPoint"]) -> List[bytes]:
+        """
+        Get the decoded raw byte representation of many points, normalizing them together.
+
+        :param points: The points to serialize.
+        :type points: Sequence[IPoint]
+
+        :return: The decoded raw bytes of every point, in order.
+        :rtype: List[bytes]
+        """
+
+        return [point.raw_decoded() for point in cls.normalize(points)]
+
     @abstractmethod
     def x(self) -> int:
         """
@@ -6,7 +6,9 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import (
+    Any, List, Sequence
+)
 from abc import (
     ABC, abstractmethod
 )
@@ -52,6 +54,22 @@ class IPublicKey(ABC):
         :rtype: IPublicKey
         """
 
+    @classmethod
+    def from_points(cls, points: Sequence[IPoint]) -> List["IPublicKey"]:
+        """
+        Create IPublicKey instances from many IPoints, normalizing the points together first.
+
+        :param points: The IPoint instances to create the IPublicKeys from.
+        :type points: Sequence[IPoint]
+
+        :return: The IPublicKey instances, in order.
+        :rtype: List[IPublicKey]
+        """
+
+        return [
+            cls.from_point(point) for point in (type(points[0]).normalize(points) if points else [])
+        ]
+
     @abstractmethod
     def raw_compressed(self) -> bytes:
         """
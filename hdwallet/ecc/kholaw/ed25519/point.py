@@ -9,6 +9,8 @@ from ...slip10.ed25519 import SLIP10Ed25519Point
 
 class KholawEd25519Point(SLIP10Ed25519Point):
 
+    __slots__ = ()
+
     @staticmethod
     def name() -> str:
         """
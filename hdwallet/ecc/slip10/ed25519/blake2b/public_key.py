@@ -79,7 +79,10 @@ class SLIP10Ed25519Blake2bPublicKey(IPublicKey):
         :rtype: IPublicKey
         """
 
-        return cls.from_bytes(point.raw_encoded())
+        # The coordinates are decoded at most once per point instance
+        if not point_is_on_curve((point.x(), point.y())):
+            raise ValueError("Invalid public key bytes")
+        return cls(VerifyingKey(point.raw_encoded()))
 
     @staticmethod
     def compressed_length() -> int:
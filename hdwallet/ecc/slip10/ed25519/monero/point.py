@@ -9,6 +9,8 @@ from ..point import SLIP10Ed25519Point
 
 class SLIP10Ed25519MoneroPoint(SLIP10Ed25519Point):
 
+    __slots__ = ()
+
     @staticmethod
     def name() -> str:
         """
@@ -5,7 +5,7 @@
 # file COPYING or https://opensource.org/license/mit
 
 from typing import (
-    Optional, Any
+    Optional, Any, List, Sequence, Tuple
 )
 
 from ....libs.ed25519 import (
@@ -26,6 +26,9 @@ from ...iecc import IPoint
 
 class SLIP10Ed25519Point(IPoint):
 
+    # Points are created for every derived child, decoded coordinates are kept per instance
+    __slots__ = ("point", "is_generator", "_x", "_y")
+
     is_generator: bool
     point: bytes
     _x: Optional[int]
@@ -69,13 +72,14 @@ class SLIP10Ed25519Point(IPoint):
         :rtype: IPoint
         """
 
-        if not point_is_on_curve(point):
+        coordinates: Tuple[int, int] = point_bytes_to_coord(point)
+        if not point_is_on_curve(coordinates):
             raise ValueError("Invalid point bytes")
         if point_is_decoded_bytes(point):
-            point = point_encode(
-                point_bytes_to_coord(point)
-            )
-        return cls(point)
+            point = point_encode(coordinates)
+        instance: SLIP10Ed25519Point = cls(point)
+        instance._x, instance._y = coordinates
+        return instance
 
     @classmethod
     def from_coordinates(cls, x: int, y: int) -> IPoint:
@@ -96,6 +100,23 @@ class SLIP10Ed25519Point(IPoint):
             point_coord_to_bytes((x, y))
         )
 
+    @classmethod
+    def normalize(cls, points: Sequence[IPoint]) -> List[IPoint]:
+        """
+        Decode and cache the coordinates of many points.
+
+        :param points: The points to normalize.
+        :type points: Sequence[IPoint]
+
+        :return: The same points, with their coordinates decoded.
+        :rtype: List[IPoint]
+        """
+
+        for point in points:
+            if point._x is None:
+                point._x, point._y = point_bytes_to_coord(point.point)
+        return list(points)
+
     def underlying_object(self) -> Any:
         """
         Returns the underlying object representing the Ed25519 Monero point.
@@ -70,13 +70,23 @@ class SLIP10Ed25519PublicKey(IPublicKey):
     @classmethod
     def from_point(cls, point: IPoint) -> IPublicKey:
         """
-        Calculate the length of the compressed public key.
+        Create an instance of the class from a point, checking it against the
+        coordinates already decoded on the point instead of decoding its bytes again.
 
-        :return: The length of the compressed public key in bytes.
-        :rtype: int
+        :param point: The Ed25519 point.
+        :type point: IPoint
+
+        :return: An instance of the class.
+        :rtype: IPublicKey
         """
 
-        return cls.from_bytes(point.raw_encoded())
+        if not point_is_on_curve((point.x(), point.y())):
+            raise ValueError("Invalid public key bytes")
+
+        try:
+            return cls(VerifyKey(point.raw_encoded()))
+        except (exceptions.RuntimeError, exceptions.ValueError) as ex:
+            raise ValueError("Invalid public key bytes") from ex
 
     @staticmethod
     def compressed_length() -> int:
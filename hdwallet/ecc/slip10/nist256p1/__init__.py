@@ -4,8 +4,7 @@
 # Distributed under the MIT software license, see the accompanying
 # file COPYING or https://opensource.org/license/mit
 
-from ecdsa.ecdsa import generator_256
-
+from ..precompute import NIST256P1_CURVE
 from ...iecc import IEllipticCurveCryptography
 from .point import SLIP10Nist256p1Point
 from .public_key import SLIP10Nist256p1PublicKey
@@ -15,8 +14,8 @@ from .private_key import SLIP10Nist256p1PrivateKey
 class SLIP10Nist256p1ECC(IEllipticCurveCryptography):
 
     NAME = "SLIP10-Nist256p1"
-    ORDER = generator_256.order()
-    GENERATOR = SLIP10Nist256p1Point(generator_256)
+    ORDER = NIST256P1_CURVE.order
+    GENERATOR = SLIP10Nist256p1Point(NIST256P1_CURVE.generator)
     POINT = SLIP10Nist256p1Point
     PUBLIC_KEY = SLIP10Nist256p1PublicKey
     PRIVATE_KEY = SLIP10Nist256p1PrivateKey
@@ -4,7 +4,9 @@
 # Distributed under the MIT software license, see the accompanying
 # file COPYING or https://opensource.org/license/mit
 
-from typing import Any
+from typing import (
+    Any, List, Sequence
+)
 from ecdsa.ecdsa import curve_256
 from ecdsa.ellipticcurve import (
     Point, PointJacobi
@@ -12,6 +14,7 @@ from ecdsa.ellipticcurve import (
 from ecdsa import keys
 
 from ....const import SLIP10_SECP256K1_CONST
+from ..precompute import normalize_points
 from ...iecc import IPoint
 from ....utils import (
     bytes_to_integer, integer_to_bytes
@@ -90,6 +93,22 @@ class SLIP10Nist256p1Point(IPoint):
             )
         )
 
+    @classmethod
+    def normalize(cls, points: Sequence[IPoint]) -> List[IPoint]:
+        """
+        Scale the Jacobian coordinates of many points to affine with a single inversion.
+
+        :param points: The points to normalize.
+        :type points: Sequence[IPoint]
+
+        :return: The normalized points, as new point objects.
+        :rtype: List[IPoint]
+        """
+
+        return [
+            cls(point) for point in normalize_points([point.underlying_object() for point in points])
+        ]
+
     def underlying_object(self) -> Any:
         """
         Retrieve the underlying elliptic curve point object.
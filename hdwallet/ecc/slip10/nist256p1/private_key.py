@@ -6,11 +6,10 @@
 
 from typing import Any
 from ecdsa import SigningKey
-from ecdsa import (
-    curves, keys
-)
+from ecdsa import keys
 
 from ....const import SLIP10_SECP256K1_CONST
+from ..precompute import NIST256P1_CURVE
 from ...iecc import (
     IPublicKey, IPrivateKey
 )
@@ -57,7 +56,7 @@ class SLIP10Nist256p1PrivateKey(IPrivateKey):
         try:
             return cls(
                 SigningKey.from_string(
-                    private_key, curve=curves.NIST256p
+                    private_key, curve=NIST256P1_CURVE
                 )
             )
         except keys.MalformedPointError as ex:
@@ -0,0 +1,370 @@
+#!/usr/bin/env python3
+
+# Copyright © 2020-2024, Meheret Tesfaye Batu <meherett.batu@gmail.com>
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or https://opensource.org/license/mit
+
+from typing import (
+    Any, Optional, List, Sequence, Tuple
+)
+from ecdsa.curves import (
+    Curve, NIST256p, SECP256k1
+)
+from ecdsa.ellipticcurve import (
+    PointJacobi, INFINITY
+)
+
+import os
+
+from ...exceptions import ECCError
+
+WINDOW_BITS: int = 8
+
+
+def normalize_coordinates(points: Sequence[Tuple[int, int, int]], p: int) -> List[Tuple[int, int]]:
+    """
+    Convert Jacobian coordinates to affine ones with a single modular inversion,
+    using Montgomery's simultaneous inversion trick.
+
+    :param points: The non-infinity points in Jacobian coordinates.
+    :type points: Sequence[Tuple[int, int, int]]
+    :param p: The field prime.
+    :type p: int
+
+    :return: The affine coordinates.
+    :rtype: List[Tuple[int, int]]
+    """
+
+    products, accumulator = [], 1
+    for _, _, Z in points:
+        products.append(accumulator)
+        accumulator = accumulator * Z % p
+    accumulator = pow(accumulator, p - 2, p)
+    normalized: List[Tuple[int, int]] = [None] * len(points)
+    for index in range(len(points) - 1, -1, -1):
+        X, Y, Z = points[index]
+        inverse = accumulator * products[index] % p
+        accumulator = accumulator * Z % p
+        inverse_2 = inverse * inverse % p
+        normalized[index] = (X * inverse_2 % p, Y * inverse_2 * inverse % p)
+    return normalized
+
+
+def jacobian_double(X: int, Y: int, Z: int, p: int, a: int) -> Tuple[int, int, int]:
+    """
+    Double a point in Jacobian coordinates.
+
+    :return: The doubled point, ``(0, 0, 0)`` for infinity.
+    :rtype: Tuple[int, int, int]
+    """
+
+    if not Y:
+        return 0, 0, 0
+    XX, YY, ZZ = X * X % p, Y * Y % p, Z * Z % p
+    S = 4 * X * YY % p
+    M = (3 * XX + a * ZZ * ZZ) % p
+    X3 = (M * M - 2 * S) % p
+    return X3, (M * (S - X3) - 8 * YY * YY) % p, 2 * Y * Z % p
+
+
+def jacobian_add_affine(X: int, Y: int, Z: int, x: int, y: int, p: int, a: int) -> Tuple[int, int, int]:
+    """
+    Add an affine point to a point in Jacobian coordinates.
+
+    :return: The sum, ``(0, 0, 0)`` for infinity.
+    :rtype: Tuple[int, int, int]
+    """
+
+    if not Z:
+        return x, y, 1
+    ZZ = Z * Z % p
+    H = (x * ZZ - X) % p
+    R = (y * ZZ * Z - Y) % p
+    if not H:
+        return jacobian_double(X, Y, Z, p, a) if not R else (0, 0, 0)
+    HH = H * H % p
+    HHH = H * HH % p
+    V = X * HH % p
+    X3 = (R * R - HHH - 2 * V) % p
+    return X3, (R * (V - X3) - Y * HHH) % p, Z * H % p
+
+
+class JacobianPoint(PointJacobi):
+    """
+    ecdsa Jacobian point that keeps its own copy of the coordinates it was built
+    from, so that batches of them can be brought to affine form together through
+    :func:`normalize_points` without reaching into ecdsa's private state.
+    """
+
+    def __init__(self, curve: Any, x: int, y: int, z: int, order: Optional[int] = None) -> None:
+        """
+        Initialize the point.
+
+        :param curve: The ecdsa curve the point is on.
+        :type curve: Any
+        :param x: The Jacobian x-coordinate.
+        :type x: int
+        :param y: The Jacobian y-coordinate.
+        :type y: int
+        :param z: The Jacobian z-coordinate.
+        :type z: int
+        :param order: The order of the point.
+        :type order: Optional[int]
+
+        :return: No return
+        :rtype: NoneType
+        """
+
+        super(JacobianPoint, self).__init__(curve, x, y, z, order)
+        self.jacobian: Tuple[int, int, int] = (x, y, z)
+
+    def __add__(self, other: Any) -> PointJacobi:
+        """
+        Add a point, keeping the sum a :class:`JacobianPoint`.
+
+        :param other: The point to add.
+        :type other: Any
+
+        :return: The sum.
+        :rtype: PointJacobi
+        """
+
+        if not isinstance(other, PointJacobi) or other.curve() != self.curve() or other == INFINITY:
+            return super(JacobianPoint, self).__add__(other)
+        affine = other.to_affine()
+        curve = self.curve()
+        X, Y, Z = jacobian_add_affine(
+            *self.jacobian, affine.x(), affine.y(), curve.p(), curve.a()
+        )
+        if not Z:
+            return INFINITY
+        return JacobianPoint(curve, X, Y, Z, self.order())
+
+    def __radd__(self, other: Any) -> PointJacobi:
+        return self + other
+
+
+def normalize_points(points: Sequence[PointJacobi]) -> List[PointJacobi]:
+    """
+    Bring ecdsa points to ``z == 1`` with a single modular inversion, the batched
+    equivalent of ``PointJacobi.scale()``. The given points are left untouched,
+    every :class:`JacobianPoint` that needs scaling is replaced by a new point.
+
+    :param points: The points to normalize.
+    :type points: Sequence[PointJacobi]
+
+    :return: The normalized points, in order.
+    :rtype: List[PointJacobi]
+    """
+
+    normalized: List[PointJacobi] = list(points)
+    pending: List[int] = [
+        index for index, point in enumerate(normalized) if isinstance(point, JacobianPoint) and
+        point.jacobian[2] != 1 and point.jacobian[2] % point.curve().p()
+    ]
+    if not pending:
+        return normalized
+    for index, (x, y) in zip(pending, normalize_coordinates(
+        [normalized[index].jacobian for index in pending], normalized[pending[0]].curve().p()
+    )):
+        normalized[index] = JacobianPoint(
+            normalized[index].curve(), x, y, 1, normalized[index].order()
+        )
+    return normalized
+
+
+class FixedBaseGenerator(PointJacobi):
+    """
+    Generator point that multiplies through a fixed-base window table.
+
+    The scalar is split into ``WINDOW_BITS`` wide windows and the table holds
+    ``d * 2^(w * i) * G`` in affine coordinates for every window ``i`` and digit
+    ``d``, so a multiplication costs one mixed addition per non-zero window and
+    no doublings. The table is built lazily on the first multiplication, once
+    per process, and can be saved to and loaded from disk.
+
+    Like ecdsa's own point multiplication it is variable-time, the work done
+    depends on the scalar. Signature verification is left to the ecdsa generator
+    it was built from, which keeps its own precomputed table for it.
+    """
+
+    def __init__(self, generator: PointJacobi, window: int = WINDOW_BITS) -> None:
+        """
+        Initialize the generator from an existing ecdsa generator point.
+
+        :param generator: The generator point to copy.
+        :type generator: PointJacobi
+        :param window: The window width in bits.
+        :type window: int
+
+        :return: No return
+        :rtype: NoneType
+        """
+
+        super(FixedBaseGenerator, self).__init__(
+            generator.curve(), generator.x(), generator.y(), 1, generator.order()
+        )
+        self.generator: PointJacobi = generator
+        self.window: int = window
+        self.windows: int = -(-generator.order().bit_length() // window)
+        self.p: int = generator.curve().p()
+        self.a: int = generator.curve().a()
+        self.size: int = (self.p.bit_length() + 7) // 8
+        self.table: Optional[List[List[Tuple[int, int]]]] = None
+
+    def add_affine(self, X: int, Y: int, Z: int, x: int, y: int) -> Tuple[int, int, int]:
+        """
+        Add an affine point to a point in Jacobian coordinates on this curve.
+
+        :return: The sum, ``(0, 0, 0)`` for infinity.
+        :rtype: Tuple[int, int, int]
+        """
+
+        return jacobian_add_affine(X, Y, Z, x, y, self.p, self.a)
+
+    def build(self) -> List[List[Tuple[int, int]]]:
+        """
+        Build the window table, one batch inversion per window.
+
+        :return: The window table in affine coordinates.
+        :rtype: List[List[Tuple[int, int]]]
+        """
+
+        table: List[List[Tuple[int, int]]] = []
+        x, y = self.x(), self.y()
+        for _ in range(self.windows):
+            points: List[Tuple[int, int, int]] = [(x, y, 1)]
+            for _ in range((1 << self.window) - 1):
+                points.append(self.add_affine(*points[-1], x, y))
+            normalized: List[Tuple[int, int]] = normalize_coordinates(points, self.p)
+            table.append(normalized[:-1])
+            x, y = normalized[-1]
+        return table
+
+    def precompute(self) -> List[List[Tuple[int, int]]]:
+        """
+        Get the window table, building it on first use.
+
+        :return: The window table in affine coordinates.
+        :rtype: List[List[Tuple[int, int]]]
+        """
+
+        if self.table is None:
+            self.table = self.build()
+        return self.table
+
+    def save(self, path: str) -> None:
+        """
+        Write the window table to disk as fixed-width big-endian coordinates.
+
+        :param path: The file path to write.
+        :type path: str
+
+        :return: No return
+        :rtype: NoneType
+        """
+
+        temporary: str = f"{path}.{os.getpid()}.tmp"
+        with open(temporary, "wb") as file:
+            file.write(b"".join(
+                x.to_bytes(self.size, "big") + y.to_bytes(self.size, "big")
+                for window in self.precompute() for x, y in window
+            ))
+        os.replace(temporary, path)
+
+    def load(self, path: str) -> "FixedBaseGenerator":
+        """
+        Read a window table written by :meth:`save`.
+
+        :param path: The file path to read.
+        :type path: str
+
+        :return: The generator itself.
+        :rtype: FixedBaseGenerator
+        """
+
+        with open(path, "rb") as file:
+            data: bytes = file.read()
+        entries: int = (1 << self.window) - 1
+        length: int = self.windows * entries * 2 * self.size
+        if len(data) != length:
+            raise ECCError("Invalid precomputed table length", expected=length, got=len(data))
+        view, size, table = memoryview(data), self.size, []
+        for window in range(self.windows):
+            offset: int = window * entries * 2 * size
+            table.append([
+                (
+                    int.from_bytes(view[index:index + size], "big"),
+                    int.from_bytes(view[index + size:index + 2 * size], "big")
+                ) for index in range(offset, offset + entries * 2 * size, 2 * size)
+            ])
+        if table[0][0] != (self.x(), self.y()):
+            raise ECCError("Precomputed table does not belong to this generator")
+        self.table = table
+        return self
+
+    def __mul__(self, other: int) -> PointJacobi:
+        """
+        Multiply the generator by a scalar using the window table.
+
+        :param other: The scalar.
+        :type other: int
+
+        :return: The resulting point.
+        :rtype: PointJacobi
+        """
+
+        scalar: int = other % self.order()
+        X, Y, Z, mask = 0, 0, 0, (1 << self.window) - 1
+        for window in self.precompute():
+            if not scalar:
+                break
+            digit = scalar & mask
+            if digit:
+                X, Y, Z = self.add_affine(X, Y, Z, *window[digit - 1])
+            scalar >>= self.window
+        if not Z:
+            return INFINITY
+        return JacobianPoint(self.curve(), X, Y, Z, self.order())
+
+    def __rmul__(self, other: int) -> PointJacobi:
+        return self * other
+
+    def mul_add(self, self_mul: int, other: PointJacobi, other_mul: int) -> PointJacobi:
+        """
+        Compute ``self * self_mul + other * other_mul``, as used by signature
+        verification, on the ecdsa generator this one was built from.
+
+        :param self_mul: The generator scalar.
+        :type self_mul: int
+        :param other: The other point.
+        :type other: PointJacobi
+        :param other_mul: The other point scalar.
+        :type other_mul: int
+
+        :return: The resulting point.
+        :rtype: PointJacobi
+        """
+
+        return self.generator.mul_add(self_mul, other, other_mul)
+
+
+def fixed_base_curve(curve: Curve) -> Curve:
+    """
+    Copy an ecdsa curve with its generator replaced by a :class:`FixedBaseGenerator`,
+    so signing keys built on it derive their public points through the window table.
+
+    :param curve: The ecdsa curve.
+    :type curve: Curve
+
+    :return: The curve using the fixed-base generator.
+    :rtype: Curve
+    """
+
+    return Curve(
+        curve.name, curve.curve, FixedBaseGenerator(curve.generator), curve.oid, curve.openssl_name
+    )
+
+
+NIST256P1_CURVE: Curve = fixed_base_curve(NIST256p)
+SECP256K1_CURVE: Curve = fixed_base_curve(SECP256k1)
@@ -4,10 +4,13 @@
 # Distributed under the MIT software license, see the accompanying
 # file COPYING or https://opensource.org/license/mit
 
-from ecdsa.ecdsa import generator_secp256k1
+from typing import Union
 
 from ....const import SLIP10_SECP256K1_CONST
-from ...iecc import IEllipticCurveCryptography
+from ..precompute import SECP256K1_CURVE
+from ...iecc import (
+    IEllipticCurveCryptography, IPublicKey
+)
 from .point import (
     SLIP10Secp256k1Point, SLIP10Secp256k1PointCoincurve, SLIP10Secp256k1PointECDSA
 )
@@ -31,12 +34,34 @@ class SLIP10Secp256k1ECCCoincurve(IEllipticCurveCryptography):
     PUBLIC_KEY = SLIP10Secp256k1PublicKeyCoincurve
     PRIVATE_KEY = SLIP10Secp256k1PrivateKeyCoincurve
 
+    @classmethod
+    def public_key_tweak_add(cls, public_key: IPublicKey, tweak: Union[bytes, int]) -> IPublicKey:
+        """
+        Add the generator point multiplied by a tweak to a public key, using libsecp256k1's tweak-add.
+
+        :param public_key: The public key to tweak.
+        :type public_key: IPublicKey
+        :param tweak: The tweak scalar, as big-endian bytes or an integer.
+        :type tweak: Union[bytes, int]
+
+        :return: The tweaked public key.
+        :rtype: IPublicKey
+        """
+
+        if isinstance(tweak, int):
+            tweak = tweak.to_bytes(32, "big")
+        if not isinstance(public_key, cls.PUBLIC_KEY):
+            public_key = cls.PUBLIC_KEY.from_bytes(public_key.raw_compressed())
+        return cls.PUBLIC_KEY(
+            public_key.underlying_object().add(tweak)
+        )
+
 
 class SLIP10Secp256k1ECCECDSA(IEllipticCurveCryptography):
 
     NAME = "SLIP10-Secp256k1"
-    ORDER = generator_secp256k1.order()
-    GENERATOR = SLIP10Secp256k1PointECDSA(generator_secp256k1)
+    ORDER = SECP256K1_CURVE.order
+    GENERATOR = SLIP10Secp256k1PointECDSA(SECP256K1_CURVE.generator)
     POINT = SLIP10Secp256k1PointECDSA
     PUBLIC_KEY = SLIP10Secp256k1PublicKeyECDSA
     PRIVATE_KEY = SLIP10Secp256k1PrivateKeyECDSA
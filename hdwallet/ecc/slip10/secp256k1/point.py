@@ -4,7 +4,9 @@
 # Distributed under the MIT software license, see the accompanying
 # file COPYING or https://opensource.org/license/mit
 
-from typing import Any
+from typing import (
+    Any, List, Sequence
+)
 from ecdsa.ecdsa import curve_secp256k1
 from ecdsa.ellipticcurve import (
     Point, PointJacobi
@@ -14,6 +16,7 @@ from ecdsa import keys
 import coincurve
 
 from ....const import SLIP10_SECP256K1_CONST
+from ..precompute import normalize_points
 from ...iecc import IPoint
 from ....utils import (
     bytes_to_integer, integer_to_bytes
@@ -275,6 +278,22 @@ class SLIP10Secp256k1PointECDSA(IPoint):
             )
         )
 
+    @classmethod
+    def normalize(cls, points: Sequence[IPoint]) -> List[IPoint]:
+        """
+        Scale the Jacobian coordinates of many points to affine with a single inversion.
+
+        :param points: The points to normalize.
+        :type points: Sequence[IPoint]
+
+        :return: The normalized points, as new point objects.
+        :rtype: List[IPoint]
+        """
+
+        return [
+            cls(point) for point in normalize_points([point.underlying_object() for point in points])
+        ]
+
     def underlying_object(self) -> Any:
         """
         Returns the underlying point object.
@@ -2,13 +2,12 @@
 
 from typing import Any
 from ecdsa import SigningKey
-from ecdsa import (
-    curves, keys
-)
+from ecdsa import keys
 
 import coincurve
 
 from ....const import SLIP10_SECP256K1_CONST
+from ..precompute import SECP256K1_CURVE
 from ...iecc import (
     IPublicKey, IPrivateKey
 )
@@ -144,7 +143,7 @@ class SLIP10Secp256k1PrivateKeyECDSA(IPrivateKey):
         try:
             return cls(
                 SigningKey.from_string(
-                    key_bytes, curve=curves.SECP256k1
+                    key_bytes, curve=SECP256K1_CURVE
                 )
             )
         except keys.MalformedPointError as ex:
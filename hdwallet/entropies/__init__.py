@@ -109,7 +109,7 @@ class ENTROPIES:
         :rtype: bool
         """
 
-        return name in cls.names()
+        return name in cls.dictionary
 
 
 __all__: List[str] = [
@@ -9,7 +9,9 @@ from typing import (
 )
 
 from ..exceptions import HDError
-from .bip32 import BIP32HD
+from .bip32 import (
+    BIP32HD, BIP32Child, BIP32NodeCache
+)
 from .bip44 import BIP44HD
 from .bip49 import BIP49HD
 from .bip84 import BIP84HD
@@ -19,7 +21,9 @@ from .cardano import CardanoHD
 from .electrum import (
     ElectrumV1HD, ElectrumV2HD
 )
-from .monero import MoneroHD
+from .monero import (
+    MoneroHD, MoneroSubAddressTable
+)
 from .ihd import IHD
 
 
@@ -123,11 +127,11 @@ class HDS:
         :return: True if the name corresponds to an HD class, False otherwise.
         :rtype: bool
         """
-        return name in cls.names()
+        return name in cls.dictionary
 
 
 __all__: List[str] = [
-    "IHD", "HDS"
+    "IHD", "HDS", "BIP32Child", "BIP32NodeCache", "MoneroSubAddressTable"
 ] + [
     cls.__name__ for cls in HDS.classes()
 ]
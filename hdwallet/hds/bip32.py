@@ -5,16 +5,18 @@
 # file COPYING or https://opensource.org/license/mit
 
 from typing import (
-    Optional, Union, List, Type
+    Optional, Union, List, Tuple, Type, Iterator, NamedTuple
 )
-from hashlib import sha256
+from collections import OrderedDict
+from threading import Lock
 
 import hmac
+import copy
 import hashlib
 import struct
 
-from ..libs.ripemd160 import ripemd160
 from ..libs.base58 import check_decode
+from ..libs.ed25519 import point_is_identity
 from ..ecc import (
     IPoint, IPublicKey, IPrivateKey, IEllipticCurveCryptography, KholawEd25519PrivateKey
 )
@@ -29,9 +31,11 @@ from ..const import (
     PUBLIC_KEY_TYPES, WIF_TYPES
 )
 from ..cryptocurrencies import Bitcoin
-from ..crypto import hmac_sha512
+from ..crypto import (
+    hmac_sha512, hmac_sha512_context, hmac_sha512_digest, hash160
+)
 from ..wif import (
-    private_key_to_wif, wif_to_private_key, get_wif_type
+    private_key_to_wif, wif_to_private_key_bytes, get_wif_type
 )
 from ..keys import (
     serialize, deserialize, is_root_key
@@ -40,11 +44,144 @@ from ..exceptions import (
     Error, AddressError, DerivationError, ExtendedKeyError, PublicKeyError, PrivateKeyError, SeedError
 )
 from ..utils import (
-    get_bytes, get_hmac, bytes_to_integer, integer_to_bytes, bytes_to_string, reset_bits, set_bits
+    get_bytes, get_hmac, bytes_to_integer, integer_to_bytes, bytes_to_string, reset_bits, set_bits, path_to_indexes
 )
 from .ihd import IHD
 
 
+class BIP32Child(NamedTuple):
+    """
+    Compact record of a child key returned by :meth:`BIP32HD.derive_range`.
+    """
+
+    index: int
+    public_key: bytes
+    private_key: Optional[bytes]
+    chain_code: bytes
+
+
+class BIP32NodeCache:
+    """
+    Bounded least-recently-used cache of derived BIP32 nodes.
+
+    Each node holds the private key, chain code, public key, parent fingerprint, fingerprint,
+    depth and index reached by driving a path prefix from a root key. Entries are keyed by
+    the root key, root chain code and path prefix, so one cache can be shared by several
+    HD instances of the same type and different roots never see each other's nodes.
+    """
+
+    _maxsize: int
+    _nodes: "OrderedDict[tuple, tuple]"
+    _hits: int = 0
+    _misses: int = 0
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        """
+        Initializes a new instance of the BIP32NodeCache class.
+
+        :param maxsize: The maximum number of nodes to keep. Defaults to 1024.
+        :type maxsize: int
+
+        :return: None
+        """
+
+        if not isinstance(maxsize, int) or maxsize < 1:
+            raise Error("Invalid node cache size", expected="> 0", got=maxsize)
+
+        self._maxsize = maxsize
+        self._nodes = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: tuple) -> Optional[tuple]:
+        """
+        Retrieves a cached node and marks it as most recently used.
+
+        :param key: The node key.
+        :type key: tuple
+
+        :return: The cached node, or None if the key is not cached.
+        :rtype: Optional[tuple]
+        """
+
+        with self._lock:
+            node: Optional[tuple] = self._nodes.get(key)
+            if node is None:
+                self._misses += 1
+                return None
+            self._nodes.move_to_end(key)
+            self._hits += 1
+            return node
+
+    def put(self, key: tuple, node: tuple) -> None:
+        """
+        Stores a node, evicting the least recently used one when the cache is full.
+
+        :param key: The node key.
+        :type key: tuple
+        :param node: The node to cache.
+        :type node: tuple
+
+        :return: None
+        """
+
+        with self._lock:
+            self._nodes[key] = node
+            self._nodes.move_to_end(key)
+            if len(self._nodes) > self._maxsize:
+                self._nodes.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Removes every cached node and resets the hit and miss counters.
+
+        :return: None
+        """
+
+        with self._lock:
+            self._nodes.clear()
+            self._hits, self._misses = 0, 0
+
+    def hits(self) -> int:
+        """
+        Get the number of lookups served from the cache.
+
+        :return: The number of cache hits.
+        :rtype: int
+        """
+
+        return self._hits
+
+    def misses(self) -> int:
+        """
+        Get the number of lookups that had to derive the node.
+
+        :return: The number of cache misses.
+        :rtype: int
+        """
+
+        return self._misses
+
+    def maxsize(self) -> int:
+        """
+        Get the maximum number of cached nodes.
+
+        :return: The maximum cache size.
+        :rtype: int
+        """
+
+        return self._maxsize
+
+    def size(self) -> int:
+        """
+        Get the current number of cached nodes.
+
+        :return: The current cache size.
+        :rtype: int
+        """
+
+        return len(self._nodes)
+
+
 class BIP32HD(IHD):
 
     _ecc: IEllipticCurveCryptography
@@ -66,7 +203,10 @@ class BIP32HD(IHD):
     _root_index: int = 0
     _depth: int = 0
     _index: int = 0
-    
+    _nodes: List[tuple]
+    _node_depth: Optional[int] = None
+    _node_cache: Optional[BIP32NodeCache] = None
+
     def __init__(
         self, ecc: Type[IEllipticCurveCryptography], public_key_type: str = PUBLIC_KEY_TYPES.COMPRESSED, **kwargs
     ) -> None:
@@ -79,6 +219,8 @@ class BIP32HD(IHD):
                                 `PUBLIC_KEY_TYPES.UNCOMPRESSED`. Defaults to `PUBLIC_KEY_TYPES.COMPRESSED`.
         :type public_key_type: str
         :param kwargs: Additional keyword arguments for custom derivation paths and indexes.
+            - node_cache: Optional :class:`BIP32NodeCache` (or its maximum size) used to share
+              derived intermediate nodes between derivations on the same root.
         :type kwargs: dict
 
         :return: None
@@ -101,6 +243,16 @@ class BIP32HD(IHD):
         self._derivation = CustomDerivation(
             path=kwargs.get("path", None), indexes=kwargs.get("indexes", None)
         )
+        self._nodes = []
+
+        node_cache: Optional[Union[BIP32NodeCache, int]] = kwargs.get("node_cache", None)
+        if isinstance(node_cache, int) and not isinstance(node_cache, bool):
+            node_cache = BIP32NodeCache(maxsize=node_cache)
+        elif node_cache is not None and not isinstance(node_cache, BIP32NodeCache):
+            raise Error(
+                "Invalid node cache instance", expected=[BIP32NodeCache, int], got=type(node_cache)
+            )
+        self._node_cache = node_cache
 
     @classmethod
     def name(cls) -> str:
@@ -123,6 +275,82 @@ class BIP32HD(IHD):
         self.from_derivation(derivation=self._derivation)
         return self
 
+    def __drive__(self, index: int) -> Optional["BIP32HD"]:
+        """
+        Drives the BIP32HD instance one level down, reusing the node already derived
+        at the same depth and index from the root since the last `clean_derivation()`.
+
+        Only the changing suffix of a derivation path is derived again, so walking
+        sibling paths like `m/44'/0'/0'/0/0-1000` costs one child derivation per path.
+        When a node cache is set, nodes off the current path are looked up there first.
+
+        :param index: The index to derive the child key.
+        :type index: int
+
+        :return: The updated BIP32HD instance with the derived child key, or None if the derivation fails.
+        :rtype: Optional[BIP32HD]
+        """
+
+        if self._node_depth is None:
+            return self.drive(index)
+
+        if self._node_depth < len(self._nodes) and self._nodes[self._node_depth][0] == index:
+            (
+                _, self._private_key, self._chain_code, self._public_key,
+                self._parent_fingerprint, self._fingerprint, self._depth, self._index
+            ) = self._nodes[self._node_depth]
+            self._node_depth += 1
+            return self
+
+        del self._nodes[self._node_depth:]
+
+        node_key: Optional[tuple] = None
+        if self._node_cache is not None:
+            # Fingerprints are computed from public_key_bytes(), so nodes cached for one
+            # public key type are not valid for the other
+            node_key = (
+                self.name(),
+                self._ecc.NAME,
+                self._public_key_type,
+                (
+                    self._root_private_key.raw() if self._root_private_key else self._root_public_key.raw_compressed()
+                ),
+                self._root_chain_code,
+                tuple(node[0] for node in self._nodes) + (index,)
+            )
+            node: Optional[tuple] = self._node_cache.get(node_key)
+            if node is not None:
+                (
+                    _, self._private_key, self._chain_code, self._public_key,
+                    self._parent_fingerprint, self._fingerprint, self._depth, self._index
+                ) = node
+                self._nodes.append(node)
+                self._node_depth += 1
+                return self
+
+        node_depth: int = self._node_depth
+        if self.drive(index) is None:
+            return None
+        node: tuple = (
+            index, self._private_key, self._chain_code, self._public_key,
+            self._parent_fingerprint, self._fingerprint, self._depth, self._index
+        )
+        self._nodes.append(node)
+        if node_key is not None:
+            self._node_cache.put(node_key, node)
+        self._node_depth = node_depth + 1
+        return self
+
+    def node_cache(self) -> Optional[BIP32NodeCache]:
+        """
+        Retrieves the node cache shared by the derivations of this BIP32HD instance.
+
+        :return: The node cache, or None if caching is disabled.
+        :rtype: Optional[BIP32NodeCache]
+        """
+
+        return self._node_cache
+
     def from_seed(self, seed: Union[bytes, str, ISeed], **kwargs) -> "BIP32HD":
         """
         Initializes the BIP32HD instance from the given seed.
@@ -207,6 +435,7 @@ class BIP32HD(IHD):
         self._root_public_key = self._root_private_key.public_key()
         self._public_key = self._root_public_key
         self._strict = True
+        self._nodes, self._node_depth = [], None
         self.__update__()
         return self
 
@@ -250,6 +479,7 @@ class BIP32HD(IHD):
         self._strict = is_root_key(
             key=xprivate_key, encoded=encoded
         )
+        self._nodes, self._node_depth = [], None
         self.__update__()
         return self
 
@@ -292,6 +522,7 @@ class BIP32HD(IHD):
         self._strict = is_root_key(
             key=xpublic_key, encoded=encoded
         )
+        self._nodes, self._node_depth = [], None
         self.__update__()
         return self
 
@@ -312,7 +543,7 @@ class BIP32HD(IHD):
         else:
             self._public_key_type: str = PUBLIC_KEY_TYPES.UNCOMPRESSED
             self._wif_type: str = WIF_TYPES.WIF
-        self.from_private_key(private_key=wif_to_private_key(wif=wif))
+        self.from_private_key(private_key=wif_to_private_key_bytes(wif=wif))
         self._strict = None
         return self
 
@@ -331,6 +562,7 @@ class BIP32HD(IHD):
             self._private_key = self._ecc.PRIVATE_KEY.from_bytes(get_bytes(private_key))
             self._public_key = self._private_key.public_key()
             self._strict = None
+            self._node_depth = None
             return self
         except ValueError as error:
             raise PrivateKeyError("Invalid private key data")
@@ -349,6 +581,7 @@ class BIP32HD(IHD):
         try:
             self._public_key = self._ecc.PUBLIC_KEY.from_bytes(get_bytes(public_key))
             self._strict = None
+            self._node_depth = None
             return self
         except ValueError as error:
             raise PublicKeyError("Invalid public key data")
@@ -370,7 +603,7 @@ class BIP32HD(IHD):
 
         self._derivation = derivation
         for index in self._derivation.indexes():
-            self.drive(index)
+            self.__drive__(index)
         return self
 
     def update_derivation(self, derivation: IDerivation) -> "BIP32HD":
@@ -405,15 +638,15 @@ class BIP32HD(IHD):
             self._private_key, self._chain_code, self._parent_fingerprint = (
                 self._root_private_key, self._root_chain_code, (integer_to_bytes(0x00) * 4)
             )
-            self._public_key = self._private_key.public_key()
+            self._public_key = self._root_public_key
             self._derivation.clean()
-            self._depth = 0
+            self._depth, self._node_depth = 0, 0
         elif self._root_public_key:
             self._public_key, self._chain_code, self._parent_fingerprint = (
                 self._root_public_key, self._root_chain_code, (integer_to_bytes(0x00) * 4)
             )
             self._derivation.clean()
-            self._depth = 0
+            self._depth, self._node_depth = 0, 0
         return self
 
     def drive(self, index: int) -> Optional["BIP32HD"]:
@@ -427,6 +660,8 @@ class BIP32HD(IHD):
         :rtype: Optional[BIP32HD]
         """
 
+        # Moving off the tracked nodes, stop reusing them until the next `clean_derivation()`
+        self._node_depth = None
         hmac_half_length: int = hashlib.sha512().digest_size // 2
 
         if self._ecc.NAME == "Kholaw-Ed25519":
@@ -493,11 +728,11 @@ class BIP32HD(IHD):
                         kl_bytes + kr_bytes
                     ),
                     _hmacr,
-                    get_bytes(self.fingerprint())
+                    self.fingerprint_bytes()
                 )
                 self._public_key = self._private_key.public_key()
                 self._depth, self._index, self._fingerprint = (
-                    (self._depth + 1), index, get_bytes(self.fingerprint())
+                    (self._depth + 1), index, self.fingerprint_bytes()
                 )
             else:
                 if index & 0x80000000:
@@ -521,17 +756,17 @@ class BIP32HD(IHD):
                 new_public_key_point: IPoint = new_public_key_point(
                     public_key=self._public_key, zl=z_hmacl, ecc=self._ecc
                 )
-                if new_public_key_point.x() == 0 and new_public_key_point.y() == 1:
+                if point_is_identity(new_public_key_point.raw_encoded()):
                     raise Error("Computed public child key is not valid, very unlucky index")
                 new_public_key: IPublicKey = self._ecc.PUBLIC_KEY.from_point(
                     new_public_key_point
                 )
-                self._parent_fingerprint = get_bytes(self.fingerprint())
+                self._parent_fingerprint = self.fingerprint_bytes()
                 self._chain_code, self._public_key = (
                     _hmacr, new_public_key
                 )
                 self._depth, self._index, self._fingerprint = (
-                    (self._depth + 1), index, get_bytes(self.fingerprint())
+                    (self._depth + 1), index, self.fingerprint_bytes()
                 )
 
             return self
@@ -549,23 +784,17 @@ class BIP32HD(IHD):
                 integer_to_bytes(0x00) + self._private_key.raw() + index_bytes
             )
 
-            _hmac: bytes = (
-                hmac.digest(
-                    self._chain_code, data_bytes, "sha512"
-                ) if hasattr(hmac, "digest") else hmac.new(
-                    self._chain_code, data_bytes, hashlib.sha512
-                ).digest()
-            )
+            _hmac: bytes = hmac_sha512(self._chain_code, data_bytes)
             _hmacl, _hmacr = _hmac[:hmac_half_length], _hmac[hmac_half_length:]
 
             new_private_key: IPrivateKey = self._ecc.PRIVATE_KEY.from_bytes(_hmacl)
 
-            self._parent_fingerprint = get_bytes(self.fingerprint())
+            self._parent_fingerprint = self.fingerprint_bytes()
             self._private_key, self._chain_code, self._public_key = (
                 new_private_key, _hmacr, new_private_key.public_key()
             )
             self._depth, self._index, self._fingerprint = (
-                (self._depth + 1), index, get_bytes(self.fingerprint())
+                (self._depth + 1), index, self.fingerprint_bytes()
             )
 
         elif self._ecc.NAME in [
@@ -588,13 +817,7 @@ class BIP32HD(IHD):
                     self._public_key.raw_compressed() + index_bytes
                 )
 
-            _hmac: bytes = (
-                hmac.digest(
-                    self._chain_code, data_bytes, "sha512"
-                ) if hasattr(hmac, "digest") else hmac.new(
-                    self._chain_code, data_bytes, hashlib.sha512
-                ).digest()
-            )
+            _hmac: bytes = hmac_sha512(self._chain_code, data_bytes)
             _hmacl, _hmacr = _hmac[:hmac_half_length], _hmac[hmac_half_length:]
 
             _hmacl_int: int = bytes_to_integer(_hmacl)
@@ -611,30 +834,166 @@ class BIP32HD(IHD):
                     integer_to_bytes(0x00) * 32 + integer_to_bytes(key_int)
                 )[-32:])
 
-                self._parent_fingerprint = get_bytes(self.fingerprint())
+                self._parent_fingerprint = self.fingerprint_bytes()
                 self._private_key, self._chain_code, self._public_key = (
                     new_private_key, _hmacr, new_private_key.public_key()
                 )
                 self._depth, self._index, self._fingerprint = (
-                    (self._depth + 1), index, get_bytes(self.fingerprint())
+                    (self._depth + 1), index, self.fingerprint_bytes()
                 )
             else:
-                new_public_key_point: IPoint = (
-                    self._public_key.point() + (self._ecc.GENERATOR * bytes_to_integer(_hmacl))
-                )
-                new_public_key: IPublicKey = self._ecc.PUBLIC_KEY.from_point(
-                    new_public_key_point
+                new_public_key: IPublicKey = self._ecc.public_key_tweak_add(
+                    public_key=self._public_key, tweak=_hmacl
                 )
 
-                self._parent_fingerprint = get_bytes(self.fingerprint())
+                self._parent_fingerprint = self.fingerprint_bytes()
                 self._chain_code, self._public_key = (
                     _hmacr, new_public_key
                 )
                 self._depth, self._index, self._fingerprint = (
-                    (self._depth + 1), index, get_bytes(self.fingerprint())
+                    (self._depth + 1), index, self.fingerprint_bytes()
                 )
         return self
 
+    def derive_range(
+        self, parent_path: Optional[Union[str, IDerivation]], start: int, stop: int, hardened: bool = False
+    ) -> Iterator[BIP32Child]:
+        """
+        Derives the children `start` up to (but not including) `stop` of one parent node.
+
+        The parent is derived once from the root (or taken from the current node when
+        `parent_path` is None) and the instance state is left untouched. Children are
+        yielded as :class:`BIP32Child` records holding raw bytes, skipping the hex,
+        fingerprint and depth bookkeeping done by :meth:`drive`. On SLIP10-Secp256k1 and
+        SLIP10-Nist256p1 the parent's compressed public key and HMAC key are reused for
+        every child, and children with an invalid index are skipped as in :meth:`drive`.
+        On the pure-Python ecdsa backends the child public keys are serialized in batches
+        of 256, sharing one field inversion per batch.
+
+        :param parent_path: The parent derivation path like `m/84'/0'/0'/0`, an `IDerivation`, or None.
+        :type parent_path: Optional[Union[str, IDerivation]]
+        :param start: The first child index.
+        :type start: int
+        :param stop: The child index to stop before.
+        :type stop: int
+        :param hardened: Whether to derive hardened children. Defaults to False.
+        :type hardened: bool
+
+        :return: An iterator of child records in index order.
+        :rtype: Iterator[BIP32Child]
+        """
+
+        if start < 0 or stop > 0x80000000 or start > stop:
+            raise DerivationError(
+                "Invalid derivation index range", expected=f"0 <= start <= stop <= {0x80000000}", got=f"{start}-{stop}"
+            )
+
+        parent: BIP32HD = copy.copy(self)
+        parent._nodes = list(self._nodes)
+        if parent_path is not None:
+            indexes: List[int] = (
+                parent_path.indexes() if isinstance(parent_path, IDerivation) else path_to_indexes(parent_path)
+            )
+            parent._derivation = CustomDerivation()
+            parent.clean_derivation()
+            for index in indexes:
+                parent.__drive__(index)
+
+        if not parent._chain_code:
+            raise DerivationError("You can't drive xprivate_key and private_key")
+        if hardened and not parent._private_key:
+            raise DerivationError("Hardened derivation path is invalid for xpublic key")
+
+        offset: int = 0x80000000 if hardened else 0x00
+
+        def drive_children() -> Iterator[BIP32Child]:
+            node: tuple = (
+                parent._private_key, parent._chain_code, parent._public_key,
+                parent._parent_fingerprint, parent._fingerprint, parent._depth, parent._index
+            )
+            for index in range(start, stop):
+                (
+                    parent._private_key, parent._chain_code, parent._public_key,
+                    parent._parent_fingerprint, parent._fingerprint, parent._depth, parent._index
+                ) = node
+                if parent.drive(index + offset) is None:
+                    continue
+                yield BIP32Child(
+                    index=(index + offset),
+                    public_key=parent._public_key.raw_compressed(),
+                    private_key=(parent._private_key.raw() if parent._private_key else None),
+                    chain_code=parent._chain_code
+                )
+
+        if self._ecc.NAME not in ["SLIP10-Nist256p1", "SLIP10-Secp256k1"]:
+            return drive_children()
+
+        hmac_half_length: int = hashlib.sha512().digest_size // 2
+        parent_hmac: hmac.HMAC = hmac_sha512_context(parent._chain_code)
+        private_key_bytes: Optional[bytes] = parent._private_key.raw() if parent._private_key else None
+        private_key_int: Optional[int] = bytes_to_integer(private_key_bytes) if private_key_bytes else None
+        prefix_bytes: bytes = (
+            integer_to_bytes(0x00) + private_key_bytes if hardened else parent._public_key.raw_compressed()
+        )
+
+        # The pure-Python ecdsa backends keep the child points in Jacobian form and scale
+        # a batch of them to affine with a single inversion, instead of one per key
+        batch: bool = self._ecc.POINT.normalize.__func__ is not IPoint.normalize.__func__
+        parent_point: Optional[IPoint] = parent._public_key.point() if batch else None
+
+        def flush(pending: List[Tuple[int, Optional[bytes], bytes, IPoint]]) -> Iterator[BIP32Child]:
+            for (child_index, child_private_key, _hmac, _), child_public_key in zip(
+                pending, self._ecc.POINT.raw_encoded_many([child[3] for child in pending])
+            ):
+                yield BIP32Child(
+                    index=child_index,
+                    public_key=child_public_key,
+                    private_key=child_private_key,
+                    chain_code=_hmac[hmac_half_length:]
+                )
+
+        def derive_children() -> Iterator[BIP32Child]:
+            pending: List[Tuple[int, Optional[bytes], bytes, IPoint]] = []
+            for index in range(start, stop):
+                if len(pending) == 256:
+                    yield from flush(pending)
+                    pending = []
+
+                _hmac: bytes = hmac_sha512_digest(parent_hmac, prefix_bytes + struct.pack(">L", index + offset))
+                _hmacl_int: int = bytes_to_integer(_hmac[:hmac_half_length])
+                if _hmacl_int > self._ecc.ORDER:
+                    continue
+
+                if private_key_int is not None:
+                    key_int: int = (_hmacl_int + private_key_int) % self._ecc.ORDER
+                    if key_int == 0:
+                        continue
+                    child_private_key: Optional[bytes] = integer_to_bytes(key_int, bytes_num=32)
+                    if batch:
+                        pending.append((index + offset, child_private_key, _hmac, self._ecc.GENERATOR * key_int))
+                        continue
+                    child_public_key: bytes = self._ecc.PRIVATE_KEY.from_bytes(
+                        child_private_key
+                    ).public_key().raw_compressed()
+                else:
+                    child_private_key: Optional[bytes] = None
+                    if batch:
+                        pending.append((index + offset, None, _hmac, parent_point + self._ecc.GENERATOR * _hmacl_int))
+                        continue
+                    child_public_key: bytes = self._ecc.public_key_tweak_add(
+                        public_key=parent._public_key, tweak=_hmac[:hmac_half_length]
+                    ).raw_compressed()
+
+                yield BIP32Child(
+                    index=(index + offset),
+                    public_key=child_public_key,
+                    private_key=child_private_key,
+                    chain_code=_hmac[hmac_half_length:]
+                )
+            yield from flush(pending)
+
+        return derive_children()
+
     def seed(self) -> Optional[str]:
         """
         Retrieves the seed value as a string if it exists.
@@ -871,8 +1230,8 @@ class BIP32HD(IHD):
             _wif_type: str = self._wif_type
 
         return private_key_to_wif(
-            private_key=self.private_key(), wif_type=_wif_type
-        ) if self.private_key() else None
+            private_key=self._private_key.raw(), wif_type=_wif_type
+        ) if self._private_key else None
 
     def wif_type(self) -> Optional[str]:
         """
@@ -906,6 +1265,21 @@ class BIP32HD(IHD):
         :rtype: str
         """
 
+        return bytes_to_string(self.public_key_bytes(public_key_type=public_key_type))
+
+    def public_key_bytes(self, public_key_type: Optional[str] = None) -> bytes:
+        """
+        Retrieves the raw bytes of the public key associated with the current instance,
+        for callers that hash or encode it without a hex round trip.
+
+        :param public_key_type: Optional. Specifies the type of public key to return.
+                                If not provided, defaults to the type set during initialization.
+        :type public_key_type: Optional[str]
+
+        :return: The public key bytes based on the specified type.
+        :rtype: bytes
+        """
+
         if public_key_type:
             if public_key_type not in PUBLIC_KEY_TYPES.get_types():
                 raise Error(
@@ -918,9 +1292,9 @@ class BIP32HD(IHD):
             _public_key_type: str = self._public_key_type
 
         if _public_key_type == PUBLIC_KEY_TYPES.UNCOMPRESSED:
-            return self.uncompressed()
+            return self._public_key.raw_uncompressed()
         elif _public_key_type == PUBLIC_KEY_TYPES.COMPRESSED:
-            return self.compressed()
+            return self._public_key.raw_compressed()
 
     def public_key_type(self) -> str:
         """
@@ -960,7 +1334,7 @@ class BIP32HD(IHD):
         :rtype: str
         """
 
-        return bytes_to_string(ripemd160(sha256(get_bytes(self.public_key())).digest()))
+        return bytes_to_string(hash160(self.public_key_bytes()))
 
     def fingerprint(self) -> str:
         """
@@ -971,7 +1345,18 @@ class BIP32HD(IHD):
         :rtype: str
         """
 
-        return self.hash()[:8]
+        return bytes_to_string(self.fingerprint_bytes())
+
+    def fingerprint_bytes(self) -> bytes:
+        """
+        Computes the fingerprint of the BIP32HD object as raw bytes, the first 4 bytes
+        of the HASH160 of the public key.
+
+        :return: The fingerprint bytes of the BIP32HD object.
+        :rtype: bytes
+        """
+
+        return hash160(self.public_key_bytes())[:4]
 
     def parent_fingerprint(self) -> Optional[str]:
         """
@@ -149,7 +149,7 @@ class BIP44HD(BIP32HD):
         self.clean_derivation()
         self._derivation = derivation
         for index in self._derivation.indexes():
-            self.drive(index)
+            self.__drive__(index)
         return self
 
     def address(
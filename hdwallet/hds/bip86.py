@@ -74,7 +74,7 @@ class BIP86HD(BIP44HD):
         self.clean_derivation()
         self._derivation = derivation
         for index in self._derivation.indexes():
-            self.drive(index)
+            self.__drive__(index)
         return self
 
     def root_xprivate_key(
@@ -14,6 +14,7 @@ import cbor2
 from ..ecc import (
     IEllipticCurveCryptography, IPoint, IPublicKey, KholawEd25519ECC, KholawEd25519PrivateKey
 )
+from ..libs.ed25519 import point_is_identity
 from ..seeds import ISeed
 from ..crypto import (
     pbkdf2_hmac_sha512, hmac_sha512, hmac_sha256, sha512
@@ -41,6 +42,7 @@ from .bip32 import BIP32HD
 class CardanoHD(BIP32HD):
 
     _cardano_type: str
+    _path_key: Optional[bytes] = None
 
     def __init__(self, cardano_type: str) -> None:
         """
@@ -204,13 +206,59 @@ class CardanoHD(BIP32HD):
             )
 
         self._root_public_key = self._root_private_key.public_key()
+        self._path_key = None
         self._private_key, self._chain_code, self._parent_fingerprint = (
             self._root_private_key, self._root_chain_code, b"\x00\x00\x00\x00"
         )
         self._public_key = self._private_key.public_key()
         self._strict = True
+        self._nodes, self._node_depth = [], None
         return self
 
+    def from_xprivate_key(
+        self, xprivate_key: str, encoded: bool = True, strict: bool = False
+    ) -> "CardanoHD":
+        """
+        Initialize this CardanoHD instance from an extended private key, dropping the cached path key.
+
+        :param xprivate_key: The extended private key to initialize from.
+        :type xprivate_key: str
+        :param encoded: Indicates if the xprivate key is encoded. Defaults to True.
+        :type encoded: bool
+        :param strict: If set to True, enforces the xprivate key to be a root key. Defaults to False.
+        :type strict: bool
+
+        :return: This CardanoHD instance initialized with the provided extended private key.
+        :rtype: CardanoHD
+        """
+
+        self._path_key = None
+        return super(CardanoHD, self).from_xprivate_key(
+            xprivate_key=xprivate_key, encoded=encoded, strict=strict
+        )
+
+    def from_xpublic_key(
+        self, xpublic_key: str, encoded: bool = True, strict: bool = False
+    ) -> "CardanoHD":
+        """
+        Initialize this CardanoHD instance from an extended public key, dropping the cached path key.
+
+        :param xpublic_key: The extended public key to initialize from.
+        :type xpublic_key: str
+        :param encoded: Indicates if the xpublic key is encoded. Defaults to True.
+        :type encoded: bool
+        :param strict: If set to True, enforces the xpublic key to be a root key. Defaults to False.
+        :type strict: bool
+
+        :return: This CardanoHD instance initialized with the provided extended public key.
+        :rtype: CardanoHD
+        """
+
+        self._path_key = None
+        return super(CardanoHD, self).from_xpublic_key(
+            xpublic_key=xpublic_key, encoded=encoded, strict=strict
+        )
+
     def from_private_key(self, private_key: str) -> "CardanoHD":
         """
         Initialize this CardanoHD instance from a given private key.
@@ -230,6 +278,7 @@ class CardanoHD(BIP32HD):
             self._private_key = self._ecc.PRIVATE_KEY.from_bytes(get_bytes(private_key))
             self._public_key = self._private_key.public_key()
             self._strict = None
+            self._node_depth = None
             return self
         except ValueError as error:
             raise PrivateKeyError("Invalid private key data")
@@ -252,6 +301,7 @@ class CardanoHD(BIP32HD):
                 raise Error(f"From public key is not implemented for Cardano {self._cardano_type} type")
             self._public_key = self._ecc.PUBLIC_KEY.from_bytes(get_bytes(public_key))
             self._strict = None
+            self._node_depth = None
             return self
         except ValueError as error:
             raise PublicKeyError("Invalid public key data")
@@ -267,6 +317,8 @@ class CardanoHD(BIP32HD):
         :rtype: CardanoHD or None
         """
 
+        # Moving off the tracked nodes, stop reusing them until the next `clean_derivation()`
+        self._node_depth = None
         hmac_half_length: int = hashlib.sha512().digest_size // 2
 
         if self._cardano_type == Cardano.TYPES.BYRON_LEGACY:
@@ -352,11 +404,11 @@ class CardanoHD(BIP32HD):
                     kl_bytes + kr_bytes
                 ),
                 _hmacr,
-                get_bytes(self.fingerprint())
+                self.fingerprint_bytes()
             )
             self._public_key = self._private_key.public_key()
             self._depth, self._index, self._fingerprint = (
-                (self._depth + 1), index, get_bytes(self.fingerprint())
+                (self._depth + 1), index, self.fingerprint_bytes()
             )
         else:
             if index & 0x80000000:
@@ -384,17 +436,17 @@ class CardanoHD(BIP32HD):
                 public_key=self._public_key, zl=z_hmacl, ecc=self._ecc
             )
             # If the public key is the identity point (0, 1) discard the child
-            if new_public_key_point.x() == 0 and new_public_key_point.y() == 1:
+            if point_is_identity(new_public_key_point.raw_encoded()):
                 raise Error("Computed public child key is not valid, very unlucky index")
             new_public_key: IPublicKey = self._ecc.PUBLIC_KEY.from_point(
                 new_public_key_point
             )
-            self._parent_fingerprint = get_bytes(self.fingerprint())
+            self._parent_fingerprint = self.fingerprint_bytes()
             self._chain_code, self._public_key = (
                 _hmacr, new_public_key
             )
             self._depth, self._index, self._fingerprint = (
-                (self._depth + 1), index, get_bytes(self.fingerprint())
+                (self._depth + 1), index, self.fingerprint_bytes()
             )
         return self
 
@@ -406,11 +458,28 @@ class CardanoHD(BIP32HD):
         :rtype: str or None
         """
 
+        path_key: Optional[bytes] = self.path_key_bytes()
+        return bytes_to_string(path_key) if path_key else None
+
+    def path_key_bytes(self) -> Optional[bytes]:
+        """
+        Derives the raw path key bytes based on the current CardanoHD instance.
+
+        The key depends only on the root key and root chain code, so it is derived
+        once and kept until the root changes through ``from_seed``, ``from_xprivate_key``
+        or ``from_xpublic_key``.
+
+        :return: The derived path key bytes.
+        :rtype: bytes or None
+        """
+
         if self._cardano_type == Cardano.TYPES.BYRON_LEGACY:
-            self._root_public_key = self._root_private_key.public_key()
-            return bytes_to_string(pbkdf2_hmac_sha512(
-                (self._root_public_key.raw_compressed()[1:] + self._root_chain_code), "address-hashing", 500, 32
-            ))
+            if self._path_key is None:
+                self._root_public_key = self._root_private_key.public_key()
+                self._path_key = pbkdf2_hmac_sha512(
+                    (self._root_public_key.raw_compressed()[1:] + self._root_chain_code), "address-hashing", 500, 32
+                )
+            return self._path_key
         return None
 
     def address(self, **kwargs) -> str:
@@ -427,7 +496,7 @@ class CardanoHD(BIP32HD):
             return CardanoAddress.encode_byron_legacy(
                 public_key=self._public_key,
                 path=self.path(),
-                path_key=self.path_key(),
+                path_key=self.path_key_bytes(),
                 chain_code=self._chain_code,
                 address_type=kwargs.get(
                     "address_type", Cardano.ADDRESS_TYPES.PUBLIC_KEY
@@ -14,7 +14,7 @@ from ...ecc import (
 from ...seeds import ISeed
 from ...addresses import P2PKHAddress
 from ...wif import (
-    private_key_to_wif, wif_to_private_key
+    private_key_to_wif, wif_to_private_key_bytes
 )
 from ...const import PUBLIC_KEY_TYPES
 from ...derivations import (
@@ -148,7 +148,7 @@ class ElectrumV1HD(IHD):
         :rtype: ElectrumV1HD
         """
         return self.from_private_key(
-            private_key=wif_to_private_key(wif=wif)
+            private_key=wif_to_private_key_bytes(wif=wif)
         )
 
     def from_public_key(self, public_key: Union[bytes, str, IPublicKey]) -> "ElectrumV1HD":
@@ -355,7 +355,7 @@ class ElectrumV1HD(IHD):
             _wif_type: str = self._wif_type
 
         return private_key_to_wif(
-            private_key=self.private_key(), wif_type=_wif_type
+            private_key=self._private_key.raw(), wif_type=_wif_type
         )
 
     def wif_type(self) -> str:
@@ -380,6 +380,20 @@ class ElectrumV1HD(IHD):
         :rtype: str
         """
 
+        return bytes_to_string(self.public_key_bytes(public_key_type=public_key_type))
+
+    def public_key_bytes(self, public_key_type: Optional[str] = None) -> bytes:
+        """
+        Retrieves the raw public key bytes of the specified type, without a hex round trip.
+
+        :param public_key_type: Optional. The type of public key to retrieve ('uncompressed' or 'compressed').
+                                Defaults to the type set in the instance.
+        :type public_key_type: str
+
+        :return: The public key bytes.
+        :rtype: bytes
+        """
+
         if public_key_type:
             if public_key_type not in PUBLIC_KEY_TYPES.get_types():
                 raise Error(
@@ -390,9 +404,9 @@ class ElectrumV1HD(IHD):
             _public_key_type: str = self._public_key_type
 
         if _public_key_type == PUBLIC_KEY_TYPES.UNCOMPRESSED:
-            return self.uncompressed()
+            return self._public_key.raw_uncompressed()
         elif _public_key_type == PUBLIC_KEY_TYPES.COMPRESSED:
-            return self.compressed()
+            return self._public_key.raw_compressed()
 
     def public_key_type(self) -> str:
         """
@@ -313,6 +313,24 @@ class ElectrumV2HD(IHD):
             public_key_type=_public_key_type
         )
 
+    def public_key_bytes(self, public_key_type: Optional[str] = None) -> bytes:
+        """
+        Get the raw public key bytes associated with this instance, optionally specifying the public key type.
+
+        :param public_key_type: Optional parameter to specify the type of public key format.
+                                If not provided, defaults to the current instance's public key type.
+        :type public_key_type: Optional[str]
+
+        :return: The public key bytes in the specified format.
+        :rtype: bytes
+        """
+        _public_key_type: str = (
+            public_key_type if public_key_type in PUBLIC_KEY_TYPES.get_types() else self._public_key_type
+        )
+        return self._bip32_hd.public_key_bytes(
+            public_key_type=_public_key_type
+        )
+
     def public_key_type(self) -> str:
         """
         Get the current public key type used by this instance.
@@ -411,6 +411,17 @@ class IHD:
         :rtype: str
         """
 
+    def public_key_bytes(self, *args, **kwargs) -> bytes:
+        """
+        Retrieves the raw public key bytes associated with the current instance.
+
+        :param args: Additional positional arguments.
+        :param kwargs: Additional keyword arguments.
+
+        :return: The public key bytes based on the specified type.
+        :rtype: bytes
+        """
+
     def compressed(self) -> str:
         """
         Retrieves the compressed form of the public key associated with the current instance.
@@ -476,6 +487,14 @@ class IHD:
         :rtype: str
         """
 
+    def fingerprint_bytes(self) -> bytes:
+        """
+        Computes the raw fingerprint bytes of the HD object by hashing the public key.
+
+        :return: The fingerprint bytes of the HD object.
+        :rtype: bytes
+        """
+
     def parent_fingerprint(self) -> str:
         """
         Retrieves the parent fingerprint of the HD object.
@@ -508,6 +527,14 @@ class IHD:
         :rtype: str
         """
 
+    def path_key_bytes(self) -> bytes:
+        """
+        Retrieves the raw derivation path key bytes associated with the HD object.
+
+        :return: The derivation path key bytes.
+        :rtype: bytes
+        """
+
     def index(self) -> int:
         """
         Retrieves the index of the current BIP32HD object.
@@ -5,12 +5,24 @@
 # file COPYING or https://opensource.org/license/mit
 
 from typing import (
-    Optional, Union, Tuple, Type
+    Optional, Union, Deque, Tuple, Type, List, Iterator, BinaryIO
 )
+from concurrent.futures import (
+    Future, ProcessPoolExecutor
+)
+from collections import deque
+from functools import partial
+
+import mmap
+import os
+import struct
 
-from ..libs.ed25519 import scalar_reduce, int_decode
+from ..libs.base58 import encode_monero
+from ..libs.ed25519 import (
+    scalar_reduce, point_add, point_scalar_mul, point_scalar_mul_base
+)
 from ..ecc import (
-    SLIP10Ed25519MoneroECC, IPoint, IPublicKey, IPrivateKey, SLIP10Ed25519MoneroPublicKey, SLIP10Ed25519MoneroPrivateKey
+    IPublicKey, IPrivateKey, SLIP10Ed25519MoneroPublicKey, SLIP10Ed25519MoneroPrivateKey
 )
 from ..seeds import ISeed
 from ..crypto import kekkak256
@@ -20,15 +32,97 @@ from ..derivations import (
     IDerivation, MoneroDerivation
 )
 from ..exceptions import (
-    NetworkError, DerivationError, AddressError, PrivateKeyError, PublicKeyError, SeedError
+    Error, NetworkError, DerivationError, AddressError, PrivateKeyError, PublicKeyError, SeedError
 )
 from ..utils import (
-    get_bytes, bytes_to_string, integer_to_bytes, bytes_to_integer
+    get_bytes, bytes_to_string, integer_to_bytes, normalize_index
 )
 from ..addresses import MoneroAddress
 from .ihd import IHD
 
 
+def sub_address_spend_public_key(
+    view_private_key: bytes, spend_public_key: bytes, major: int, minor: int
+) -> bytes:
+    """
+    Derives the spend public key of the sub-address at the given major and minor indexes.
+
+    The `(0, 0)` sub-address is the primary address, its spend public key is returned
+    unchanged. Keys stay in encoded point bytes, no point is decoded to coordinates.
+
+    :param view_private_key: The view private key bytes.
+    :type view_private_key: bytes
+    :param spend_public_key: The primary spend public key bytes.
+    :type spend_public_key: bytes
+    :param major: The major index.
+    :type major: int
+    :param minor: The minor index.
+    :type minor: int
+
+    :return: The sub-address spend public key bytes.
+    :rtype: bytes
+    """
+
+    if major == 0 and minor == 0:
+        return spend_public_key
+    return point_add(spend_public_key, point_scalar_mul_base(scalar_reduce(kekkak256(
+        b"SubAddr\x00" + view_private_key +
+        integer_to_bytes(major, bytes_num=4, endianness="little") +
+        integer_to_bytes(minor, bytes_num=4, endianness="little")
+    ))))
+
+
+def sub_addresses_worker(
+    network: str,
+    view_private_key: bytes,
+    spend_public_key: bytes,
+    view_public_key: bytes,
+    chunk: Tuple[int, int, int]
+) -> List[Tuple[int, int, str]]:
+    """
+    Derives and encodes the sub-addresses of one major index over a minor index range.
+
+    Everything stays in encoded point bytes, no point is decoded to coordinates. It is a
+    module-level function so :meth:`MoneroHD.sub_addresses` can run it in worker processes.
+
+    :param network: The network name.
+    :type network: str
+    :param view_private_key: The view private key bytes.
+    :type view_private_key: bytes
+    :param spend_public_key: The spend public key bytes.
+    :type spend_public_key: bytes
+    :param view_public_key: The view public key bytes.
+    :type view_public_key: bytes
+    :param chunk: The major index, the first minor index and the minor index to stop before.
+    :type chunk: Tuple[int, int, int]
+
+    :return: The major index, minor index and address of every sub-address in the chunk.
+    :rtype: List[Tuple[int, int, str]]
+    """
+
+    major, minor_from, minor_to = chunk
+    address_types: dict = MoneroAddress.networks[network]["address_types"]
+    standard_version: bytes = integer_to_bytes(address_types[Monero.ADDRESS_TYPES.STANDARD])
+    sub_address_version: bytes = integer_to_bytes(address_types[Monero.ADDRESS_TYPES.SUB_ADDRESS])
+
+    sub_addresses: List[Tuple[int, int, str]] = []
+    for minor in range(minor_from, minor_to):
+        if major == 0 and minor == 0:
+            payload: bytes = standard_version + spend_public_key + view_public_key
+        else:
+            sub_address_public_key: bytes = sub_address_spend_public_key(
+                view_private_key, spend_public_key, major, minor
+            )
+            payload: bytes = (
+                sub_address_version + sub_address_public_key +
+                point_scalar_mul(view_private_key, sub_address_public_key)
+            )
+        sub_addresses.append(
+            (major, minor, encode_monero(payload + MoneroAddress.compute_checksum(payload)))
+        )
+    return sub_addresses
+
+
 class MoneroHD(IHD):
 
     _network: INetwork
@@ -263,32 +357,88 @@ class MoneroHD(IHD):
         if minor_index == 0 and major_index == 0:
             return self._spend_public_key, self._view_public_key
 
-        m: int = int_decode(scalar_reduce(
-            kekkak256(
-                b"SubAddr\x00" +
-                self._view_private_key.raw() +
-                integer_to_bytes(
-                    major_index, bytes_num=4, endianness="little"
-                ) + integer_to_bytes(
-                    minor_index, bytes_num=4, endianness="little"
-                )
-            )
-        ))
-
-        sub_address_spend_public_key: IPoint = (
-            self._spend_public_key.point() + (SLIP10Ed25519MoneroECC.GENERATOR * m)
+        sub_address_public_key: bytes = sub_address_spend_public_key(
+            self._view_private_key.raw(), self._spend_public_key.raw_compressed(), major_index, minor_index
         )
-        sub_address_view_public_key: IPoint = (
-            sub_address_spend_public_key * bytes_to_integer(
-                self._view_private_key.raw(), endianness="little"
+        return (
+            SLIP10Ed25519MoneroPublicKey.from_bytes(sub_address_public_key),
+            SLIP10Ed25519MoneroPublicKey.from_bytes(
+                point_scalar_mul(self._view_private_key.raw(), sub_address_public_key)
             )
         )
 
-        return (
-            SLIP10Ed25519MoneroPublicKey.from_point(sub_address_spend_public_key),
-            SLIP10Ed25519MoneroPublicKey.from_point(sub_address_view_public_key)
+    def sub_addresses(
+        self,
+        major_range: Union[str, int, Tuple[int, int]],
+        minor_range: Union[str, int, Tuple[int, int]],
+        workers: Optional[int] = None
+    ) -> Iterator[Tuple[int, int, str]]:
+        """
+        Generates the sub-addresses of every major and minor index in the given ranges.
+
+        The view key and spend public key are read once and each sub-address is derived
+        and encoded from point bytes, without building public key objects or decoding points.
+        Index `(0, 0)` yields the primary address, as :meth:`sub_address` does.
+
+        :param major_range: Major index or inclusive range of major indexes, like `0`, `(0, 9)` or `"0-9"`.
+        :type major_range: Union[str, int, Tuple[int, int]]
+        :param minor_range: Minor index or inclusive range of minor indexes.
+        :type minor_range: Union[str, int, Tuple[int, int]]
+        :param workers: Number of worker processes, more than one fans the work out. Defaults to None.
+        :type workers: Optional[int]
+
+        :return: The major index, minor index and sub-address, ordered by major then minor index.
+        :rtype: Iterator[Tuple[int, int, str]]
+        """
+
+        maximum_index: int = 2 ** 32 - 1
+        ranges: List[range] = []
+        for name, index in [("major", major_range), ("minor", minor_range)]:
+            index = normalize_index(index=index, hardened=False)
+            if index[-2] > maximum_index:
+                raise DerivationError(
+                    f"Invalid {name} index range", expected=f"0-{maximum_index}", got=index[-2]
+                )
+            ranges.append(range(index[0], index[-2] + 1))
+        if workers is not None and workers < 1:
+            raise DerivationError("Invalid workers number", expected="> 0", got=workers)
+
+        chunk_size: int = 4096
+        worker = partial(
+            sub_addresses_worker,
+            self._network.__name__.lower(),
+            self._view_private_key.raw(),
+            self._spend_public_key.raw_compressed(),
+            self._view_public_key.raw_compressed()
         )
 
+        def chunks() -> Iterator[Tuple[int, int, int]]:
+            for major in ranges[0]:
+                for minor in range(ranges[1].start, ranges[1].stop, chunk_size):
+                    yield major, minor, min(minor + chunk_size, ranges[1].stop)
+
+        def generate() -> Iterator[Tuple[int, int, str]]:
+            if not workers or workers == 1 or (len(ranges[0]) == 1 and len(ranges[1]) <= chunk_size):
+                for chunk in chunks():
+                    yield from worker(chunk)
+                return
+            # Chunks are submitted as results are consumed, with at most two per worker
+            # in flight, so a large lookahead never holds all of its sub-addresses at once
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                pending: Deque[Future] = deque()
+                try:
+                    for chunk in chunks():
+                        pending.append(executor.submit(worker, chunk))
+                        if len(pending) >= workers * 2:
+                            yield from pending.popleft().result()
+                    while pending:
+                        yield from pending.popleft().result()
+                finally:
+                    for future in pending:
+                        future.cancel()
+
+        return generate()
+
     def seed(self) -> Optional[str]:
         """
         Retrieves the seed used in this MoneroHD instance.
@@ -436,3 +586,228 @@ class MoneroHD(IHD):
             expected=Monero.ADDRESS_TYPES.get_address_types(),
             got=address_type
         )
+
+
+class MoneroSubAddressTable:
+    """
+    Persistent sub-address table mapping sub-address spend public keys to their
+    `(major, minor)` indexes, the reverse of :meth:`MoneroHD.sub_address`.
+
+    The table is an open-addressing hash table with linear probing stored in a
+    memory-mapped file. Every slot is a used flag, the 32-byte spend public key and
+    the little-endian major and minor indexes, so a lookup reads a few slots of the
+    mapping and no index is loaded into memory. Keys are spend public keys derived
+    from a hash, their first 8 bytes are used as the hash directly. The file is
+    doubled and rehashed whenever it becomes more than half full.
+    """
+
+    MAGIC: bytes = b"HDWMSAT1"
+    HEADER_LENGTH: int = 56  # magic + spend public key + capacity + count
+    SLOT_LENGTH: int = 41  # used flag + spend public key + major + minor
+
+    _path: str
+    _file: Optional[BinaryIO] = None
+    _mmap: Optional[mmap.mmap] = None
+    _capacity: int
+    _count: int
+
+    def __init__(self, path: str, capacity: int = 1024) -> None:
+        """
+        Opens the sub-address table stored at the given path, creating it if missing.
+
+        :param path: The table file path.
+        :type path: str
+        :param capacity: The initial number of slots of a new table, rounded up to a power of two. Defaults to 1024.
+        :type capacity: int
+
+        :return: None
+        """
+
+        if not isinstance(capacity, int) or capacity < 1:
+            raise Error("Invalid sub-address table capacity", expected="> 0", got=capacity)
+
+        self._path = path
+        if not os.path.exists(path):
+            self._create(path, 1 << (capacity - 1).bit_length(), bytes(32))
+        self._open()
+
+    def _create(self, path: str, capacity: int, spend_public_key: bytes) -> None:
+        with open(path, "wb") as file:
+            file.write(self.MAGIC + spend_public_key + struct.pack("<QQ", capacity, 0))
+            file.truncate(self.HEADER_LENGTH + capacity * self.SLOT_LENGTH)
+
+    def _open(self) -> None:
+        self._file = open(self._path, "r+b")
+        self._mmap = mmap.mmap(self._file.fileno(), 0)
+        if self._mmap[:len(self.MAGIC)] != self.MAGIC:
+            self.close()
+            raise Error("Invalid sub-address table file", expected=self.MAGIC, got=self._path)
+        self._capacity, self._count = struct.unpack_from("<QQ", self._mmap, 40)
+
+    def _slot(self, spend_public_key: bytes) -> Tuple[int, bool]:
+        mask: int = self._capacity - 1
+        index: int = int.from_bytes(spend_public_key[:8], "little") & mask
+        while True:
+            offset: int = self.HEADER_LENGTH + index * self.SLOT_LENGTH
+            if not self._mmap[offset]:
+                return offset, False
+            if self._mmap[offset + 1:offset + 33] == spend_public_key:
+                return offset, True
+            index = (index + 1) & mask
+
+    def _insert(self, spend_public_key: bytes, major: int, minor: int) -> None:
+        offset, found = self._slot(spend_public_key)
+        self._mmap[offset:offset + self.SLOT_LENGTH] = (
+            b"\x01" + spend_public_key + struct.pack("<II", major, minor)
+        )
+        if not found:
+            self._count += 1
+
+    def _grow(self, count: int) -> None:
+        capacity: int = self._capacity
+        while count * 2 > capacity:
+            capacity *= 2
+        if capacity == self._capacity:
+            return
+        # Rehash into a new file and only then swap it in, an interrupted grow leaves
+        # the current table untouched
+        temporary: str = f"{self._path}.{os.getpid()}.tmp"
+        self._create(temporary, capacity, self.spend_public_key())
+        try:
+            with MoneroSubAddressTable(temporary) as table:
+                for key, major, minor in self.items():
+                    table._insert(key, major, minor)
+        except BaseException:
+            os.remove(temporary)
+            raise
+        self.close()
+        os.replace(temporary, self._path)
+        self._open()
+
+    def spend_public_key(self) -> bytes:
+        """
+        Gets the primary spend public key of the wallet the table was built for.
+
+        :return: The spend public key, zero bytes while the table is empty.
+        :rtype: bytes
+        """
+
+        return bytes(self._mmap[8:40])
+
+    def update(
+        self,
+        monero_hd: "MoneroHD",
+        major_range: Union[str, int, Tuple[int, int]],
+        minor_range: Union[str, int, Tuple[int, int]]
+    ) -> "MoneroSubAddressTable":
+        """
+        Adds the sub-addresses of every major and minor index in the given ranges,
+        growing the table if needed. Indexes already in the table are overwritten.
+
+        :param monero_hd: The Monero HD wallet the sub-addresses belong to.
+        :type monero_hd: MoneroHD
+        :param major_range: Major index or inclusive range of major indexes, like `0`, `(0, 9)` or `"0-9"`.
+        :type major_range: Union[str, int, Tuple[int, int]]
+        :param minor_range: Minor index or inclusive range of minor indexes.
+        :type minor_range: Union[str, int, Tuple[int, int]]
+
+        :return: The updated sub-address table.
+        :rtype: MoneroSubAddressTable
+        """
+
+        majors, minors = (
+            normalize_index(index=major_range, hardened=False), normalize_index(index=minor_range, hardened=False)
+        )
+        for name, index in [("major", majors), ("minor", minors)]:
+            if index[-2] > 2 ** 32 - 1:
+                raise DerivationError(
+                    f"Invalid {name} index range", expected=f"0-{2 ** 32 - 1}", got=index[-2]
+                )
+
+        spend_public_key: bytes = monero_hd._spend_public_key.raw_compressed()
+        if not self._count:
+            self._mmap[8:40] = spend_public_key
+        elif self.spend_public_key() != spend_public_key:
+            raise Error(
+                "Sub-address table belongs to another wallet",
+                expected=bytes_to_string(self.spend_public_key()),
+                got=bytes_to_string(spend_public_key)
+            )
+
+        self._grow(self._count + (majors[-2] - majors[0] + 1) * (minors[-2] - minors[0] + 1))
+        view_private_key: bytes = monero_hd._view_private_key.raw()
+        for major in range(majors[0], majors[-2] + 1):
+            for minor in range(minors[0], minors[-2] + 1):
+                self._insert(
+                    sub_address_spend_public_key(view_private_key, spend_public_key, major, minor), major, minor
+                )
+        self.flush()
+        return self
+
+    def lookup(self, spend_public_key: Union[bytes, str]) -> Optional[Tuple[int, int]]:
+        """
+        Finds the indexes of a sub-address spend public key.
+
+        :param spend_public_key: The 32-byte sub-address spend public key.
+        :type spend_public_key: Union[bytes, str]
+
+        :return: The `(major, minor)` indexes, or None if the key is not in the table.
+        :rtype: Optional[Tuple[int, int]]
+        """
+
+        spend_public_key: bytes = get_bytes(spend_public_key)
+        if len(spend_public_key) != 32:
+            return None
+        offset, found = self._slot(spend_public_key)
+        return struct.unpack_from("<II", self._mmap, offset + 33) if found else None
+
+    def items(self) -> Iterator[Tuple[bytes, int, int]]:
+        """
+        Iterates over the spend public keys and indexes stored in the table, in slot order.
+
+        :return: The spend public key, major index and minor index of every entry.
+        :rtype: Iterator[Tuple[bytes, int, int]]
+        """
+
+        for index in range(self._capacity):
+            offset: int = self.HEADER_LENGTH + index * self.SLOT_LENGTH
+            if self._mmap[offset]:
+                yield (bytes(self._mmap[offset + 1:offset + 33]), *struct.unpack_from("<II", self._mmap, offset + 33))
+
+    def flush(self) -> None:
+        """
+        Writes the entry count and any pending changes to disk.
+
+        :return: None
+        """
+
+        struct.pack_into("<Q", self._mmap, 48, self._count)
+        self._mmap.flush()
+
+    def close(self) -> None:
+        """
+        Flushes and unmaps the table file.
+
+        :return: None
+        """
+
+        if self._mmap is not None:
+            if self._mmap[:len(self.MAGIC)] == self.MAGIC:
+                self.flush()
+            self._mmap.close()
+            self._mmap = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __contains__(self, spend_public_key: Union[bytes, str]) -> bool:
+        return self.lookup(spend_public_key) is not None
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __enter__(self) -> "MoneroSubAddressTable":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
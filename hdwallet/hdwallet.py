@@ -5,8 +5,10 @@
 # file COPYING or https://opensource.org/license/mit
 
 from typing import (
-    Optional, Union, Any, Type, Tuple, List
+    Optional, Union, Any, Type, Tuple, List, Iterator, Dict, Callable
 )
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 
 from .libs.base58 import check_decode
 from .entropies import (
@@ -189,7 +191,7 @@ class HDWallet:
             address = self._cryptocurrency.DEFAULT_ADDRESS
         elif issubclass(address, IAddress):
             address = address.name()
-        if address not in self._cryptocurrency.ADDRESSES.get_addresses():
+        if not self._cryptocurrency.ADDRESSES.is_address(address):
             raise AddressError(
                 f"Wrong {self._cryptocurrency.NAME} address",
                 expected=self._cryptocurrency.ADDRESSES.get_addresses(),
@@ -234,7 +236,8 @@ class HDWallet:
                 ecc=cryptocurrency.ECC,
                 public_key_type=self._public_key_type,
                 semantic=self._semantic,
-                coin_type=self._cryptocurrency.COIN_TYPE
+                coin_type=self._cryptocurrency.COIN_TYPE,
+                node_cache=kwargs.get("node_cache", None)
             )
         elif hd.name() == "Cardano":
             self._hd = hd(cardano_type=self._cardano_type)
@@ -1201,6 +1204,19 @@ class HDWallet:
 
         return self._hd.public_key(public_key_type=public_key_type)
 
+    def public_key_bytes(self, public_key_type: Optional[str] = None) -> bytes:
+        """
+        Get the raw public key bytes associated with the HD wallet.
+
+        :param public_key_type: Optional public key type.
+        :type public_key_type: Optional[str]
+
+        :return: The public key bytes.
+        :rtype: bytes
+        """
+
+        return self._hd.public_key_bytes(public_key_type=public_key_type)
+
     def public_key_type(self) -> str:
         """
         Get the public key type associated with the HD wallet.
@@ -1396,7 +1412,7 @@ class HDWallet:
             address = self._address.name()
         elif not isinstance(address, str) and issubclass(address, IAddress):
             address = address.name()
-        if address not in self._cryptocurrency.ADDRESSES.get_addresses():
+        if not self._cryptocurrency.ADDRESSES.is_address(address):
             raise AddressError(
                 f"Wrong {self._cryptocurrency.NAME} address",
                 expected=self._cryptocurrency.ADDRESSES.get_addresses(),
@@ -1436,7 +1452,7 @@ class HDWallet:
         else:
             if self._cryptocurrency.NAME in ["Bitcoin-Cash", "Bitcoin-Cash-SLP", "eCash"]:
                 return ADDRESSES.address(name=address).encode(
-                    public_key=self.public_key(),
+                    public_key=self._hd.public_key_bytes(),
                     public_key_address_prefix=getattr(
                         self._network, f"{kwargs.get('address_type', self._address_type).upper()}_PUBLIC_KEY_ADDRESS_PREFIX"
                     ),
@@ -1448,7 +1464,7 @@ class HDWallet:
                     hrp=self._network.HRP
                 )
             return ADDRESSES.address(name=address).encode(
-                public_key=self.public_key(),
+                public_key=self._hd.public_key_bytes(),
                 public_key_address_prefix=self._network.PUBLIC_KEY_ADDRESS_PREFIX,
                 script_address_prefix=self._network.SCRIPT_ADDRESS_PREFIX,
                 network_type=self._network.name(),
@@ -1459,27 +1475,101 @@ class HDWallet:
                 )
             )
 
-    def dump(self, exclude: Optional[set] = None) -> dict:
+    def dump_fields(self, root: bool = False) -> Dict[str, Callable[[], Any]]:
         """
-        Dump the state of the HD wallet and related information into a dictionary.
+        Get the registry of dumpable fields, each mapped to a callable resolving its value on demand.
 
-        :param exclude: Optional set of keys to exclude from the dump.
-        :type exclude: Optional[set]
+        :param root: Whether to get the root fields instead of the derivation fields. Defaults to False.
+        :type root: bool
 
-        :return: The dictionary containing the dumped information.
-        :rtype: dict
+        :return: The ordered field names and their resolvers.
+        :rtype: Dict[str, Callable[[], Any]]
         """
 
-        if exclude is None:
-            exclude = { }
+        fields: Dict[str, Callable[[], Any]] = { }
 
-        _derivation: dict = { }
+        if root:
+            fields.update(
+                cryptocurrency=self.cryptocurrency,
+                symbol=self.symbol,
+                network=self.network,
+                coin_type=self.coin_type,
+                entropy=self.entropy,
+                strength=self.strength,
+                mnemonic=self.mnemonic,
+                passphrase=self.passphrase,
+                language=self.language,
+                seed=self.seed,
+                ecc=self.ecc,
+                hd=self.hd
+            )
+            if self._hd.name() in [
+                "BIP32", "BIP44", "BIP49", "BIP84", "BIP86", "BIP141", "Cardano"
+            ]:
+                if self._hd.name() == "Cardano":
+                    fields.update(
+                        cardano_type=self.cardano_type
+                    )
+                fields.update(
+                    semantic=self.semantic,
+                    root_xprivate_key=self.root_xprivate_key,
+                    root_xpublic_key=self.root_xpublic_key,
+                    root_private_key=self.root_private_key,
+                    root_wif=self.root_wif,
+                    root_chain_code=self.root_chain_code,
+                    root_public_key=self.root_public_key,
+                    path_key=self.path_key,
+                    strict=self.strict,
+                    public_key_type=self.public_key_type,
+                    wif_type=self.wif_type
+                )
+                if self._hd.name() == "Cardano":
+                    del fields["root_wif"]
+                    del fields["wif_type"]
+                    if self._cardano_type != "byron-legacy":
+                        del fields["path_key"]
+                else:
+                    del fields["path_key"]
 
-        if self._derivation:
+            elif self._hd.name() in ["Electrum-V1", "Electrum-V2"]:
+                if self._hd.name() == "Electrum-V2":
+                    fields.update(
+                        mode=self.mode,
+                        mnemonic_type=self.mnemonic_type
+                    )
+                fields.update(
+                    master_private_key=self.master_private_key,
+                    master_wif=self.master_wif,
+                    master_public_key=self.master_public_key,
+                    public_key_type=self.public_key_type,
+                    wif_type=self.wif_type
+                )
+            elif self._hd.name() == "Monero":
+                fields.update(
+                    private_key=self.private_key,
+                    spend_private_key=self.spend_private_key,
+                    view_private_key=self.view_private_key,
+                    spend_public_key=self.spend_public_key,
+                    view_public_key=self.view_public_key,
+                    primary_address=self.primary_address,
+                )
+                if self._kwargs.get("payment_id"):
+                    fields.update(
+                        integrated_address=lambda: self.integrated_address(
+                            payment_id=self._kwargs.get("payment_id")
+                        )
+                    )
+            return fields
+
+        def at(keys: Optional[set] = None) -> dict:
+            _at: dict = _derivation_at()
+            return _at if keys is None else {key: value for key, value in _at.items() if key in keys}
+
+        def _derivation_at() -> dict:
             if self._derivation.name() in [
                 "BIP44", "BIP49", "BIP84", "BIP86"
             ]:
-                _at: dict = dict(
+                return dict(
                     path=self._derivation.path(),
                     indexes=self._derivation.indexes(),
                     depth=self.depth(),
@@ -1490,7 +1580,7 @@ class HDWallet:
                     address=self._derivation.address()
                 )
             elif self._derivation.name() == "CIP1852":
-                _at: dict = dict(
+                return dict(
                     path=self._derivation.path(),
                     indexes=self._derivation.indexes(),
                     depth=self.depth(),
@@ -1501,68 +1591,43 @@ class HDWallet:
                     address=self._derivation.address()
                 )
             elif self._derivation.name() == "Electrum":
-                _at: dict = dict(
+                return dict(
                     change=self._derivation.change(),
                     address=self._derivation.address()
                 )
             elif self._derivation.name() == "Monero":
-                _at: dict = dict(
+                return dict(
                     minor=self._derivation.minor(),
                     major=self._derivation.major()
                 )
-            else:
-                _at: dict = dict(
-                    path=self._derivation.path(),
-                    indexes=self._derivation.indexes(),
-                    depth=self.depth(),
-                    index=self.index()
-                )
-            _derivation.update(
-                at=_at
+            return dict(
+                path=self._derivation.path(),
+                indexes=self._derivation.indexes(),
+                depth=self.depth(),
+                index=self.index()
             )
 
-        if self._hd.name() in [
-            "BIP32", "BIP44", "BIP49", "BIP84", "BIP86", "BIP141", "Cardano"
-        ]:
-            _derivation.update(
-                xprivate_key=self.xprivate_key(),
-                xpublic_key=self.xpublic_key(),
-                private_key=self.private_key(),
-                wif=self.wif(),
-                chain_code=self.chain_code(),
-                public_key=self.public_key(),
-                uncompressed=self.uncompressed(),
-                compressed=self.compressed(),
-                hash=self.hash(),
-                fingerprint=self.fingerprint(),
-                parent_fingerprint=self.parent_fingerprint()
-            )
-            if self._hd.name() == "Cardano":
-                del _derivation["wif"]
-                del _derivation["uncompressed"]
-                del _derivation["compressed"]
-
-            if (
-                self._cryptocurrency.ADDRESSES.length() > 1 or
-                self._cryptocurrency.NAME in ["Tezos"]
-            ):
-                addresses: dict = { }
-                if self._cryptocurrency.NAME == "Avalanche":
-                    addresses[self._cryptocurrency.ADDRESS_TYPES.C_CHAIN] = self.address(address="Ethereum")
-                    addresses[self._cryptocurrency.ADDRESS_TYPES.P_CHAIN] = self.address(
-                        address="Avalanche", address_type=self._cryptocurrency.ADDRESS_TYPES.P_CHAIN
-                    )
-                    addresses[self._cryptocurrency.ADDRESS_TYPES.X_CHAIN] = self.address(
-                        address="Avalanche", address_type=self._cryptocurrency.ADDRESS_TYPES.X_CHAIN
-                    )
-                elif self._cryptocurrency.NAME == "Binance":
-                    addresses[self._cryptocurrency.ADDRESS_TYPES.CHAIN] = self.address(address="Cosmos")
-                    addresses[self._cryptocurrency.ADDRESS_TYPES.SMART_CHAIN] = self.address(address="Ethereum")
-                elif self._cryptocurrency.NAME in ["Bitcoin-Cash", "Bitcoin-Cash-SLP", "eCash"]:
-                    for address_type in self._cryptocurrency.ADDRESS_TYPES.get_address_types():
-                        for address in self._cryptocurrency.ADDRESSES.get_addresses():
-                            addresses[f"{address_type}-{address.lower()}"] = ADDRESSES.address(name=address).encode(
-                                public_key=self.public_key(),
+        def addresses(keys: Optional[set] = None) -> dict:
+            # Each address is encoded by its own resolver, so selecting a few of them
+            # through ``keys`` leaves the other encoders uncalled
+            _addresses: Dict[str, Callable[[], str]] = { }
+            if self._cryptocurrency.NAME == "Avalanche":
+                _addresses[self._cryptocurrency.ADDRESS_TYPES.C_CHAIN] = lambda: self.address(address="Ethereum")
+                _addresses[self._cryptocurrency.ADDRESS_TYPES.P_CHAIN] = lambda: self.address(
+                    address="Avalanche", address_type=self._cryptocurrency.ADDRESS_TYPES.P_CHAIN
+                )
+                _addresses[self._cryptocurrency.ADDRESS_TYPES.X_CHAIN] = lambda: self.address(
+                    address="Avalanche", address_type=self._cryptocurrency.ADDRESS_TYPES.X_CHAIN
+                )
+            elif self._cryptocurrency.NAME == "Binance":
+                _addresses[self._cryptocurrency.ADDRESS_TYPES.CHAIN] = lambda: self.address(address="Cosmos")
+                _addresses[self._cryptocurrency.ADDRESS_TYPES.SMART_CHAIN] = lambda: self.address(address="Ethereum")
+            elif self._cryptocurrency.NAME in ["Bitcoin-Cash", "Bitcoin-Cash-SLP", "eCash"]:
+                for address_type in self._cryptocurrency.ADDRESS_TYPES.get_address_types():
+                    for address in self._cryptocurrency.ADDRESSES.get_addresses():
+                        _addresses[f"{address_type}-{address.lower()}"] = (
+                            lambda address_type=address_type, address=address: ADDRESSES.address(name=address).encode(
+                                public_key=self._hd.public_key_bytes(),
                                 public_key_address_prefix=getattr(
                                     self._network, f"{address_type.upper()}_PUBLIC_KEY_ADDRESS_PREFIX"
                                 ),
@@ -1572,151 +1637,298 @@ class HDWallet:
                                 public_key_type=self.public_key_type(),
                                 hrp=self._network.HRP
                             )
-                elif self._cryptocurrency.NAME == "Tezos":
-                    addresses[self._cryptocurrency.ADDRESS_PREFIXES.TZ1] = self.address(
-                        address_prefix=self._cryptocurrency.ADDRESS_PREFIXES.TZ1
+                        )
+            elif self._cryptocurrency.NAME == "Tezos":
+                for address_prefix in [
+                    self._cryptocurrency.ADDRESS_PREFIXES.TZ1,
+                    self._cryptocurrency.ADDRESS_PREFIXES.TZ2,
+                    self._cryptocurrency.ADDRESS_PREFIXES.TZ3
+                ]:
+                    _addresses[address_prefix] = (
+                        lambda address_prefix=address_prefix: self.address(address_prefix=address_prefix)
                     )
-                    addresses[self._cryptocurrency.ADDRESS_PREFIXES.TZ2] = self.address(
-                        address_prefix=self._cryptocurrency.ADDRESS_PREFIXES.TZ2
+            else:
+                for address in self._cryptocurrency.ADDRESSES.get_addresses():
+                    _addresses[address.lower().replace("-", "_")] = (
+                        lambda address=address: self.address(address=address)
                     )
-                    addresses[self._cryptocurrency.ADDRESS_PREFIXES.TZ3] = self.address(
-                        address_prefix=self._cryptocurrency.ADDRESS_PREFIXES.TZ3
+            return {
+                key: encode() for key, encode in _addresses.items() if keys is None or key in keys
+            }
+
+        if self._derivation:
+            fields.update(
+                at=at
+            )
+
+        if self._hd.name() in [
+            "BIP32", "BIP44", "BIP49", "BIP84", "BIP86", "BIP141", "Cardano"
+        ]:
+            fields.update(
+                xprivate_key=self.xprivate_key,
+                xpublic_key=self.xpublic_key,
+                private_key=self.private_key,
+                wif=self.wif,
+                chain_code=self.chain_code,
+                public_key=self.public_key,
+                uncompressed=self.uncompressed,
+                compressed=self.compressed,
+                hash=self.hash,
+                fingerprint=self.fingerprint,
+                parent_fingerprint=self.parent_fingerprint
+            )
+            if self._hd.name() == "Cardano":
+                del fields["wif"]
+                del fields["uncompressed"]
+                del fields["compressed"]
+
+            if (
+                self._cryptocurrency.ADDRESSES.length() > 1 or
+                self._cryptocurrency.NAME in ["Tezos"]
+            ):
+                if self._cryptocurrency.NAME in [
+                    "Avalanche", "Binance", "Bitcoin-Cash", "Bitcoin-Cash-SLP", "eCash", "Tezos"
+                ]:
+                    fields.update(
+                        addresses=addresses
                     )
                 elif self._hd.name() == "BIP44":
-                    _derivation["address"] = self.address(address="P2PKH")
+                    fields.update(
+                        address=lambda: self.address(address="P2PKH")
+                    )
                 elif self._hd.name() == "BIP49":
-                    _derivation["address"] = self.address(address="P2WPKH-In-P2SH")
+                    fields.update(
+                        address=lambda: self.address(address="P2WPKH-In-P2SH")
+                    )
                 elif self._hd.name() == "BIP84":
-                    _derivation["address"] = self.address(address="P2WPKH")
+                    fields.update(
+                        address=lambda: self.address(address="P2WPKH")
+                    )
                 elif self._hd.name() == "BIP86":
-                    _derivation["address"] = self.address(address="P2TR")
+                    fields.update(
+                        address=lambda: self.address(address="P2TR")
+                    )
                 elif self._hd.name() == "BIP141":
                     if self._semantic == SEMANTICS.P2WPKH:
-                        _derivation["address"] = self.address(address="P2WPKH")
+                        fields.update(
+                            address=lambda: self.address(address="P2WPKH")
+                        )
                     elif self._semantic == SEMANTICS.P2WPKH_IN_P2SH:
-                        _derivation["address"] = self.address(address="P2WPKH-In-P2SH")
+                        fields.update(
+                            address=lambda: self.address(address="P2WPKH-In-P2SH")
+                        )
                     elif self._semantic == SEMANTICS.P2WSH:
-                        _derivation["address"] = self.address(address="P2WSH")
+                        fields.update(
+                            address=lambda: self.address(address="P2WSH")
+                        )
                     elif self._semantic == SEMANTICS.P2WSH_IN_P2SH:
-                        _derivation["address"] = self.address(address="P2WSH-In-P2SH")
+                        fields.update(
+                            address=lambda: self.address(address="P2WSH-In-P2SH")
+                        )
                 else:
-                    for address in self._cryptocurrency.ADDRESSES.get_addresses():
-                        addresses[address.lower().replace("-", "_")] = self.address(address=address)
-                if addresses:
-                    _derivation["addresses"] = addresses
+                    fields.update(
+                        addresses=addresses
+                    )
             else:
                 if (
                     self._cryptocurrency.NAME == "Cardano" and
                     self._cardano_type in ["shelley-icarus", "shelley-ledger"]
                 ):
-                    _derivation["address"] = self.address(
-                        address_type=self._address_type, staking_public_key=self._kwargs.get("staking_public_key")
+                    fields.update(
+                        address=lambda: self.address(
+                            address_type=self._address_type, staking_public_key=self._kwargs.get("staking_public_key")
+                        )
                     )
                 else:
-                    _derivation["address"] = self.address()
+                    fields.update(
+                        address=self.address
+                    )
 
         elif self._hd.name() in ["Electrum-V1", "Electrum-V2"]:
-            _derivation.update(
-                private_key=self.private_key(),
-                wif=self.wif(),
-                public_key=self.public_key(),
-                uncompressed=self.uncompressed(),
-                compressed=self.compressed(),
-                address=self.address()
+            fields.update(
+                private_key=self.private_key,
+                wif=self.wif,
+                public_key=self.public_key,
+                uncompressed=self.uncompressed,
+                compressed=self.compressed,
+                address=self.address
             )
         elif self._hd.name() == "Monero":
-            _derivation.update(
-                sub_address=self.sub_address()
+            fields.update(
+                sub_address=self.sub_address
             )
 
-        if "at" in exclude:
-            del _derivation["at"]
+        return fields
+
+    def dump(self, exclude: Optional[set] = None, include: Optional[set] = None) -> dict:
+        """
+        Dump the state of the HD wallet and related information into a dictionary.
+
+        Fields are resolved from :meth:`dump_fields` only when they are dumped, so excluded
+        keys are never computed.
+
+        :param exclude: Optional set of keys to exclude from the dump.
+        :type exclude: Optional[set]
+        :param include: Optional set of keys to dump, all others are left out. Naming ``derivation``
+                        (``derivations`` for :meth:`dumps`), ``at`` or ``addresses`` includes the whole section,
+                        while ``at:<key>`` or ``addresses:<key>`` only resolves that key of the section.
+        :type include: Optional[set]
+
+        :return: The dictionary containing the dumped information.
+        :rtype: dict
+        """
+
+        if exclude is None:
+            exclude = { }
+        _exclude: set = {key.replace("-", "_") if isinstance(key, str) else key for key in exclude}
+        _include: Optional[set] = None
+        _sections: Dict[str, set] = { }
+        if include is not None:
+            _include = set()
+            for key in include:
+                if isinstance(key, str) and key.split(":", 1)[0] in ["at", "addresses"] and ":" in key:
+                    section, name = key.split(":", 1)
+                    _sections.setdefault(section, set()).add(name)
+                else:
+                    _include.add(key.replace("-", "_") if isinstance(key, str) else key)
+
+        def resolve(fields: Dict[str, Callable[[], Any]], whole: bool = False) -> dict:
+            return {
+                key: (
+                    field(_sections[key]) if key in _sections and not whole and key not in _include else field()
+                ) for key, field in fields.items()
+                if key not in _exclude and (_include is None or whole or key in _include or key in _sections)
+            }
 
         if "root" in exclude:
-            return exclude_keys(_derivation, exclude)
-
-        _root: dict = dict(
-            cryptocurrency=self.cryptocurrency(),
-            symbol=self.symbol(),
-            network=self.network(),
-            coin_type=self.coin_type(),
-            entropy=self.entropy(),
-            strength=self.strength(),
-            mnemonic=self.mnemonic(),
-            passphrase=self.passphrase(),
-            language=self.language(),
-            seed=self.seed(),
-            ecc=self.ecc(),
-            hd=self.hd()
-        )
-        if self._hd.name() in [
-            "BIP32", "BIP44", "BIP49", "BIP84", "BIP86", "BIP141", "Cardano"
-        ]:
-            if self._hd.name() == "Cardano":
-                _root.update(
-                    cardano_type=self.cardano_type()
-                )
-            _root.update(
-                semantic=self.semantic(),
-                root_xprivate_key=self.root_xprivate_key(),
-                root_xpublic_key=self.root_xpublic_key(),
-                root_private_key=self.root_private_key(),
-                root_wif=self.root_wif(),
-                root_chain_code=self.root_chain_code(),
-                root_public_key=self.root_public_key(),
-                path_key=self.path_key(),
-                strict=self.strict(),
-                public_key_type=self.public_key_type(),
-                wif_type=self.wif_type()
-            )
-            if self._hd.name() == "Cardano":
-                del _root["root_wif"]
-                del _root["wif_type"]
-                if self._cardano_type != "byron-legacy":
-                    del _root["path_key"]
-            else:
-                del _root["path_key"]
+            return exclude_keys(resolve(
+                self.dump_fields(), whole=_include is not None and "derivations" in _include
+            ), exclude)
 
-        elif self._hd.name() in ["Electrum-V1", "Electrum-V2"]:
-            if self._hd.name() == "Electrum-V2":
-                _root.update(
-                    mode=self.mode(),
-                    mnemonic_type=self.mnemonic_type()
-                )
-            _root.update(
-                master_private_key=self.master_private_key(),
-                master_wif=self.master_wif(),
-                master_public_key=self.master_public_key(),
-                public_key_type=self.public_key_type(),
-                wif_type=self.wif_type()
-            )
-        elif self._hd.name() == "Monero":
-            _root.update(
-                private_key=self.private_key(),
-                spend_private_key=self.spend_private_key(),
-                view_private_key=self.view_private_key(),
-                spend_public_key=self.spend_public_key(),
-                view_public_key=self.view_public_key(),
-                primary_address=self.primary_address(),
+        _root: dict = resolve(self.dump_fields(root=True))
+
+        if "derivation" not in exclude:
+            _derivation: dict = resolve(
+                self.dump_fields(), whole=_include is not None and "derivation" in _include
             )
-            if self._kwargs.get("payment_id"):
-                _root.update(
-                    integrated_address=self.integrated_address(
-                        payment_id=self._kwargs.get("payment_id")
+            if _include is None or "derivation" in _include or _derivation:
+                _root["derivation"] = _derivation
+
+        return exclude_keys(_root, exclude)
+
+    def iter_derivations(self) -> Iterator[IDerivation]:
+        """
+        Iterate over every derivation expanded from the index ranges of the current derivation.
+
+        :return: An iterator of derivations in the order they are dumped.
+        :rtype: Iterator[IDerivation]
+        """
+
+        def drive_helper(derivations, current_derivation: List[Tuple[int, bool]] = []) -> Iterator[IDerivation]:
+            if not derivations:
+
+                if self._derivation.name() in [
+                    "BIP44", "BIP49", "BIP84", "BIP86"
+                ]:
+                    yield DERIVATIONS.derivation(
+                        name=self._derivation.name()
+                    ).__call__(
+                        coin_type=current_derivation[1][0],
+                        account=current_derivation[2][0],
+                        change=current_derivation[3][0],
+                        address=current_derivation[4][0]
+                    )
+                elif self._derivation.name() == "CIP1852":
+                    yield DERIVATIONS.derivation(
+                        name=self._derivation.name()
+                    ).__call__(
+                        coin_type=current_derivation[1][0],
+                        account=current_derivation[2][0],
+                        role=current_derivation[3][0],
+                        address=current_derivation[4][0]
+                    )
+                elif self._derivation.name() == "Electrum":
+                    yield DERIVATIONS.derivation(
+                        name=self._derivation.name()
+                    ).__call__(
+                        change=current_derivation[0][0],
+                        address=current_derivation[1][0]
+                    )
+                elif self._derivation.name() == "Monero":
+                    yield DERIVATIONS.derivation(
+                        name=self._derivation.name()
+                    ).__call__(
+                        minor=current_derivation[0][0],
+                        major=current_derivation[1][0]
+                    )
+                elif self._derivation.name() == "HDW":
+                    yield DERIVATIONS.derivation(
+                        name=self._derivation.name()
+                    ).__call__(
+                        account=current_derivation[0][0],
+                        ecc=current_derivation[1][0],
+                        address=current_derivation[2][0]
+                    )
+                else:
+                    yield DERIVATIONS.derivation(
+                        name=self._derivation.name()
+                    ).__call__(
+                        path="m/" + "/".join(
+                            [str(item[0]) + "'" if item[1] else str(item[0]) for item in current_derivation]
+                        )
+                    )
+                return
+
+            if len(derivations[0]) == 3:
+                for value in range(derivations[0][0], derivations[0][1] + 1):
+                    yield from drive_helper(
+                        derivations[1:], current_derivation + [(value, derivations[0][2])]
                     )
+            else:
+                yield from drive_helper(
+                    derivations[1:], current_derivation + [derivations[0]]
                 )
 
-        if "derivation" not in exclude:
-            _root["derivation"] = _derivation
+        if self._derivation is None:
+            return iter(())
+        return drive_helper(self._derivation.derivations())
 
-        return exclude_keys(_root, exclude)
+    def iter_dumps(self, exclude: Optional[set] = None, include: Optional[set] = None) -> Iterator[dict]:
+        """
+        Lazily dump the derivations of the HD wallet one at a time.
+
+        Each record is the same as in :meth:`dumps` with ``root`` excluded, but only the
+        current one is held in memory. The wallet is left at the last yielded derivation.
+
+        :param exclude: Optional set of keys to exclude from each dump.
+        :type exclude: Optional[set]
+        :param include: Optional set of keys to dump, see :meth:`dump`.
+        :type include: Optional[set]
+
+        :return: An iterator of the dumped derivations.
+        :rtype: Iterator[dict]
+        """
 
-    def dumps(self, exclude: Optional[set] = None) -> Optional[Union[dict, List[dict]]]:
+        if exclude is None:
+            exclude = { }
+
+        for derivation in self.iter_derivations():
+            self.update_derivation(derivation=derivation)
+            yield self.dump(exclude={"root", *exclude}, include=include)
+
+    def dumps(
+        self, exclude: Optional[set] = None, include: Optional[set] = None, workers: Optional[int] = None
+    ) -> Optional[Union[dict, List[dict]]]:
         """
         Dump the state of multiple derivations of the HD wallet and related information into dictionaries.
 
         :param exclude: Optional set of keys to exclude from the dump.
         :type exclude: Optional[set]
+        :param include: Optional set of keys to dump, see :meth:`dump`.
+        :type include: Optional[set]
+        :param workers: Optional number of worker processes used to dump the derivations. Each worker
+                        rebuilds the wallet from its root extended key only, and results keep derivation order.
+        :type workers: Optional[int]
 
         :return: Either a single dictionary or a list of dictionaries containing the dumped information,
                  depending on the number of derivations.
@@ -1725,91 +1937,142 @@ class HDWallet:
 
         if exclude is None:
             exclude = { }
-
-        _derivations: List[dict] = []
-
-        def drive(*args) -> List[str]:
-            def drive_helper(derivations, current_derivation: List[Tuple[int, bool]] = []) -> List[str]:
-                if not derivations:
-
-                    if self._derivation.name() in [
-                        "BIP44", "BIP49", "BIP84", "BIP86"
-                    ]:
-                        _derivation: IDerivation = DERIVATIONS.derivation(
-                            name=self._derivation.name()
-                        ).__call__(
-                            coin_type=current_derivation[1][0],
-                            account=current_derivation[2][0],
-                            change=current_derivation[3][0],
-                            address=current_derivation[4][0]
-                        )
-                    elif self._derivation.name() == "CIP1852":
-                        _derivation: IDerivation = DERIVATIONS.derivation(
-                            name=self._derivation.name()
-                        ).__call__(
-                            coin_type=current_derivation[1][0],
-                            account=current_derivation[2][0],
-                            role=current_derivation[3][0],
-                            address=current_derivation[4][0]
-                        )
-                    elif self._derivation.name() == "Electrum":
-                        _derivation: IDerivation = DERIVATIONS.derivation(
-                            name=self._derivation.name()
-                        ).__call__(
-                            change=current_derivation[0][0],
-                            address=current_derivation[1][0]
-                        )
-                    elif self._derivation.name() == "Monero":
-                        _derivation: IDerivation = DERIVATIONS.derivation(
-                            name=self._derivation.name()
-                        ).__call__(
-                            minor=current_derivation[0][0],
-                            major=current_derivation[1][0]
-                        )
-                    elif self._derivation.name() == "HDW":
-                        _derivation: IDerivation = DERIVATIONS.derivation(
-                            name=self._derivation.name()
-                        ).__call__(
-                            account=current_derivation[0][0],
-                            ecc=current_derivation[1][0],
-                            address=current_derivation[2][0]
-                        )
-                    else:
-                        _derivation: IDerivation = DERIVATIONS.derivation(
-                            name=self._derivation.name()
-                        ).__call__(
-                            path="m/" + "/".join(
-                                [str(item[0]) + "'" if item[1] else str(item[0]) for item in current_derivation]
-                            )
-                        )
-                    self.update_derivation(derivation=_derivation)
-                    _derivations.append(self.dump(exclude={"root", *exclude}))
-                    return [_derivation.path()]
-
-                path: List[str] = []
-                if len(derivations[0]) == 3:
-                    for value in range(derivations[0][0], derivations[0][1] + 1):
-                        path += drive_helper(
-                            derivations[1:], current_derivation + [(value, derivations[0][2])]
-                        )
-                else:
-                    path += drive_helper(
-                        derivations[1:], current_derivation + [derivations[0]]
-                    )
-                return path
-            return drive_helper(args)
+        if workers is not None and (not isinstance(workers, int) or workers < 1):
+            raise Error("Invalid workers number", expected="> 0", got=workers)
 
         if self._derivation is None:
             return None
 
-        drive(*self._derivation.derivations())
+        _derivations: List[dict] = []
+
+        root_xkey: Optional[Tuple[str, str]] = self.root_xkey() if workers and workers > 1 else None
+        if root_xkey:
+            derivations: List[IDerivation] = list(self.iter_derivations())
+            chunk_size: int = max(1, -(-len(derivations) // (workers * 4)))
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                for chunk_dumps in executor.map(
+                    partial(
+                        dumps_worker,
+                        type(self._cryptocurrency),
+                        type(self._hd),
+                        self._network.name(),
+                        self.init_kwargs(),
+                        root_xkey,
+                        {"root", *exclude},
+                        include
+                    ),
+                    [
+                        derivations[index:index + chunk_size] for index in range(0, len(derivations), chunk_size)
+                    ]
+                ):
+                    _derivations.extend(chunk_dumps)
+            if derivations:
+                self.update_derivation(derivation=derivations[-1])
+        else:
+            _derivations.extend(self.iter_dumps(exclude=exclude, include=include))
 
         if "root" in exclude:
             return _derivations
 
-        _root: dict = self.dump(exclude={"derivation"})
+        _root: dict = self.dump(exclude={"derivation", *exclude}, include=include)
 
-        if "derivations" not in exclude:
+        if "derivations" not in exclude and (include is None or "derivations" in include or _derivations):
             _root["derivations"] = _derivations
 
         return exclude_keys(_root, exclude)
+
+    def root_xkey(self) -> Optional[Tuple[str, str]]:
+        """
+        Get the root extended key the wallet can be rebuilt from, preferring the private one.
+
+        :return: A tuple of the key kind ("xprivate_key" or "xpublic_key") and the encoded key,
+                 or None if the HD type has no root extended key.
+        :rtype: Optional[Tuple[str, str]]
+        """
+
+        if self._hd.name() not in [
+            "BIP32", "BIP44", "BIP49", "BIP84", "BIP86", "BIP141", "Cardano"
+        ]:
+            return None
+        if self.root_xprivate_key():
+            return "xprivate_key", self.root_xprivate_key()
+        if self.root_xpublic_key():
+            return "xpublic_key", self.root_xpublic_key()
+        return None
+
+    def init_kwargs(self) -> dict:
+        """
+        Get the keyword arguments that rebuild an equivalent HDWallet instance.
+
+        :return: The keyword arguments accepted by :class:`HDWallet`, without unset values.
+        :rtype: dict
+        """
+
+        return {
+            key: value for key, value in dict(
+                address=self._address,
+                address_type=self._address_type,
+                public_key_type=self._public_key_type,
+                cardano_type=self._cardano_type,
+                mode=self._mode,
+                mnemonic_type=self._mnemonic_type,
+                checksum=self._checksum,
+                semantic=self._semantic,
+                language=self._language,
+                passphrase=self._passphrase,
+                use_default_path=self._use_default_path,
+                staking_public_key=self._kwargs.get("staking_public_key"),
+                payment_id=self._kwargs.get("payment_id")
+            ).items() if value is not None
+        }
+
+
+def dumps_worker(
+    cryptocurrency: Type[ICryptocurrency],
+    hd: Type[IHD],
+    network: str,
+    kwargs: dict,
+    root_xkey: Tuple[str, str],
+    exclude: set,
+    include: Optional[set],
+    derivations: List[IDerivation]
+) -> List[dict]:
+    """
+    Dump a chunk of derivations from a wallet rebuilt from its root extended key.
+
+    This is the process pool entry point of :meth:`HDWallet.dumps`.
+
+    :param cryptocurrency: The cryptocurrency class of the wallet.
+    :type cryptocurrency: Type[ICryptocurrency]
+    :param hd: The HD class of the wallet.
+    :type hd: Type[IHD]
+    :param network: The network name.
+    :type network: str
+    :param kwargs: The wallet keyword arguments from :meth:`HDWallet.init_kwargs`.
+    :type kwargs: dict
+    :param root_xkey: The root extended key kind and value from :meth:`HDWallet.root_xkey`.
+    :type root_xkey: Tuple[str, str]
+    :param exclude: The set of keys to exclude from each dump.
+    :type exclude: set
+    :param include: The optional set of keys to dump.
+    :type include: Optional[set]
+    :param derivations: The derivations to dump, in order.
+    :type derivations: List[IDerivation]
+
+    :return: The list of dumped derivations.
+    :rtype: List[dict]
+    """
+
+    hdwallet: HDWallet = HDWallet(
+        cryptocurrency=cryptocurrency, hd=hd, network=network, **kwargs
+    )
+    if root_xkey[0] == "xprivate_key":
+        hdwallet.from_xprivate_key(xprivate_key=root_xkey[1])
+    else:
+        hdwallet.from_xpublic_key(xpublic_key=root_xkey[1])
+
+    dumps: List[dict] = []
+    for derivation in derivations:
+        hdwallet.update_derivation(derivation=derivation)
+        dumps.append(hdwallet.dump(exclude=exclude, include=include))
+    return dumps
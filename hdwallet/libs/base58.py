@@ -2,12 +2,16 @@
 
 from hashlib import sha256
 from Crypto.Hash import keccak
-from typing import List
+from typing import (
+    Dict, Iterable, List, Tuple
+)
 
 import six
 
 
 __base58_alphabet = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+# Digit-pair tables per alphabet, built on first use
+__base58_tables: Dict[str, Tuple[List[str], Dict[str, int], Dict[str, int]]] = { }
 
 
 def checksum_encode(address, crypto="eth"):
@@ -43,17 +47,58 @@ def ensure_string(data):
     return data
 
 
+def get_tables(alphabet: str = __base58_alphabet) -> Tuple[List[str], Dict[str, int], Dict[str, int]]:
+    """
+    Get the encoding tables of an alphabet: every two-digit string indexed by its
+    value in radix ``len(alphabet) ** 2``, and the reverse lookups for digit pairs
+    and single digits.
+    """
+
+    tables = __base58_tables.get(alphabet)
+    if tables is None:
+        pairs: List[str] = [high + low for high in alphabet for low in alphabet]
+        tables = __base58_tables.setdefault(alphabet, (
+            pairs,
+            {pair: index for index, pair in enumerate(pairs)},
+            {digit: index for index, digit in enumerate(alphabet)}
+        ))
+    return tables
+
+
 def encode(data, alphabet=__base58_alphabet):
-    enc = ""
-    val = string_to_int(data)
-    while val >= len(alphabet):
-        val, mod = divmod(val, len(alphabet))
-        enc = alphabet[mod] + enc
-    if val:
-        enc = alphabet[val] + enc
+    # Peel two digits per division in radix 58^2 and join once at the end,
+    # the integer comes straight from int.from_bytes
+    pairs = get_tables(alphabet)[0]
+    radix = len(pairs)
+    val = int.from_bytes(data, "big")
+    enc = []
+    while val:
+        val, mod = divmod(val, radix)
+        enc.append(pairs[mod])
+    enc.reverse()
 
     n = len(data) - len(data.lstrip(b"\0"))
-    return alphabet[0] * n + enc
+    return alphabet[0] * n + "".join(enc).lstrip(alphabet[0])
+
+
+def encode_many(data: Iterable[bytes], alphabet: str = __base58_alphabet) -> List[str]:
+    """
+    Encode a batch of byte strings, sharing the table lookup across the batch.
+    """
+
+    pairs = get_tables(alphabet)[0]
+    radix, zero, encoded = len(pairs), alphabet[0], []
+    for raw in data:
+        val = int.from_bytes(raw, "big")
+        enc = []
+        while val:
+            val, mod = divmod(val, radix)
+            enc.append(pairs[mod])
+        enc.reverse()
+        encoded.append(
+            zero * (len(raw) - len(raw.lstrip(b"\0"))) + "".join(enc).lstrip(zero)
+        )
+    return encoded
 
 
 def check_encode(raw, alphabet=__base58_alphabet):
@@ -61,25 +106,29 @@ def check_encode(raw, alphabet=__base58_alphabet):
     return encode(raw + chk, alphabet)
 
 
-def decode(data, alphabet=__base58_alphabet):
-    if bytes != str:
-        data = bytes(data, "ascii")
+def check_encode_many(raw: Iterable[bytes], alphabet: str = __base58_alphabet) -> List[str]:
+    """
+    Base58Check encode a batch of byte strings.
+    """
 
-    val = 0
-    prefix = 0
-    for c in data:
-        val = (val * len(alphabet)) + alphabet.encode("utf-8").find(c)
-        if val == 0:
-            prefix += 1
+    return encode_many([
+        data + sha256(sha256(data).digest()).digest()[:4] for data in raw
+    ], alphabet)
 
-    dec = bytearray()
-    while val > 0:
-        val, mod = divmod(val, 256)
-        dec.append(mod)
 
-    dec.extend(bytearray(prefix))
-
-    return bytes(dec[::-1])
+def decode(data, alphabet=__base58_alphabet):
+    _, pair_index, digit_index = get_tables(alphabet)
+    radix = len(pair_index)
+    prefix = len(data) - len(data.lstrip(alphabet[0]))
+    try:
+        # Odd lengths take their leading digit alone, then two digits per step
+        val = digit_index[data[0]] if len(data) % 2 else 0
+        for index in range(len(data) % 2, len(data), 2):
+            val = val * radix + pair_index[data[index:index + 2]]
+    except KeyError:
+        raise ValueError("Invalid base58 character")
+
+    return bytes(prefix) + val.to_bytes((val.bit_length() + 7) // 8, "big")
 
 
 def check_decode(enc, alphabet=__base58_alphabet):
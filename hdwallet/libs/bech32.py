@@ -21,18 +21,40 @@
 """Reference implementation for Bech32 and segwit addresses."""
 
 
+from functools import lru_cache
+
+
 CHARSET = "qpzry9x8gf2tvdw0s3jn54khce6mua7l"
+GENERATOR = [0x3b6a57b2, 0x26508e6d, 0x1ea119fa, 0x3d4233dd, 0x2a1462b3]
 
 
-def bech32_polymod(values):
-    """Internal function that computes the Bech32 checksum."""
-    generator = [0x3b6a57b2, 0x26508e6d, 0x1ea119fa, 0x3d4233dd, 0x2a1462b3]
-    chk = 1
-    for value in values:
-        top = chk >> 25
-        chk = (chk & 0x1ffffff) << 5 ^ value
-        for i in range(5):
-            chk ^= generator[i] if ((top >> i) & 1) else 0
+def _generator_mix(top):
+    """XOR of the generator terms selected by the five bits of top."""
+    chk = 0
+    for i in range(5):
+        chk ^= GENERATOR[i] if ((top >> i) & 1) else 0
+    return chk
+
+
+def _pair_mix(top):
+    """Contribution of the ten high bits of the state over two polymod steps."""
+    chk = ((top << 20) & 0x1ffffff) << 5 ^ _generator_mix(top >> 5)
+    return ((chk & 0x1ffffff) << 5) ^ _generator_mix(chk >> 25)
+
+
+# The polymod step is linear over GF(2), so the effect of the bits shifted out
+# of the state is tabulated: 32 entries for one value, 1024 entries for two
+POLYMOD_TABLE = [_generator_mix(top) for top in range(32)]
+POLYMOD_PAIR_TABLE = [_pair_mix(top) for top in range(1024)]
+
+
+def bech32_polymod(values, chk=1):
+    """Internal function that computes the Bech32 checksum, two values per step."""
+    pair_table = POLYMOD_PAIR_TABLE
+    if len(values) % 2:
+        chk = (chk & 0x1ffffff) << 5 ^ values[0] ^ POLYMOD_TABLE[chk >> 25]
+    for index in range(len(values) % 2, len(values), 2):
+        chk = (chk & 0xfffff) << 10 ^ (values[index] << 5 | values[index + 1]) ^ pair_table[chk >> 20]
     return chk
 
 
@@ -41,16 +63,39 @@ def bech32_hrp_expand(hrp):
     return [ord(x) >> 5 for x in hrp] + [0] + [ord(x) & 31 for x in hrp]
 
 
+@lru_cache(maxsize=1024)
+def bech32_hrp_state(hrp):
+    """Polymod state after the expanded HRP, the common prefix of every checksum for that HRP."""
+    return bech32_polymod(bech32_hrp_expand(hrp))
+
+
+def bech32_hrp_valid(hrp):
+    """Whether an HRP survives the decoder checks, so encoders can skip decoding their own output."""
+    return bool(hrp) and hrp == hrp.lower() and all(33 <= ord(x) <= 126 for x in hrp)
+
+
+def bech32_checksum(state, constant):
+    """Finish a polymod state over the six checksum values and split it into values."""
+    polymod = bech32_polymod([0, 0, 0, 0, 0, 0], state) ^ constant
+    return [(polymod >> 5 * (5 - i)) & 31 for i in range(6)]
+
+
+def bytes_to_values(data):
+    """Split bytes into padded 5-bit values, the 8 to 5 bit case of convertbits."""
+    bits = len(data) * 8
+    pad = -bits % 5
+    val = int.from_bytes(data, "big") << pad
+    return [(val >> shift) & 31 for shift in range(bits + pad - 5, -1, -5)]
+
+
 def bech32_verify_checksum(hrp, data):
     """Verify a checksum given HRP and converted data characters."""
-    return bech32_polymod(bech32_hrp_expand(hrp) + data) == 1
+    return bech32_polymod(data, bech32_hrp_state(hrp)) == 1
 
 
 def bech32_create_checksum(hrp, data):
     """Compute the checksum values given HRP and data."""
-    values = bech32_hrp_expand(hrp) + data
-    polymod = bech32_polymod(values + [0, 0, 0, 0, 0, 0]) ^ 1
-    return [(polymod >> 5 * (5 - i)) & 31 for i in range(6)]
+    return bech32_checksum(bech32_polymod(data, bech32_hrp_state(hrp)), 1)
 
 
 def base_bech32_encode(hrp, data):
@@ -110,7 +155,21 @@ def bech32_decode(hrp, addr):
 
 def bech32_encode(hrp, witprog):
     """Compute a Bech32 string given HRP and data values."""
+    if isinstance(witprog, (bytes, bytearray)):
+        return bech32_encode_many(hrp, [witprog])[0]
     ret = base_bech32_encode(hrp, convertbits(witprog, 8, 5))
     if base_bech32_decode(ret) == (None, None):
         return None
     return ret
+
+
+def bech32_encode_many(hrp, witprogs):
+    """Compute Bech32 strings for many byte strings under the same HRP."""
+    if not bech32_hrp_valid(hrp):
+        return [None for _ in witprogs]
+    state, prefix, encoded = bech32_hrp_state(hrp), hrp + '1', []
+    for witprog in witprogs:
+        data = bytes_to_values(witprog)
+        combined = data + bech32_checksum(bech32_polymod(data, state), 1)
+        encoded.append(prefix + ''.join([CHARSET[d] for d in combined]))
+    return encoded
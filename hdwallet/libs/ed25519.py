@@ -24,6 +24,9 @@ _G_DEC_BYTES = unhexlify(
 _G_ENC_BYTES = unhexlify(
     "5866666666666666666666666666666666666666666666666666666666666666"
 )
+_IDENTITY_ENC_BYTES = unhexlify(
+    "0100000000000000000000000000000000000000000000000000000000000000"
+)
 _COORD_BYTE_LEN = 32
 
 
@@ -45,9 +48,12 @@ _I = pow(2, (_Q - 1) // 4, _Q)  # noqa: E741
 
 
 def _x_recover(y: int) -> int:
-    xx = (y * y - 1) * _inv(_D * y * y + 1)
-    x = pow(xx, (_Q + 3) // 8, _Q)
-    if (x * x - xx) % _Q != 0:
+    # Square root of u / v with the inversion folded into the exponentiation (RFC 8032, 5.1.3)
+    u = (y * y - 1) % _Q
+    v = (_D * y * y + 1) % _Q
+    v3 = v * v * v % _Q
+    x = u * v3 * pow(u * v3 * v3 * v, (_Q - 5) // 8, _Q) % _Q
+    if (v * x * x - u) % _Q != 0:
         x = (x * _I) % _Q
     if x % 2 != 0:
         x = _Q - x
@@ -128,6 +134,17 @@ def point_is_generator(point: Union[bytes, Tuple[int, int]]) -> bool:
     return point == _G
 
 
+def point_is_identity(point: Union[bytes, Tuple[int, int]]) -> bool:
+    # Compare encoded bytes, the identity (0, 1) is encoded as y = 1 with a clear sign bit
+    if isinstance(point, bytes):
+        if point_is_encoded_bytes(point):
+            return point == _IDENTITY_ENC_BYTES
+        if point_is_decoded_bytes(point):
+            return point == bytes(_COORD_BYTE_LEN) + _IDENTITY_ENC_BYTES
+        raise ValueError("Invalid point bytes")
+    return point == (0, 1)
+
+
 def point_is_on_curve(point: Union[bytes, Tuple[int, int]]) -> bool:
     if isinstance(point, bytes):
         point = point_bytes_to_coord(point)
@@ -21,24 +21,9 @@
 """Reference implementation for Bech32 and segwit addresses."""
 
 
-CHARSET = "qpzry9x8gf2tvdw0s3jn54khce6mua7l"
-
-
-def bech32_polymod(values):
-    """Internal function that computes the Bech32 checksum."""
-    generator = [0x3b6a57b2, 0x26508e6d, 0x1ea119fa, 0x3d4233dd, 0x2a1462b3]
-    chk = 1
-    for value in values:
-        top = chk >> 25
-        chk = (chk & 0x1ffffff) << 5 ^ value
-        for i in range(5):
-            chk ^= generator[i] if ((top >> i) & 1) else 0
-    return chk
-
-
-def bech32_hrp_expand(hrp):
-    """Expand the HRP into values for checksum computation."""
-    return [ord(x) >> 5 for x in hrp] + [0] + [ord(x) & 31 for x in hrp]
+from .bech32 import (
+    CHARSET, bech32_polymod, bech32_hrp_expand, bech32_hrp_state, bech32_hrp_valid, bech32_checksum, bytes_to_values
+)
 
 
 def bech32_verify_checksum(hrp, data):
@@ -46,7 +31,7 @@ def bech32_verify_checksum(hrp, data):
     encoding = (
         1 if data[0] == 0 else 0x2bc830a3
     )
-    return bech32_polymod(bech32_hrp_expand(hrp) + data) == encoding
+    return bech32_polymod(data, bech32_hrp_state(hrp)) == encoding
 
 
 def bech32_create_checksum(hrp, data):
@@ -54,9 +39,7 @@ def bech32_create_checksum(hrp, data):
     encoding = (
         1 if data[0] == 0 else 0x2bc830a3
     )
-    values = bech32_hrp_expand(hrp) + data
-    polymod = bech32_polymod(values + [0, 0, 0, 0, 0, 0]) ^ encoding
-    return [(polymod >> 5 * (5 - i)) & 31 for i in range(6)]
+    return bech32_checksum(bech32_polymod(data, bech32_hrp_state(hrp)), encoding)
 
 
 def base_bech32_encode(hrp, data):
@@ -139,7 +122,27 @@ def segwit_decode(hrp, addr):
 
 def segwit_encode(hrp, witver, witprog):
     """Encode a segwit address."""
+    if isinstance(witprog, (bytes, bytearray)) and 0 <= witver <= 16:
+        return segwit_encode_many(hrp, witver, [witprog])[0]
     ret = base_bech32_encode(hrp, [witver] + convertbits(witprog, 8, 5))
     if segwit_decode(hrp, ret) == (None, None):
         return None
     return ret
+
+
+def segwit_encode_many(hrp, witver, witprogs):
+    """Encode many segwit addresses of the same HRP and witness version."""
+    if not (bech32_hrp_valid(hrp) and 0 <= witver <= 16):
+        return [segwit_encode(hrp, witver, list(witprog)) for witprog in witprogs]
+    # The witness version is the first value, so its polymod step is shared too
+    state = bech32_polymod([witver], bech32_hrp_state(hrp))
+    encoding = 1 if witver == 0 else 0x2bc830a3
+    prefix, encoded = hrp + '1' + CHARSET[witver], []
+    for witprog in witprogs:
+        if len(witprog) < 2 or len(witprog) > 40 or (witver == 0 and len(witprog) != 20 and len(witprog) != 32):
+            encoded.append(None)
+            continue
+        data = bytes_to_values(witprog)
+        ret = prefix + ''.join([CHARSET[d] for d in data + bech32_checksum(bech32_polymod(data, state), encoding)])
+        encoded.append(ret if len(ret) <= 90 else None)
+    return encoded
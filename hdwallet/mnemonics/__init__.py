@@ -110,7 +110,7 @@ class MNEMONICS:
         :rtype: bool
         """
 
-        return name in cls.names()
+        return name in cls.dictionary
 
 
 __all__: List[str] = [
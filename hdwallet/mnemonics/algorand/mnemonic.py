@@ -5,7 +5,7 @@
 # file COPYING or https://opensource.org/license/mit
 
 from typing import (
-    Union, Dict, List, Optional
+    Union, Dict, List
 )
 
 import unicodedata
@@ -18,7 +18,7 @@ from ...exceptions import (
     Error, EntropyError, MnemonicError, ChecksumError
 )
 from ...utils import (
-    get_bytes, bytes_to_string, convert_bits
+    get_bytes, bytes_to_string, bytes_to_integer, integer_to_bytes
 )
 from ..imnemonic import IMnemonic
 
@@ -62,6 +62,7 @@ class AlgorandMnemonic(IMnemonic):
     """
 
     checksum_length: int = 2
+    word_bit_length: int = 11
     words_list: List[int] = [
         ALGORAND_MNEMONIC_WORDS.TWENTY_FIVE
     ]
@@ -152,14 +153,17 @@ class AlgorandMnemonic(IMnemonic):
                 "Wrong entropy strength", expected=AlgorandEntropy.strengths, got=(len(entropy) * 8)
             )
 
-        checksum: bytes = sha512_256(entropy)[:cls.checksum_length]
-        checksum_word_indexes: Optional[List[int]] = convert_bits(checksum, 8, 11)
-        assert checksum_word_indexes is not None
-        word_indexes: Optional[List[int]] = convert_bits(entropy, 8, 11)
-        assert word_indexes is not None
-
-        words_list: list = cls.normalize(cls.get_words_list_by_language(language=language))
-        indexes: list = word_indexes + [checksum_word_indexes[0]]
+        # Word indexes are packed little-endian, the first word takes the lowest bits
+        mask: int = (1 << cls.word_bit_length) - 1
+        entropy_int: int = bytes_to_integer(entropy, endianness="little")
+        checksum_word_index: int = bytes_to_integer(
+            sha512_256(entropy)[:cls.checksum_length], endianness="little"
+        ) & mask
+        indexes: list = [
+            (entropy_int >> shift) & mask for shift in range(0, len(entropy) * 8, cls.word_bit_length)
+        ] + [checksum_word_index]
+
+        words_list: list = cls.get_words_list_with_index(language=language)[0]
         return " ".join(cls.normalize([words_list[index] for index in indexes]))
 
     @classmethod
@@ -180,20 +184,24 @@ class AlgorandMnemonic(IMnemonic):
             raise MnemonicError("Invalid mnemonic words count", expected=cls.words_list, got=len(words))
 
         words_list, language = cls.find_language(mnemonic=words)
-        words_list_with_index: dict = {
-            words_list[i]: i for i in range(len(words_list))
-        }
+        words_list_with_index: dict = cls.get_words_list_with_index(language=language)[1]
         word_indexes = [words_list_with_index[word] for word in words]
-        entropy_list: Optional[List[int]] = convert_bits(word_indexes[:-1], 11, 8)
-        assert entropy_list is not None
-        entropy: bytes = bytes(entropy_list)[:-1]
-
-        checksum: bytes = sha512_256(entropy)[:cls.checksum_length]
-        checksum_word_indexes: Optional[List[int]] = convert_bits(checksum, 8, 11)
-        assert checksum_word_indexes is not None
-        if checksum_word_indexes[0] != word_indexes[-1]:
+        entropy_int: int = 0
+        for index in reversed(word_indexes[:-1]):
+            entropy_int = (entropy_int << cls.word_bit_length) | index
+        # The last byte of the word bits only holds padding and is dropped
+        entropy_length: int = (len(word_indexes[:-1]) * cls.word_bit_length + 7) // 8 - 1
+        entropy: bytes = integer_to_bytes(
+            entropy_int & ((1 << (entropy_length * 8)) - 1), bytes_num=entropy_length, endianness="little"
+        )
+
+        mask: int = (1 << cls.word_bit_length) - 1
+        checksum_word_index: int = bytes_to_integer(
+            sha512_256(entropy)[:cls.checksum_length], endianness="little"
+        ) & mask
+        if checksum_word_index != word_indexes[-1]:
             raise ChecksumError(
-                "Invalid checksum", expected=words_list[checksum_word_indexes[0]], got=words_list[word_indexes[-1]]
+                "Invalid checksum", expected=words_list[checksum_word_index], got=words_list[word_indexes[-1]]
             )
 
         return bytes_to_string(entropy)
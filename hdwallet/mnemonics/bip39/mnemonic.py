@@ -19,11 +19,10 @@ from ...exceptions import (
 )
 from ...utils import (
     get_bytes,
-    bytes_to_binary_string,
     bytes_to_string,
-    binary_string_to_integer,
-    integer_to_binary_string,
-    binary_string_to_bytes
+    bytes_to_integer,
+    integer_to_bytes,
+    integer_to_binary_string
 )
 from ..imnemonic import IMnemonic
 
@@ -225,21 +224,24 @@ class BIP39Mnemonic(IMnemonic):
                 "Wrong entropy strength", expected=BIP39Entropy.strengths, got=(len(entropy) * 8)
             )
 
-        entropy_binary_string: str = bytes_to_binary_string(get_bytes(entropy), len(entropy) * 8)
-        entropy_hash_binary_string: str = bytes_to_binary_string(sha256(entropy), 32 * 8)
-        mnemonic_bin: str = entropy_binary_string + entropy_hash_binary_string[:len(entropy) // 4]
+        # Entropy bits followed by the leading hash bits as one integer, split into word indexes
+        checksum_length: int = len(entropy) // 4
+        mnemonic_int: int = (bytes_to_integer(entropy) << checksum_length) | (
+            bytes_to_integer(sha256(entropy)) >> (256 - checksum_length)
+        )
+        words_count: int = (len(entropy) * 8 + checksum_length) // cls.word_bit_length
 
-        mnemonic: List[str] = []
-        words_list: List[str] = cls.normalize(cls.get_words_list_by_language(language=language))
+        words_list: List[str] = cls.get_words_list_with_index(language=language)[0]
         if len(words_list) != cls.words_list_number:
             raise Error(
                 "Invalid number of loaded words list", expected=cls.words_list_number, got=len(words_list)
             )
 
-        for index in range(len(mnemonic_bin) // cls.word_bit_length):
-            word_bin: str = mnemonic_bin[index * cls.word_bit_length:(index + 1) * cls.word_bit_length]
-            word_index: int = binary_string_to_integer(word_bin)
-            mnemonic.append(words_list[word_index])
+        mask: int = (1 << cls.word_bit_length) - 1
+        mnemonic: List[str] = [
+            words_list[(mnemonic_int >> (index * cls.word_bit_length)) & mask]
+            for index in range(words_count - 1, -1, -1)
+        ]
 
         return " ".join(cls.normalize(mnemonic))
 
@@ -276,44 +278,34 @@ class BIP39Mnemonic(IMnemonic):
                 raise Error(
                     "Invalid number of loaded words list", expected=cls.words_list_number, got=len(words_list)
                 )
-            words_list_with_index: dict = {
-                words_list[i]: i for i in range(len(words_list))
-            }
+            words_list_with_index: dict = cls.get_words_list_with_index(language=language)[1]
 
         if len(words_list) != cls.words_list_number:
             raise Error(
                 "Invalid number of loaded words list", expected=cls.words_list_number, got=len(words_list)
             )
 
-        mnemonic_bin: str = "".join(map(
-            lambda word: integer_to_binary_string(
-                words_list_with_index[word], cls.word_bit_length
-            ), words
-        ))
+        mnemonic_int: int = 0
+        for word in words:
+            mnemonic_int = (mnemonic_int << cls.word_bit_length) | words_list_with_index[word]
 
-        mnemonic_bit_length: int = len(mnemonic_bin)
+        mnemonic_bit_length: int = len(words) * cls.word_bit_length
         checksum_length: int = mnemonic_bit_length // 33
-        checksum_bin: str = mnemonic_bin[-checksum_length:]
-        entropy: bytes = binary_string_to_bytes(
-            mnemonic_bin[:-checksum_length], checksum_length * 8
-        )
-        entropy_hash_bin: str = bytes_to_binary_string(
-            sha256(entropy), 32 * 8
+        checksum_int: int = mnemonic_int & ((1 << checksum_length) - 1)
+        entropy: bytes = integer_to_bytes(
+            mnemonic_int >> checksum_length, bytes_num=checksum_length * 4
         )
-        checksum_bin_got: str = entropy_hash_bin[:checksum_length]
-        if checksum_bin != checksum_bin_got:
+        checksum_int_got: int = bytes_to_integer(sha256(entropy)) >> (256 - checksum_length)
+        if checksum_int != checksum_int_got:
             raise ChecksumError(
-                "Invalid checksum", expected=checksum_bin, got=checksum_bin_got
+                "Invalid checksum",
+                expected=integer_to_binary_string(checksum_int, checksum_length),
+                got=integer_to_binary_string(checksum_int_got, checksum_length)
             )
 
         if checksum:
-            pad_bit_len: int = (
-                mnemonic_bit_length
-                if mnemonic_bit_length % 8 == 0 else
-                mnemonic_bit_length + (8 - mnemonic_bit_length % 8)
-            )
             return bytes_to_string(
-                binary_string_to_bytes(mnemonic_bin, pad_bit_len // 4)
+                integer_to_bytes(mnemonic_int, bytes_num=(mnemonic_bit_length + 7) // 8)
             )
         return bytes_to_string(entropy)
 
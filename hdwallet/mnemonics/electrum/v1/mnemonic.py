@@ -158,7 +158,7 @@ class ElectrumV1Mnemonic(IMnemonic):
             )
 
         mnemonic: List[str] = []
-        words_list: List[str] = cls.normalize(cls.get_words_list_by_language(language=language))
+        words_list: List[str] = cls.get_words_list_with_index(language=language)[0]
         for index in range(len(entropy) // 4):
 
             chunk: int = bytes_to_integer(
@@ -206,9 +206,7 @@ class ElectrumV1Mnemonic(IMnemonic):
 
         if not words_list or not words_list_with_index:
             words_list, language = cls.find_language(mnemonic=words)
-            words_list_with_index: dict = {
-                words_list[i]: i for i in range(len(words_list))
-            }
+            words_list_with_index: dict = cls.get_words_list_with_index(language=language)[1]
 
         entropy: bytes = b""
         for index in range(len(words) // 3):
@@ -220,22 +220,16 @@ class ElectrumV2Mnemonic(IMnemonic):
 
         if ElectrumV2Entropy.are_entropy_bits_enough(entropy):
 
-            words_list: List[str] = cls.normalize(cls.get_words_list_by_language(
+            words_list: List[str] = cls.get_words_list_with_index(
                 language=language, wordlist_path=cls.wordlist_path
-            ))
-            bip39_words_list: List[str] = cls.normalize(cls.get_words_list_by_language(
+            )[0]
+            bip39_words_list, bip39_words_list_with_index = cls.get_words_list_with_index(
                 language=language, wordlist_path=BIP39Mnemonic.wordlist_path
-            ))
-            bip39_words_list_with_index: dict = {
-                bip39_words_list[i]: i for i in range(len(bip39_words_list))
-            }
+            )
             try:
-                electrum_v1_words_list: List[str] = cls.normalize(cls.get_words_list_by_language(
+                electrum_v1_words_list, electrum_v1_words_list_with_index = cls.get_words_list_with_index(
                     language=language, wordlist_path=ElectrumV1Mnemonic.wordlist_path
-                ))
-                electrum_v1_words_list_with_index: dict = {
-                    electrum_v1_words_list[i]: i for i in range(len(electrum_v1_words_list))
-                }
+                )
             except KeyError:
                 electrum_v1_words_list: List[str] = [ ]
                 electrum_v1_words_list_with_index: dict = { }
@@ -304,10 +298,10 @@ class ElectrumV2Mnemonic(IMnemonic):
 
         mnemonic: List[str] = []
         if not words_list:
-            words_list = cls.normalize(cls.get_words_list_by_language(language=language))
+            words_list = cls.get_words_list_with_index(language=language)[0]
+        words_list_length: int = len(words_list)
         while entropy > 0:
-            word_index: int = entropy % len(words_list)
-            entropy //= len(words_list)
+            entropy, word_index = divmod(entropy, words_list_length)
             mnemonic.append(words_list[word_index])
 
         if not cls.is_valid(
@@ -347,13 +341,12 @@ class ElectrumV2Mnemonic(IMnemonic):
             raise MnemonicError(f"Invalid {mnemonic_type} mnemonic type words")
 
         words_list, language = cls.find_language(mnemonic=words)
-        words_list_with_index: dict = {
-            words_list[i]: i for i in range(len(words_list))
-        }
+        words_list_with_index: dict = cls.get_words_list_with_index(language=language)[1]
 
         entropy: int = 0
+        words_list_length: int = len(words_list)
         for word in reversed(words):
-            entropy: int = (entropy * len(words_list)) + words_list_with_index[word]
+            entropy = (entropy * words_list_length) + words_list_with_index[word]
 
         return bytes_to_string(integer_to_bytes(entropy))
 
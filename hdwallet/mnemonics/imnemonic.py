@@ -17,6 +17,14 @@ from ..exceptions import MnemonicError
 from ..entropies import IEntropy
 
 
+# Word list files read from disk, by absolute path
+WORDS_LISTS: Dict[str, Tuple[str, ...]] = { }
+# Normalized word lists and their word to index maps, by (mnemonic class, absolute path)
+NORMALIZED_WORDS_LISTS: Dict[Tuple[type, str], Tuple[List[str], Dict[str, int]]] = { }
+# Normalized words to their index in every language containing them, by (mnemonic class, word list paths)
+WORDS_INDEXES: Dict[Tuple[type, Tuple[str, ...]], Dict[str, Dict[str, int]]] = { }
+
+
 class IMnemonic(ABC):
 
     _mnemonic: List[str]
@@ -119,11 +127,70 @@ class IMnemonic(ABC):
         """
 
         wordlist_path = cls.wordlist_path if wordlist_path is None else wordlist_path
-        with open(os.path.join(os.path.dirname(__file__), wordlist_path[language]), "r", encoding="utf-8") as fin:
-            words_list: List[str] = [
-                word.strip() for word in fin.readlines() if word.strip() != "" and not word.startswith("#")
-            ]
-        return words_list
+        path: str = os.path.join(os.path.dirname(__file__), wordlist_path[language])
+        if path not in WORDS_LISTS:
+            with open(path, "r", encoding="utf-8") as fin:
+                WORDS_LISTS[path] = tuple(
+                    word.strip() for word in fin.readlines() if word.strip() != "" and not word.startswith("#")
+                )
+        return list(WORDS_LISTS[path])
+
+    @classmethod
+    def get_words_list_with_index(
+        cls, language: str, wordlist_path: Optional[Dict[str, str]] = None
+    ) -> Tuple[List[str], Dict[str, int]]:
+        """
+        Retrieves the normalized word list and its word to index map for the specified language.
+
+        Both are built once per mnemonic class and word list file, then shared by every call,
+        so they must not be modified.
+
+        :param language: The language for which to get the word list.
+        :type language: str
+        :param wordlist_path: Optional dictionary mapping language names to file paths of their word lists.
+        :type wordlist_path: Optional[Dict[str, str]]
+
+        :return: A tuple containing the normalized word list and the word to index map.
+        :rtype: Tuple[List[str], Dict[str, int]]
+        """
+
+        wordlist_path = cls.wordlist_path if wordlist_path is None else wordlist_path
+        key: Tuple[type, str] = (cls, os.path.join(os.path.dirname(__file__), wordlist_path[language]))
+        if key not in NORMALIZED_WORDS_LISTS:
+            words_list: List[str] = cls.normalize(
+                cls.get_words_list_by_language(language=language, wordlist_path=wordlist_path)
+            )
+            NORMALIZED_WORDS_LISTS[key] = (
+                words_list, {word: index for index, word in enumerate(words_list)}
+            )
+        return NORMALIZED_WORDS_LISTS[key]
+
+    @classmethod
+    def get_words_index(cls, wordlist_path: Optional[Dict[str, str]] = None) -> Dict[str, Dict[str, int]]:
+        """
+        Retrieves the inverted index of every normalized word to the languages containing it.
+
+        The index is built once per mnemonic class and word list paths and shared by every call,
+        so it must not be modified.
+
+        :param wordlist_path: Optional dictionary mapping language names to file paths of their word lists.
+        :type wordlist_path: Optional[Dict[str, str]]
+
+        :return: A dictionary mapping each word to its index per language, in the order of the class languages.
+        :rtype: Dict[str, Dict[str, int]]
+        """
+
+        wordlist_path = cls.wordlist_path if wordlist_path is None else wordlist_path
+        key: Tuple[type, Tuple[str, ...]] = (cls, tuple(wordlist_path[language] for language in cls.languages))
+        if key not in WORDS_INDEXES:
+            words_index: Dict[str, Dict[str, int]] = { }
+            for language in cls.languages:
+                for word, index in cls.get_words_list_with_index(
+                    language=language, wordlist_path=wordlist_path
+                )[1].items():
+                    words_index.setdefault(word, { })[language] = index
+            WORDS_INDEXES[key] = words_index
+        return WORDS_INDEXES[key]
 
     @classmethod
     def find_language(
@@ -132,6 +199,9 @@ class IMnemonic(ABC):
         """
         Finds the language of the given mnemonic by checking against available word lists.
 
+        Words are looked up once in :meth:`get_words_index`, narrowing down the candidate languages
+        and stopping at the first word no candidate contains. The first candidate left wins.
+
         :param mnemonic: The mnemonic to check, represented as a list of words.
         :type mnemonic: List[str]
         :param wordlist_path: Optional dictionary mapping language names to file paths of their word lists.
@@ -141,25 +211,16 @@ class IMnemonic(ABC):
         :rtype: Union[str, Tuple[List[str], str]]
         """
 
-        for language in cls.languages:
-            try:
-                words_list: list = cls.normalize(
-                    cls.get_words_list_by_language(
-                        language=language, wordlist_path=wordlist_path
-                    )
-                )
-                words_list_with_index: dict = {
-                    words_list[i]: i for i in range(len(words_list))
-                }
-                for word in mnemonic:
-                    try:
-                        words_list_with_index[word]
-                    except KeyError as ex:
-                        raise MnemonicError(f"Unable to find word {word}") from ex
-                return words_list, language
-            except (MnemonicError, ValueError):
-                continue
-        raise MnemonicError(f"Invalid language for mnemonic '{mnemonic}'")
+        words_index: Dict[str, Dict[str, int]] = cls.get_words_index(wordlist_path=wordlist_path)
+        languages: List[str] = list(cls.languages)
+        for word in mnemonic:
+            word_languages: Dict[str, int] = words_index.get(word, { })
+            languages = [language for language in languages if language in word_languages]
+            if not languages:
+                raise MnemonicError(f"Invalid language for mnemonic '{mnemonic}'")
+        return cls.get_words_list_with_index(
+            language=languages[0], wordlist_path=wordlist_path
+        )[0], languages[0]
 
     @classmethod
     def is_valid(cls, mnemonic: Union[str, List[str]], **kwargs) -> bool:
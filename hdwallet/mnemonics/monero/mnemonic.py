@@ -237,7 +237,7 @@ class MoneroMnemonic(IMnemonic):
             )
 
         mnemonic: List[str] = []
-        words_list: List[str] = cls.normalize(cls.get_words_list_by_language(language=language))
+        words_list: List[str] = cls.get_words_list_with_index(language=language)[0]
         if len(words_list) != cls.words_list_number:
             raise Error(
                 "Invalid number of loaded words list", expected=cls.words_list_number, got=len(words_list)
@@ -276,6 +276,7 @@ class MoneroMnemonic(IMnemonic):
             raise MnemonicError("Invalid mnemonic words count", expected=cls.words_list, got=len(words))
 
         words_list, language = cls.find_language(mnemonic=words)
+        words_list_with_index: dict = cls.get_words_list_with_index(language=language)[1]
         if len(words_list) != cls.words_list_number:
             raise Error(
                 "Invalid number of loaded words list", expected=cls.words_list_number, got=len(words_list)
@@ -297,7 +298,7 @@ class MoneroMnemonic(IMnemonic):
         for index in range(len(words) // 3):
             word_1, word_2, word_3 = words[index * 3:(index * 3) + 3]
             entropy += words_to_bytes_chunk(
-                word_1, word_2, word_3, words_list, "little"
+                word_1, word_2, word_3, words_list, "little", words_list_with_index
             )
         return bytes_to_string(entropy)
 
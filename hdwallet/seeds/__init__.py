@@ -107,7 +107,7 @@ class SEEDS:
         :rtype: bool
         """
 
-        return name in cls.names()
+        return name in cls.dictionary
 
 
 __all__: List[str] = [
@@ -8,10 +8,43 @@ from abc import (
     ABC, abstractmethod
 )
 from typing import (
-    Union, Optional
+    Union, Optional, Callable, Deque, Iterable, Iterator, List, Tuple, Type
 )
+from collections import deque
+from concurrent.futures import (
+    Future, ProcessPoolExecutor
+)
+from functools import partial
+from itertools import islice
 
 from ..mnemonics import IMnemonic
+from ..exceptions import SeedError
+
+
+def from_mnemonics_worker(
+    seed_class: Type["ISeed"], kwargs: dict, chunk: List[Tuple[str, Optional[str]]]
+) -> List[str]:
+    """
+    Derives the seeds of a chunk of mnemonic and passphrase pairs.
+
+    It is a module-level function so :meth:`ISeed.from_mnemonics` can run it in worker processes.
+
+    :param seed_class: The seed class deriving the seeds.
+    :type seed_class: Type[ISeed]
+    :param kwargs: Additional keyword arguments for ``from_mnemonic``.
+    :type kwargs: dict
+    :param chunk: The mnemonic and passphrase pairs, a None passphrase is not passed on.
+    :type chunk: List[Tuple[str, Optional[str]]]
+
+    :return: The seed of every pair in the chunk.
+    :rtype: List[str]
+    """
+
+    return [
+        seed_class.from_mnemonic(mnemonic=mnemonic, **kwargs) if passphrase is None else
+        seed_class.from_mnemonic(mnemonic=mnemonic, passphrase=passphrase, **kwargs)
+        for mnemonic, passphrase in chunk
+    ]
 
 
 class ISeed(ABC):
@@ -50,3 +83,83 @@ class ISeed(ABC):
     @abstractmethod
     def from_mnemonic(cls, mnemonic: Union[str, IMnemonic]) -> str:
         pass
+
+    @classmethod
+    def from_mnemonics(
+        cls,
+        mnemonics: Iterable[Tuple[Union[str, IMnemonic], Optional[str]]],
+        workers: Optional[int] = None,
+        predicate: Optional[Callable[[str], bool]] = None,
+        chunk_size: int = 64,
+        **kwargs
+    ) -> Iterator[Tuple[str, Optional[str], str]]:
+        """
+        Derives the seeds of many mnemonic and passphrase pairs, streaming them in input order.
+
+        The pairs are consumed lazily, so a generator of candidates is never materialized. With
+        more than one worker, chunks of pairs are hashed in worker processes and only a bounded
+        number of chunks is in flight at a time. With a predicate, only the first pair whose seed
+        it accepts is yielded and the remaining work is cancelled, like for a passphrase recovery
+        that stops at the seed deriving a known address.
+
+        :param mnemonics: The mnemonic and passphrase pairs, use a None passphrase for none.
+        :type mnemonics: Iterable[Tuple[Union[str, IMnemonic], Optional[str]]]
+        :param workers: Number of worker processes, more than one fans the work out. Defaults to None.
+        :type workers: Optional[int]
+        :param predicate: Optional seed match, called in this process on every derived seed.
+        :type predicate: Optional[Callable[[str], bool]]
+        :param chunk_size: Number of pairs sent to a worker process at once. Defaults to 64.
+        :type chunk_size: int
+        :param kwargs: Additional keyword arguments for ``from_mnemonic``, like ``cardano_type``.
+
+        :return: The mnemonic, passphrase and seed of every pair, or of the first match only.
+        :rtype: Iterator[Tuple[str, Optional[str], str]]
+        """
+
+        if workers is not None and workers < 1:
+            raise SeedError("Invalid workers number", expected="> 0", got=workers)
+        if chunk_size < 1:
+            raise SeedError("Invalid chunk size", expected="> 0", got=chunk_size)
+        worker = partial(from_mnemonics_worker, cls, kwargs)
+
+        def chunks(size: int) -> Iterator[List[Tuple[str, Optional[str]]]]:
+            iterator: Iterator = iter(mnemonics)
+            while True:
+                chunk: List[Tuple[str, Optional[str]]] = [
+                    (mnemonic.mnemonic() if isinstance(mnemonic, IMnemonic) else mnemonic, passphrase)
+                    for mnemonic, passphrase in islice(iterator, size)
+                ]
+                if not chunk:
+                    return
+                yield chunk
+
+        def derive() -> Iterator[Tuple[List[Tuple[str, Optional[str]]], List[str]]]:
+            if not workers or workers == 1:
+                for chunk in chunks(1):
+                    yield chunk, worker(chunk)
+                return
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                pending: Deque[Tuple[List[Tuple[str, Optional[str]]], Future]] = deque()
+                try:
+                    for chunk in chunks(chunk_size):
+                        pending.append((chunk, executor.submit(worker, chunk)))
+                        if len(pending) >= workers * 2:
+                            chunk, future = pending.popleft()
+                            yield chunk, future.result()
+                    while pending:
+                        chunk, future = pending.popleft()
+                        yield chunk, future.result()
+                finally:
+                    for _, future in pending:
+                        future.cancel()
+
+        def generate() -> Iterator[Tuple[str, Optional[str], str]]:
+            for chunk, seeds in derive():
+                for (mnemonic, passphrase), seed in zip(chunk, seeds):
+                    if predicate is None:
+                        yield mnemonic, passphrase, seed
+                    elif predicate(seed):
+                        yield mnemonic, passphrase, seed
+                        return
+
+        return generate()
@@ -740,17 +740,22 @@ def bytes_chunk_to_words(
 
     words_list_length = len(words_list)
 
-    chunk: int = bytes_to_integer(bytes_chunk, endianness=endianness)
+    chunk: int = int.from_bytes(bytes_chunk, byteorder=endianness)
 
-    word_1_index = chunk % words_list_length
-    word_2_index = ((chunk // words_list_length) + word_1_index) % words_list_length
-    word_3_index = ((chunk // words_list_length // words_list_length) + word_2_index) % words_list_length
+    quotient, word_1_index = divmod(chunk, words_list_length)
+    word_2_index = (quotient + word_1_index) % words_list_length
+    word_3_index = ((quotient // words_list_length) + word_2_index) % words_list_length
 
     return [words_list[index] for index in (word_1_index, word_2_index, word_3_index)]
 
 
 def words_to_bytes_chunk(
-    word_1: str, word_2: str, word_3: str, words_list: List[str], endianness: Literal["little", "big"]
+    word_1: str,
+    word_2: str,
+    word_3: str,
+    words_list: List[str],
+    endianness: Literal["little", "big"],
+    words_list_with_index: Optional[dict] = None
 ) -> bytes:
     """
     Convert three words into a bytes chunk based on a given word list and endianness.
@@ -765,15 +770,19 @@ def words_to_bytes_chunk(
     :type words_list: List[str]
     :param endianness: The endianness to use when encoding the chunk into bytes ("little" or "big").
     :type endianness: Literal["little", "big"]
+    :param words_list_with_index: Optional dictionary mapping words to their indices in words_list,
+                                  built from words_list if not provided.
+    :type words_list_with_index: Optional[dict]
 
     :return: The bytes chunk representing the three words.
     :rtype: bytes
     """
 
     words_list_length = len(words_list)
-    words_list_with_index: dict = {
-        words_list[i]: i for i in range(len(words_list))
-    }
+    if words_list_with_index is None:
+        words_list_with_index: dict = {
+            words_list[i]: i for i in range(len(words_list))
+        }
 
     word_1_index, word_2_index,  word_3_index = (
         words_list_with_index[word_1], words_list_with_index[word_2] % words_list_length, words_list_with_index[word_3] % words_list_length
@@ -787,6 +796,4 @@ def words_to_bytes_chunk(
         )
     )
 
-    return integer_to_bytes(
-        chunk, bytes_num=4, endianness=endianness
-    )
+    return chunk.to_bytes(4, byteorder=endianness)
@@ -30,19 +30,22 @@ def get_checksum(raw: bytes) -> bytes:
     return double_sha256(raw)[:CHECKSUM_BYTE_LENGTH]
 
 
+def encode_wif_payload(private_key: bytes, compressed: bool) -> str:
+    wif_payload: bytes = (
+        integer_to_bytes(WIF_PREFIX) + private_key + integer_to_bytes(COMPRESSED_PRIVATE_KEY_PREFIX)
+        if compressed else integer_to_bytes(WIF_PREFIX) + private_key
+    )
+    return encode(wif_payload + get_checksum(wif_payload))
+
+
 def encode_wif(private_key: Union[str, bytes]) -> Tuple[str, str]:
-    if len(get_bytes(private_key)) != 32:
+    private_key_bytes: bytes = get_bytes(private_key)
+    if len(private_key_bytes) != 32:
         raise ValueError(f"Invalid private key length (expected 64, got {len(private_key)!r})")
 
-    wif_payload: bytes = (
-        integer_to_bytes(WIF_PREFIX) + get_bytes(private_key)
-    )
-    wif_compressed_payload: bytes = (
-        integer_to_bytes(WIF_PREFIX) + get_bytes(private_key) + integer_to_bytes(COMPRESSED_PRIVATE_KEY_PREFIX)
-    )
     return (
-        encode(wif_payload + get_checksum(wif_payload)),
-        encode(wif_compressed_payload + get_checksum(wif_compressed_payload))
+        encode_wif_payload(private_key=private_key_bytes, compressed=False),
+        encode_wif_payload(private_key=private_key_bytes, compressed=True)
     )
 
 
@@ -84,13 +87,15 @@ def private_key_to_wif(private_key: Union[str, bytes], wif_type: str = WIF_TYPES
     :returns: str -- Wallet Import Format
     """
 
-    # Getting uncompressed and compressed
-    wif, wif_compressed = encode_wif(private_key=private_key)
+    private_key_bytes: bytes = get_bytes(private_key)
+    if len(private_key_bytes) != 32:
+        raise ValueError(f"Invalid private key length (expected 64, got {len(private_key)!r})")
 
+    # Only the requested variant is checksummed and Base58 encoded
     if wif_type == WIF_TYPES.WIF:
-        return wif
+        return encode_wif_payload(private_key=private_key_bytes, compressed=False)
     elif wif_type == WIF_TYPES.WIF_COMPRESSED:
-        return wif_compressed
+        return encode_wif_payload(private_key=private_key_bytes, compressed=True)
     else:
         raise ValueError("Invalid WIF type, choose only 'wif' or 'wif-compressed' types")
 
@@ -105,7 +110,20 @@ def wif_to_private_key(wif: str) -> str:
     :returns: str -- Private key
     """
 
-    return bytes_to_string(decode_wif(wif=wif)[0])
+    return bytes_to_string(wif_to_private_key_bytes(wif=wif))
+
+
+def wif_to_private_key_bytes(wif: str) -> bytes:
+    """
+    Wallet Import Format (WIF) to raw private key bytes converter
+
+    :param wif: Wallet Import Format
+    :type wif: str
+
+    :returns: bytes -- Private key
+    """
+
+    return decode_wif(wif=wif)[0]
 
 
 def get_wif_type(wif: str) -> str:
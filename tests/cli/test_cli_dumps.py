@@ -138,3 +138,68 @@ def test_cli_dumps(cli_tester, hd_data):
         cli = cli_tester.invoke(cli_main, args)
         assert cli.exit_code == 0
         assert json.loads(cli.output) == final_dumps
+
+
+def test_cli_dumps_ndjson_output(cli_tester, data, tmp_path):
+
+    dumps = data["hdwallet"]["BIP44"]["compressed"]
+    args = [
+        "dumps",
+        "--symbol", dumps["symbol"],
+        "--hd", "BIP44",
+        "--xprivate-key", dumps["root_xprivate_key"]
+    ]
+    args.extend(get_derivation_args(data["hdwallet"]["BIP44"]["derivation"]))
+
+    cli = cli_tester.invoke(cli_main, args + [
+        "--format", "ndjson", "--exclude", "root", "--output", str(tmp_path / "dumps.ndjson")
+    ])
+    assert cli.exit_code == 0
+    assert cli.output == ""
+    with open(tmp_path / "dumps.ndjson", "r", encoding="utf-8") as output:
+        assert [json.loads(line) for line in output] == dumps["derivations"]
+
+    cli = cli_tester.invoke(cli_main, args + [
+        "--include", "at:path,address", "--delimiter", ",", "--output", str(tmp_path / "dumps.csv")
+    ])
+    assert cli.exit_code == 0
+    with open(tmp_path / "dumps.csv", "r", encoding="utf-8") as output:
+        assert output.read().splitlines() == [
+            f"{derivation['at']['path']},{derivation['address']}" for derivation in dumps["derivations"]
+        ]
+
+
+def test_cli_dumps_csv_address_selection(cli_tester, data, tmp_path, monkeypatch):
+
+    from hdwallet.addresses import (
+        P2SHAddress, P2TRAddress, P2WPKHAddress, P2WPKHInP2SHAddress, P2WSHAddress, P2WSHInP2SHAddress
+    )
+
+    def not_requested(cls, *args, **kwargs):
+        raise AssertionError(f"{cls.name()} address was not requested")
+
+    # BIP32 dumps addresses:p2pkh by default, the other address types must stay unencoded
+    for address in [
+        P2SHAddress, P2TRAddress, P2WPKHAddress, P2WPKHInP2SHAddress, P2WSHAddress, P2WSHInP2SHAddress
+    ]:
+        monkeypatch.setattr(address, "encode", classmethod(not_requested))
+
+    dumps = data["hdwallet"]["BIP32"]["compressed"]
+    args = [
+        "dumps",
+        "--symbol", dumps["symbol"],
+        "--hd", "BIP32",
+        "--xprivate-key", dumps["root_xprivate_key"],
+        "--delimiter", ",",
+        "--output", str(tmp_path / "dumps.csv")
+    ]
+    args.extend(get_derivation_args(data["hdwallet"]["BIP32"]["derivation"]))
+
+    cli = cli_tester.invoke(cli_main, args)
+    assert cli.exit_code == 0
+    assert cli.output == ""
+    with open(tmp_path / "dumps.csv", "r", encoding="utf-8") as output:
+        assert output.read().splitlines() == [
+            f"{derivation['at']['path']},{derivation['addresses']['p2pkh']},"
+            f"{derivation['public_key']},{derivation['wif']}" for derivation in dumps["derivations"]
+        ]
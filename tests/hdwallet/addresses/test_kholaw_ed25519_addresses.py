@@ -54,6 +54,15 @@ def test_cardano_byron_legacy_address(data):
         address=data["addresses"]["Kholaw-Ed25519"]["addresses"]["byron-legacy"]["encode"]
     ) == data["addresses"]["Kholaw-Ed25519"]["addresses"]["byron-legacy"]["decode"]
 
+    assert CardanoAddress.encode_byron_legacy_many(
+        keys=[(
+            data["addresses"]["Kholaw-Ed25519"]["public-key"],
+            data["addresses"]["Kholaw-Ed25519"]["addresses"]["byron-legacy"]["args"]["path"],
+            data["addresses"]["Kholaw-Ed25519"]["addresses"]["byron-legacy"]["args"]["chain_code"]
+        )] * 2,
+        path_key=data["addresses"]["Kholaw-Ed25519"]["addresses"]["byron-legacy"]["args"]["path_key"]
+    ) == [data["addresses"]["Kholaw-Ed25519"]["addresses"]["byron-legacy"]["encode"]] * 2
+
     assert CardanoAddress.encode(
         encode_type=Cardano.TYPES.BYRON_LEGACY,
         public_key=data["addresses"]["Kholaw-Ed25519"]["public-key"],
@@ -19,6 +19,7 @@ from hdwallet.ecc import (
 from hdwallet.ecc.slip10.ed25519 import (
     SLIP10Ed25519ECC, SLIP10Ed25519Point, SLIP10Ed25519PublicKey, SLIP10Ed25519PrivateKey
 )
+from hdwallet.libs.ed25519 import point_is_identity
 from hdwallet.utils import get_bytes
 
 
@@ -71,6 +72,38 @@ def test_slip10_ed25519_ecc_point(data):
             assert point_add.y() == point_radd.y() == point_mul.y() == point_rmul.y()
 
 
+
+def test_slip10_ed25519_ecc_point_normalize(data):
+
+    point = SLIP10Ed25519Point.from_bytes(
+        get_bytes(data["eccs"]["SLIP10-Ed25519"]["compressed"]["point"]["encode"])
+    )
+    points = [point * number for number in range(1, 9)]
+    assert SLIP10Ed25519Point.raw_encoded_many(points) == [
+        SLIP10Ed25519Point.from_bytes(item.raw_encoded()).raw_encoded() for item in points
+    ]
+    assert SLIP10Ed25519Point.raw_decoded_many(points) == [
+        SLIP10Ed25519Point.from_bytes(item.raw_encoded()).raw_decoded() for item in points
+    ]
+    assert SLIP10Ed25519Point.raw_decoded_many(points)[0] == get_bytes(
+        data["eccs"]["SLIP10-Ed25519"]["compressed"]["point"]["decode"]
+    )
+
+
+def test_slip10_ed25519_ecc_point_identity(data):
+
+    identity = SLIP10Ed25519Point.from_coordinates(x=0, y=1)
+    assert point_is_identity(identity.raw_encoded())
+    assert point_is_identity(identity.raw_decoded())
+    assert (identity.x(), identity.y()) == (0, 1)
+    point = SLIP10Ed25519Point.from_bytes(
+        get_bytes(data["eccs"]["SLIP10-Ed25519"]["compressed"]["point"]["encode"])
+    )
+    assert not point_is_identity(point.raw_encoded())
+    assert not hasattr(point, "__dict__")
+    with pytest.raises(ValueError, match="Invalid point bytes"):
+        point_is_identity(b"\x01")
+
 def test_slip10_ed25519_ecc_public_key(data):
 
     assert SLIP10Ed25519PublicKey.name() == data["eccs"]["SLIP10-Ed25519"]["name"]
@@ -8,6 +8,7 @@
 from ecdsa import (
     SigningKey, VerifyingKey
 )
+from ecdsa.ecdsa import generator_256
 from ecdsa.ellipticcurve import PointJacobi
 
 import json
@@ -20,6 +21,10 @@ from hdwallet.ecc import (
 from hdwallet.ecc.slip10.nist256p1 import (
     SLIP10Nist256p1ECC, SLIP10Nist256p1Point, SLIP10Nist256p1PublicKey, SLIP10Nist256p1PrivateKey
 )
+from hdwallet.ecc.slip10.precompute import (
+    FixedBaseGenerator, NIST256P1_CURVE
+)
+from hdwallet.exceptions import ECCError
 from hdwallet.utils import get_bytes
 
 
@@ -106,3 +111,58 @@ def test_slip10_nist256p1_ecc_private_key(data):
     assert isinstance(private_key.public_key(), SLIP10Nist256p1PublicKey)
     assert private_key.public_key().raw_uncompressed() == get_bytes(data["eccs"]["SLIP10-Nist256p1"]["uncompressed"]["public-key"])
     assert private_key.public_key().raw_compressed() == get_bytes(data["eccs"]["SLIP10-Nist256p1"]["compressed"]["public-key"])
+
+
+def test_slip10_nist256p1_ecc_fixed_base_generator(data, tmp_path, monkeypatch):
+
+    private_key = int(data["eccs"]["SLIP10-Nist256p1"]["private-key"], 16)
+    for scalar in [1, 2, 255, 256, private_key, SLIP10Nist256p1ECC.ORDER - 1, SLIP10Nist256p1ECC.ORDER + 1]:
+        assert (SLIP10Nist256p1ECC.GENERATOR * scalar).underlying_object() == generator_256 * scalar
+    assert (SLIP10Nist256p1ECC.GENERATOR * private_key).raw_encoded() == get_bytes(
+        data["eccs"]["SLIP10-Nist256p1"]["compressed"]["public-key"]
+    )
+
+    generator = SLIP10Nist256p1ECC.GENERATOR.underlying_object()
+    assert isinstance(generator, FixedBaseGenerator)
+
+    # Verification goes through the stock generator and its own precomputed table
+    calls = []
+    mul_add = generator_256.mul_add
+    monkeypatch.setattr(generator_256, "mul_add", lambda *args: calls.append(args) or mul_add(*args))
+    signing_key = SigningKey.from_secret_exponent(private_key, curve=NIST256P1_CURVE)
+    assert signing_key.verifying_key.verify(signing_key.sign(b"hdwallet"), b"hdwallet")
+    assert len(calls) == 1
+    monkeypatch.undo()
+    path = str(tmp_path / "nist256p1.bin")
+    generator.save(path)
+    loaded = FixedBaseGenerator(generator_256).load(path)
+    assert loaded.table == generator.precompute()
+    assert loaded * private_key == generator_256 * private_key
+
+    with open(path, "wb") as file:
+        file.write(b"\x00" * 64)
+    with pytest.raises(ECCError, match="Invalid precomputed table length"):
+        FixedBaseGenerator(generator_256).load(path)
+
+
+def test_slip10_nist256p1_ecc_point_normalize(data):
+
+    private_key = int(data["eccs"]["SLIP10-Nist256p1"]["private-key"], 16)
+    points = [SLIP10Nist256p1ECC.GENERATOR * (private_key + index) for index in range(8)]
+    expected = [generator_256 * (private_key + index) for index in range(8)]
+    assert SLIP10Nist256p1Point.raw_encoded_many(points) == [point.to_bytes("compressed") for point in expected]
+    assert SLIP10Nist256p1Point.raw_decoded_many(points) == [point.to_bytes() for point in expected]
+
+    # Normalizing builds new points and leaves the given ones as they were
+    coordinates = [point.underlying_object().jacobian for point in points]
+    normalized = SLIP10Nist256p1Point.normalize(points)
+    assert [point.underlying_object().jacobian for point in points] == coordinates
+    assert all(point.underlying_object().jacobian[2] == 1 for point in normalized)
+    assert [point.underlying_object() for point in normalized] == expected
+    summed = points[0] + SLIP10Nist256p1ECC.GENERATOR * 1
+    assert summed.underlying_object() == expected[1]
+    assert summed.raw_encoded() == expected[1].to_bytes("compressed")
+    public_keys = SLIP10Nist256p1PublicKey.from_points(points)
+    assert all(isinstance(public_key, SLIP10Nist256p1PublicKey) for public_key in public_keys)
+    assert public_keys[0].raw_compressed() == get_bytes(data["eccs"]["SLIP10-Nist256p1"]["compressed"]["public-key"])
+    assert SLIP10Nist256p1PublicKey.from_points([]) == []
@@ -20,7 +20,9 @@ import pytest
 from hdwallet.ecc import (
     IPoint, IPublicKey, IPrivateKey
 )
-from hdwallet.ecc.slip10.secp256k1 import SLIP10Secp256k1ECC
+from hdwallet.ecc.slip10.secp256k1 import (
+    SLIP10Secp256k1ECC, SLIP10Secp256k1ECCCoincurve, SLIP10Secp256k1ECCECDSA
+)
 
 from hdwallet.ecc.slip10.secp256k1.point import (
     SLIP10Secp256k1PointECDSA, SLIP10Secp256k1PointCoincurve
@@ -203,3 +205,21 @@ def test_slip10_secp256k1_ecc_private_key(data):
     assert isinstance(private_key.public_key(), SLIP10Secp256k1PublicKeyECDSA)
     assert private_key.public_key().raw_uncompressed() == get_bytes(data["eccs"]["SLIP10-Secp256k1"]["uncompressed"]["public-key"])
     assert private_key.public_key().raw_compressed() == get_bytes(data["eccs"]["SLIP10-Secp256k1"]["compressed"]["public-key"])
+
+
+def test_slip10_secp256k1_ecc_public_key_tweak_add(data):
+    private_key = get_bytes(data["eccs"]["SLIP10-Secp256k1"]["private-key"])
+    tweak = bytes.fromhex("0f" * 32)
+    expected = SLIP10Secp256k1PrivateKeyCoincurve.from_bytes(
+        ((int.from_bytes(private_key, "big") + int.from_bytes(tweak, "big")) % SLIP10Secp256k1ECC.ORDER).to_bytes(32, "big")
+    ).public_key().raw_compressed()
+
+    for ecc, private_key_class in [
+        (SLIP10Secp256k1ECCCoincurve, SLIP10Secp256k1PrivateKeyCoincurve),
+        (SLIP10Secp256k1ECCECDSA, SLIP10Secp256k1PrivateKeyECDSA)
+    ]:
+        public_key = private_key_class.from_bytes(private_key).public_key()
+        for _tweak in [tweak, int.from_bytes(tweak, "big")]:
+            tweaked = ecc.public_key_tweak_add(public_key=public_key, tweak=_tweak)
+            assert isinstance(tweaked, ecc.PUBLIC_KEY)
+            assert tweaked.raw_compressed() == expected
@@ -50,3 +50,30 @@ def test_cardano_byron_legacy_hd(data):
     assert cardano_hd.fingerprint() == data["hds"]["Cardano"]["byron-legacy"]["derivation"]["fingerprint"]
     assert cardano_hd.parent_fingerprint() == data["hds"]["Cardano"]["byron-legacy"]["derivation"]["parent-fingerprint"]
     assert cardano_hd.address() == data["hds"]["Cardano"]["byron-legacy"]["derivation"]["address"]
+
+
+def test_cardano_byron_legacy_hd_path_key(data):
+    cardano_hd: CardanoHD = CardanoHD(
+        cardano_type=Cardano.TYPES.BYRON_LEGACY
+    ).from_seed(
+        seed=data["hds"]["Cardano"]["byron-legacy"]["seed"]
+    )
+
+    path_key: bytes = cardano_hd.path_key_bytes()
+    assert cardano_hd.path_key_bytes() is path_key
+    assert cardano_hd.path_key() == path_key.hex()
+
+    cardano_hd.from_derivation(
+        derivation=CustomDerivation(path=data["hds"]["Cardano"]["byron-legacy"]["derivation"]["path"])
+    )
+    assert cardano_hd.path_key_bytes() is path_key
+    assert cardano_hd.address() == data["hds"]["Cardano"]["byron-legacy"]["derivation"]["address"]
+
+    cardano_hd.from_xprivate_key(
+        xprivate_key=data["hds"]["Cardano"]["byron-legacy"]["root-xprivate-key"]
+    )
+    assert cardano_hd.path_key_bytes() is not path_key
+    assert cardano_hd.path_key_bytes() == path_key
+
+    cardano_hd.from_seed(seed="00" * 32)
+    assert cardano_hd.path_key_bytes() != path_key
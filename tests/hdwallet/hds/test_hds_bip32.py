@@ -7,7 +7,9 @@
 
 from hdwallet.cryptocurrencies import Bitcoin as Cryptocurrency
 from hdwallet.derivations import CustomDerivation
-from hdwallet.hds import BIP32HD
+from hdwallet.hds import (
+    BIP32HD, BIP32NodeCache
+)
 
 
 def test_bip32_hd(data):
@@ -90,3 +92,180 @@ def test_bip32_hd(data):
         address=Cryptocurrency.ADDRESSES.P2WSH_IN_P2SH,
         script_address_prefix=Cryptocurrency.NETWORKS.MAINNET.SCRIPT_ADDRESS_PREFIX
     ) == data["hds"]["BIP32"]["derivation"]["addresses"]["p2wsh-in-p2sh"]
+
+
+def test_bip32_hd_update_derivation(data):
+    bip32_hd: BIP32HD = BIP32HD(
+        ecc=Cryptocurrency.ECC
+    ).from_seed(
+        seed=data["hds"]["BIP32"]["seed"]
+    )
+
+    for path in [
+        "m/0'/1/2", "m/0'/1/3", "m/0'/2/3", "m/1'/2/3", "m/0'/1/2", data["hds"]["BIP32"]["derivation"]["path"]
+    ]:
+        bip32_hd.update_derivation(
+            derivation=CustomDerivation(path=path)
+        )
+        fresh_bip32_hd: BIP32HD = BIP32HD(
+            ecc=Cryptocurrency.ECC
+        ).from_seed(
+            seed=data["hds"]["BIP32"]["seed"]
+        ).from_derivation(
+            derivation=CustomDerivation(path=path)
+        )
+        assert bip32_hd.xprivate_key() == fresh_bip32_hd.xprivate_key()
+        assert bip32_hd.xpublic_key() == fresh_bip32_hd.xpublic_key()
+        assert bip32_hd.depth() == fresh_bip32_hd.depth()
+        assert bip32_hd.index() == fresh_bip32_hd.index()
+        assert bip32_hd.fingerprint() == fresh_bip32_hd.fingerprint()
+        assert bip32_hd.parent_fingerprint() == fresh_bip32_hd.parent_fingerprint()
+
+    assert bip32_hd.xprivate_key() == data["hds"]["BIP32"]["derivation"]["xprivate-key"]
+    assert bip32_hd.xpublic_key() == data["hds"]["BIP32"]["derivation"]["xpublic-key"]
+
+
+def test_bip32_hd_bytes(data):
+    bip32_hd: BIP32HD = BIP32HD(
+        ecc=Cryptocurrency.ECC
+    ).from_seed(
+        seed=data["hds"]["BIP32"]["seed"]
+    ).from_derivation(
+        derivation=CustomDerivation(path=data["hds"]["BIP32"]["derivation"]["path"])
+    )
+
+    assert bip32_hd.public_key_bytes().hex() == bip32_hd.public_key()
+    assert bip32_hd.public_key_bytes(public_key_type="uncompressed").hex() == bip32_hd.uncompressed()
+    assert bip32_hd.fingerprint_bytes().hex() == bip32_hd.fingerprint()
+    assert bip32_hd.fingerprint() == data["hds"]["BIP32"]["derivation"]["fingerprint"]
+    assert bip32_hd.wif() == data["hds"]["BIP32"]["derivation"]["wif"]
+
+
+
+def test_bip32_hd_drive_after_clean_derivation(data):
+
+    bip32_hd: BIP32HD = BIP32HD(
+        ecc=Cryptocurrency.ECC
+    ).from_seed(
+        seed=data["hds"]["BIP32"]["seed"]
+    ).update_derivation(
+        derivation=CustomDerivation(path="m/0/1")
+    )
+    # A public drive() moves off the tracked nodes, they must not be reused
+    bip32_hd.clean_derivation()
+    bip32_hd.drive(5)
+    bip32_hd.from_derivation(
+        derivation=CustomDerivation(path="m/0/1")
+    )
+
+    assert bip32_hd.depth() == 3
+    assert bip32_hd.xpublic_key() == BIP32HD(
+        ecc=Cryptocurrency.ECC
+    ).from_seed(
+        seed=data["hds"]["BIP32"]["seed"]
+    ).from_derivation(
+        derivation=CustomDerivation(path="m/5/0/1")
+    ).xpublic_key()
+
+def test_bip32_hd_node_cache(data):
+    node_cache: BIP32NodeCache = BIP32NodeCache(maxsize=16)
+    paths = [
+        "m/84'/0'/0'/0/0", "m/84'/0'/1'/0/0", "m/84'/0'/0'/0/1", "m/84'/0'/1'/1/0", "m/84'/0'/0'/0/0"
+    ]
+
+    bip32_hd: BIP32HD = BIP32HD(
+        ecc=Cryptocurrency.ECC, node_cache=node_cache
+    ).from_seed(
+        seed=data["hds"]["BIP32"]["seed"]
+    )
+    for path in paths:
+        bip32_hd.update_derivation(
+            derivation=CustomDerivation(path=path)
+        )
+        assert bip32_hd.xprivate_key() == BIP32HD(
+            ecc=Cryptocurrency.ECC
+        ).from_seed(
+            seed=data["hds"]["BIP32"]["seed"]
+        ).from_derivation(
+            derivation=CustomDerivation(path=path)
+        ).xprivate_key()
+
+    assert bip32_hd.node_cache() is node_cache
+    assert node_cache.size() == 11
+    assert node_cache.misses() == 11
+    assert node_cache.hits() == 6
+
+    node_cache.clear()
+    assert node_cache.size() == node_cache.hits() == node_cache.misses() == 0
+
+
+def test_bip32_hd_node_cache_public_key_types(data):
+    node_cache: BIP32NodeCache = BIP32NodeCache(maxsize=16)
+    path: str = "m/84'/0'/0'/0/0"
+
+    # Fingerprints depend on the public key type, a shared cache keeps them apart
+    for public_key_type in ["uncompressed", "compressed"]:
+        bip32_hd: BIP32HD = BIP32HD(
+            ecc=Cryptocurrency.ECC, public_key_type=public_key_type, node_cache=node_cache
+        ).from_seed(
+            seed=data["hds"]["BIP32"]["seed"]
+        ).update_derivation(
+            derivation=CustomDerivation(path=path)
+        )
+        fresh_bip32_hd: BIP32HD = BIP32HD(
+            ecc=Cryptocurrency.ECC, public_key_type=public_key_type
+        ).from_seed(
+            seed=data["hds"]["BIP32"]["seed"]
+        ).from_derivation(
+            derivation=CustomDerivation(path=path)
+        )
+        assert bip32_hd.parent_fingerprint() == fresh_bip32_hd.parent_fingerprint()
+        assert bip32_hd.fingerprint() == fresh_bip32_hd.fingerprint()
+        assert bip32_hd.xpublic_key() == fresh_bip32_hd.xpublic_key()
+
+    assert node_cache.size() == node_cache.misses() == 10
+
+def test_bip32_hd_derive_range(data):
+    bip32_hd: BIP32HD = BIP32HD(
+        ecc=Cryptocurrency.ECC
+    ).from_seed(
+        seed=data["hds"]["BIP32"]["seed"]
+    )
+    xpublic_key: str = bip32_hd.update_derivation(
+        derivation=CustomDerivation(path="m/84'/0'/0'/0")
+    ).xpublic_key()
+    path: str = bip32_hd.path()
+
+    children = list(bip32_hd.derive_range("m/84'/0'/0'/0", 0, 5))
+    assert [child.index for child in children] == [0, 1, 2, 3, 4]
+    assert bip32_hd.path() == path
+
+    for child in children:
+        child_bip32_hd: BIP32HD = BIP32HD(
+            ecc=Cryptocurrency.ECC
+        ).from_seed(
+            seed=data["hds"]["BIP32"]["seed"]
+        ).from_derivation(
+            derivation=CustomDerivation(path=f"m/84'/0'/0'/0/{child.index}")
+        )
+        assert child.public_key.hex() == child_bip32_hd.compressed()
+        assert child.private_key.hex() == child_bip32_hd.private_key()
+        assert child.chain_code.hex() == child_bip32_hd.chain_code()
+
+    public_children = list(BIP32HD(
+        ecc=Cryptocurrency.ECC
+    ).from_xpublic_key(
+        xpublic_key=xpublic_key
+    ).derive_range(None, 0, 5))
+    assert [child.public_key for child in public_children] == [child.public_key for child in children]
+    assert all(child.private_key is None for child in public_children)
+
+    hardened_children = list(bip32_hd.derive_range("m/84'/0'", 0, 2, hardened=True))
+    assert hardened_children[0].index == 0x80000000
+    assert hardened_children[0].public_key.hex() == BIP32HD(
+        ecc=Cryptocurrency.ECC
+    ).from_seed(
+        seed=data["hds"]["BIP32"]["seed"]
+    ).from_derivation(
+        derivation=CustomDerivation(path="m/84'/0'/0'")
+    ).compressed()
@@ -5,8 +5,18 @@
 # Distributed under the MIT software license, see the accompanying
 # file COPYING or https://opensource.org/license/mit
 
+from concurrent.futures import Future
+
 from hdwallet.cryptocurrencies import Monero
-from hdwallet.hds.monero import MoneroHD
+from hdwallet.hds.monero import (
+    MoneroHD, MoneroSubAddressTable
+)
+from hdwallet.addresses import MoneroAddress
+from hdwallet.exceptions import (
+    Error, DerivationError
+)
+
+import pytest
 
 
 def test_monero_hd(data):
@@ -37,3 +47,116 @@ def test_monero_hd(data):
         assert monero_hd.sub_address(
             minor=address["minor"], major=address["major"]
         ) == address["address"]
+
+
+def test_monero_hd_sub_addresses(data):
+
+    monero_hd = MoneroHD(
+        network=Monero.NETWORKS.MAINNET
+    ).from_seed(
+        seed=data["hds"]["Monero"]["seed"]
+    )
+
+    expected = sorted(
+        (address["major"], address["minor"], address["address"]) for address in data["hds"]["Monero"]["sub-addresses"]
+    )
+    assert list(monero_hd.sub_addresses(major_range=(0, 4), minor_range=(0, 1))) == expected
+    assert list(monero_hd.sub_addresses(major_range="0-4", minor_range="0-1", workers=2)) == expected
+    assert list(monero_hd.sub_addresses(major_range=1, minor_range=0)) == [
+        address for address in expected if address[:2] == (1, 0)
+    ]
+
+
+def test_monero_hd_sub_addresses_streaming(data, monkeypatch):
+
+    class Executor:
+        # Runs the chunks in this process, counting how many were submitted
+        submitted = 0
+
+        def __init__(self, max_workers):
+            pass
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *args):
+            return False
+
+        def submit(self, function, *args):
+            Executor.submitted += 1
+            future = Future()
+            future.set_result(function(*args))
+            return future
+
+    monkeypatch.setattr("hdwallet.hds.monero.ProcessPoolExecutor", Executor)
+    monero_hd = MoneroHD(
+        network=Monero.NETWORKS.MAINNET
+    ).from_seed(
+        seed=data["hds"]["Monero"]["seed"]
+    )
+
+    sub_addresses = monero_hd.sub_addresses(major_range=(0, 99), minor_range=0, workers=2)
+    assert next(sub_addresses)[:2] == (0, 0)
+    assert Executor.submitted == 4
+    assert len(list(sub_addresses)) == 99
+    assert Executor.submitted == 100
+
+
+def test_monero_hd_sub_address_table(data, tmp_path):
+
+    monero_hd = MoneroHD(
+        network=Monero.NETWORKS.MAINNET
+    ).from_seed(
+        seed=data["hds"]["Monero"]["seed"]
+    )
+
+    path = str(tmp_path / "monero.sat")
+    with MoneroSubAddressTable(path, capacity=2) as table:
+        table.update(monero_hd, major_range=(0, 4), minor_range=0)
+        assert len(table) == 5
+    with MoneroSubAddressTable(path) as table:
+        assert len(table) == 5
+        table.update(monero_hd, major_range=(0, 4), minor_range=(0, 1))
+        assert len(table) == 10
+        for address in data["hds"]["Monero"]["sub-addresses"]:
+            spend_public_key, _ = MoneroAddress.decode(address["address"], address_type=(
+                "standard" if address["major"] == 0 and address["minor"] == 0 else "sub-address"
+            ))
+            assert spend_public_key in table
+            assert table.lookup(spend_public_key) == (address["major"], address["minor"])
+        assert table.lookup(bytes(32)) is None
+        assert table.spend_public_key().hex() == data["hds"]["Monero"]["spend-public-key"]
+
+        with pytest.raises(Error, match="Sub-address table belongs to another wallet"):
+            table.update(MoneroHD().from_seed(seed="01" * 32), major_range=0, minor_range=1)
+
+
+def test_monero_hd_sub_address_table_interrupted(data, tmp_path, monkeypatch):
+
+    monero_hd = MoneroHD(
+        network=Monero.NETWORKS.MAINNET
+    ).from_seed(
+        seed=data["hds"]["Monero"]["seed"]
+    )
+
+    path = str(tmp_path / "monero.sat")
+    with MoneroSubAddressTable(path, capacity=2) as table:
+        with pytest.raises(DerivationError, match="Invalid minor index range"):
+            table.update(monero_hd, major_range=0, minor_range=2 ** 32)
+        # Nothing is written before the ranges are validated
+        assert table.spend_public_key() == bytes(32)
+
+        table.update(monero_hd, major_range=0, minor_range=(0, 1))
+
+        def interrupt(*args):
+            raise KeyboardInterrupt
+        monkeypatch.setattr(MoneroSubAddressTable, "_insert", interrupt)
+        with pytest.raises(KeyboardInterrupt):
+            table.update(monero_hd, major_range=1, minor_range=(0, 1))
+
+    # The interrupted grow left the table as it was and no temporary file behind
+    assert [file.name for file in tmp_path.iterdir()] == ["monero.sat"]
+    monkeypatch.undo()
+    with MoneroSubAddressTable(path) as table:
+        assert len(table) == 2
+        assert table.lookup(table.spend_public_key()) == (0, 0)
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+
+# Copyright © 2020-2024, Meheret Tesfaye Batu <meherett.batu@gmail.com>
+#             2024, Eyoel Tadesse <eyoel_tadesse@proton.me>
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or https://opensource.org/license/mit
+
+import pytest
+
+from hdwallet import HDWallet
+from hdwallet.cryptocurrencies import CRYPTOCURRENCIES
+from hdwallet.derivations import DERIVATIONS
+from hdwallet.hds import HDS
+from hdwallet.exceptions import Error
+
+
+def bip44_hdwallet(data) -> HDWallet:
+
+    # Dumping moves the wallet to its last derivation, every test needs a fresh one
+    return HDWallet(
+        cryptocurrency=CRYPTOCURRENCIES.cryptocurrency(
+            data["hdwallet"]["BIP44"]["compressed"]["cryptocurrency"]
+        ),
+        hd=HDS.hd(
+            data["hdwallet"]["BIP44"]["compressed"]["hd"]
+        ),
+        network=data["hdwallet"]["BIP44"]["compressed"]["network"],
+        public_key_type=data["hdwallet"]["BIP44"]["compressed"]["public_key_type"]
+    ).from_xprivate_key(
+        xprivate_key=data["hdwallet"]["BIP44"]["compressed"]["root_xprivate_key"],
+        strict=data["hdwallet"]["BIP44"]["compressed"]["strict"]
+    ).from_derivation(
+        derivation=DERIVATIONS.derivation(data["hdwallet"]["BIP44"]["derivation"]["name"])(
+            **data["hdwallet"]["BIP44"]["derivation"]["args"]
+        )
+    )
+
+
+def test_bip44_dumps_workers(data):
+
+    hdwallet: HDWallet = bip44_hdwallet(data)
+
+    dump = data["hdwallet"]["BIP44"]["compressed"].copy()
+    dump.update({
+        "entropy": None,
+        "strength": None,
+        "mnemonic": None,
+        "passphrase": None,
+        "language": None,
+        "seed": None
+    })
+    assert hdwallet.dumps(workers=2) == dump
+    assert hdwallet.xprivate_key() == dump["derivations"][-1]["xprivate_key"]
+
+    with pytest.raises(Error, match="Invalid workers number"):
+        hdwallet.dumps(workers=0)
+
+
+def test_bip44_iter_dumps(data):
+
+    hdwallet: HDWallet = bip44_hdwallet(data)
+
+    derivations = data["hdwallet"]["BIP44"]["compressed"]["derivations"]
+    iter_dumps = hdwallet.iter_dumps(exclude={"wif"})
+
+    first = next(iter_dumps)
+    assert "wif" not in first
+    assert first["xprivate_key"] == derivations[0]["xprivate_key"]
+    assert hdwallet.xprivate_key() == derivations[0]["xprivate_key"]
+
+    assert [first, *iter_dumps] == [
+        {key: value for key, value in derivation.items() if key != "wif"} for derivation in derivations
+    ]
+    assert hdwallet.xprivate_key() == derivations[-1]["xprivate_key"]
+
+
+def test_bip44_dump_include(data):
+
+    hdwallet: HDWallet = bip44_hdwallet(data)
+
+    derivations = data["hdwallet"]["BIP44"]["compressed"]["derivations"]
+
+    assert hdwallet.dumps(include={"symbol", "address"}) == {
+        "symbol": data["hdwallet"]["BIP44"]["compressed"]["symbol"],
+        "derivations": [
+            {"address": derivation["address"]} for derivation in derivations
+        ]
+    }
+
+    derivation = derivations[-1]
+    assert hdwallet.dump(exclude={"root"}, include={"at", "wif"}) == {
+        "at": derivation["at"], "wif": derivation["wif"]
+    }
+    assert hdwallet.dump(include={"derivation"}) == {"derivation": derivation}
+    assert hdwallet.dump(exclude={"root", "xprivate-key", "at"}) == {
+        key: value for key, value in derivation.items() if key not in ["xprivate_key", "at"]
+    }
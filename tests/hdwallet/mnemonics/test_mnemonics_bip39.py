@@ -80,3 +80,40 @@ def test_bip39_mnemonics(data):
             entropy="cdf694ac868efd01673fc51e897c57a0bd428503080ad4c94c7d6f6d13f095fbc8",
             language=BIP39_MNEMONIC_LANGUAGES.ENGLISH
         )
+
+
+def test_bip39_mnemonics_words_list_cache():
+
+    words_list, words_list_with_index = BIP39Mnemonic.get_words_list_with_index(
+        language=BIP39_MNEMONIC_LANGUAGES.JAPANESE
+    )
+    assert len(words_list) == BIP39Mnemonic.words_list_number
+    assert words_list == BIP39Mnemonic.normalize(
+        BIP39Mnemonic.get_words_list_by_language(language=BIP39_MNEMONIC_LANGUAGES.JAPANESE)
+    )
+    assert all(words_list_with_index[word] == index for index, word in enumerate(words_list))
+    assert BIP39Mnemonic.get_words_list_with_index(
+        language=BIP39_MNEMONIC_LANGUAGES.JAPANESE
+    )[1] is words_list_with_index
+
+    BIP39Mnemonic.get_words_list_by_language(language=BIP39_MNEMONIC_LANGUAGES.ENGLISH).clear()
+    assert len(BIP39Mnemonic.get_words_list_by_language(language=BIP39_MNEMONIC_LANGUAGES.ENGLISH)) == 2048
+
+
+def test_bip39_mnemonics_find_language():
+
+    words_index = BIP39Mnemonic.get_words_index()
+    assert list(words_index["zoo"]) == [BIP39_MNEMONIC_LANGUAGES.ENGLISH]
+    # Shared by the English and French word lists, English comes first
+    assert list(words_index["animal"]) == [BIP39_MNEMONIC_LANGUAGES.ENGLISH, BIP39_MNEMONIC_LANGUAGES.FRENCH]
+
+    for language in BIP39Mnemonic.languages:
+        words_list, found_language = BIP39Mnemonic.find_language(
+            BIP39Mnemonic.normalize(BIP39Mnemonic.from_words(words=12, language=language))
+        )
+        assert words_list == BIP39Mnemonic.get_words_list_with_index(language=found_language)[0]
+        assert words_index[words_list[0]][found_language] == 0
+
+    assert BIP39Mnemonic.find_language(["animal", "abaisser"])[1] == BIP39_MNEMONIC_LANGUAGES.FRENCH
+    with pytest.raises(MnemonicError, match="Invalid language for mnemonic"):
+        BIP39Mnemonic.find_language(["abandon", "abaisser", "zoo"])
@@ -9,6 +9,7 @@ import json
 import os
 import pytest
 
+from hdwallet.exceptions import SeedError
 from hdwallet.seeds.bip39 import BIP39Seed
 
 
@@ -29,3 +30,28 @@ def test_bip39_seeds(data):
                     mnemonic= data["seeds"]["BIP39"][words][lang]["mnemonic"], passphrase=passphrase
                 ) == data["seeds"]["BIP39"][words][lang]["passphrases"][passphrase]
 
+
+
+def test_bip39_seeds_from_mnemonics(data):
+
+    pairs, seeds = [], []
+    for words in data["seeds"]["BIP39"].keys():
+        for lang in data["seeds"]["BIP39"][words].keys():
+            mnemonic: str = data["seeds"]["BIP39"][words][lang]["mnemonic"]
+            pairs.append((mnemonic, None))
+            seeds.append(data["seeds"]["BIP39"][words][lang]["non-passphrase-seed"])
+            for passphrase, seed in data["seeds"]["BIP39"][words][lang]["passphrases"].items():
+                pairs.append((mnemonic, passphrase))
+                seeds.append(seed)
+
+    expected = [(mnemonic, passphrase, seed) for (mnemonic, passphrase), seed in zip(pairs, seeds)]
+    assert list(BIP39Seed.from_mnemonics(iter(pairs))) == expected
+    assert list(BIP39Seed.from_mnemonics(iter(pairs), workers=2, chunk_size=4)) == expected
+
+    assert list(BIP39Seed.from_mnemonics(
+        iter(pairs), workers=2, chunk_size=2, predicate=lambda seed: seed == seeds[5]
+    )) == [expected[5]]
+    assert list(BIP39Seed.from_mnemonics(iter(pairs), predicate=lambda seed: False)) == []
+
+    with pytest.raises(SeedError, match="Invalid workers number"):
+        BIP39Seed.from_mnemonics(pairs, workers=0)
@@ -10,7 +10,7 @@ import hashlib
 
 from hdwallet.libs.ripemd160 import ripemd160
 from hdwallet.libs.base58 import (
-    checksum_encode, check_encode, check_decode, decode, encode, string_to_int
+    checksum_encode, check_encode, check_encode_many, check_decode, decode, encode, encode_many, string_to_int
 )
 
 
@@ -37,6 +37,14 @@ def test_base58():
 
     assert encode(decode("111233QC4")) == "111233QC4"
 
+    assert encode(b"") == "" and decode("") == b""
+    assert encode(b"\0\0") == "11" and decode("11") == b"\0\0"
+    assert encode_many([unhexlify(RAW), b"\0\0(\x7f\xb4\xcd"]) == [encode(unhexlify(RAW)), "11233QC4"]
+    assert check_encode_many([unhexlify(RAW)]) == [check_encode(raw=unhexlify(RAW))]
+
+    with pytest.raises(ValueError, match="Invalid base58 character"):
+        assert decode("0OIl")
+
     # Ensure ETH address checksums are correct; these are Keccak hash of the lower-case hex address,
     # with hash results mapped onto the upper/lower case bits of the address.
     eth = "0xfc2077CA7F403cBECA41B1B0F62D91B5EA631B5E"
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+
+from binascii import unhexlify
+
+from hdwallet.libs.bech32 import (
+    bech32_encode, bech32_encode_many, bech32_decode, bech32_polymod, bech32_hrp_expand
+)
+from hdwallet.libs.segwit_bech32 import (
+    segwit_encode, segwit_encode_many, segwit_decode
+)
+
+
+P2WPKH_PROGRAM: str = "751e76e8199196d454941c45d1b3a323f1433bd6"
+P2TR_PROGRAM: str = "79be667ef9dcbbac55a06295ce870b07029bfcdb2dce28d959f2815b16f81798"
+
+
+def test_bech32():
+
+    # Table-driven polymod against the bit-serial definition
+    generator = [0x3b6a57b2, 0x26508e6d, 0x1ea119fa, 0x3d4233dd, 0x2a1462b3]
+    values = bech32_hrp_expand("cosmos") + list(range(32)) + [31, 0, 7]
+    chk = 1
+    for value in values:
+        top = chk >> 25
+        chk = (chk & 0x1ffffff) << 5 ^ value
+        for i in range(5):
+            chk ^= generator[i] if ((top >> i) & 1) else 0
+    assert bech32_polymod(values) == chk
+
+    assert segwit_encode("bc", 0, unhexlify(P2WPKH_PROGRAM)) == "bc1qw508d6qejxtdg4y5r3zarvary0c5xw7kv8f3t4"
+    assert segwit_encode("bc", 1, unhexlify(P2TR_PROGRAM)) == \
+        "bc1p0xlxvlhemja6c4dqv22uapctqupfhlxm9h8z3k2e72q4k9hcz7vqzk5jj0"
+    assert segwit_decode("bc", "bc1qw508d6qejxtdg4y5r3zarvary0c5xw7kv8f3t4") == (0, unhexlify(P2WPKH_PROGRAM))
+    assert segwit_encode("bc", 0, unhexlify(P2TR_PROGRAM)[:30]) is None
+    assert segwit_encode("BC", 0, unhexlify(P2WPKH_PROGRAM)) is None
+
+    assert segwit_encode_many("tb", 0, [unhexlify(P2WPKH_PROGRAM), unhexlify(P2TR_PROGRAM), b"\x00"]) == [
+        segwit_encode("tb", 0, unhexlify(P2WPKH_PROGRAM)), segwit_encode("tb", 0, unhexlify(P2TR_PROGRAM)), None
+    ]
+
+    address: str = bech32_encode("cosmos", unhexlify(P2WPKH_PROGRAM))
+    assert address == bech32_encode("cosmos", list(unhexlify(P2WPKH_PROGRAM)))
+    assert bech32_decode("cosmos", address)[1] == unhexlify(P2WPKH_PROGRAM)
+    assert bech32_encode_many("cosmos", [unhexlify(P2WPKH_PROGRAM)] * 2) == [address, address]
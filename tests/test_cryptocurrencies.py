@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+
+# Copyright © 2020-2024, Meheret Tesfaye Batu <meherett.batu@gmail.com>
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or https://opensource.org/license/mit
+
+import subprocess
+import sys
+
+import pytest
+
+from hdwallet.cryptocurrencies import (
+    CRYPTOCURRENCIES, SYMBOLS, get_cryptocurrency, Bitcoin
+)
+from hdwallet.cryptocurrencies.manifest import (
+    MANIFEST, generate
+)
+from hdwallet.exceptions import (
+    CryptocurrencyError, SymbolError
+)
+
+
+def test_cryptocurrencies_manifest():
+
+    # Run `python -m hdwallet.cryptocurrencies.manifest` when this fails
+    assert MANIFEST == generate()
+
+
+def test_cryptocurrencies_registry():
+
+    assert len(CRYPTOCURRENCIES.names()) == len(MANIFEST)
+    assert CRYPTOCURRENCIES.is_cryptocurrency("Bitcoin")
+    assert not CRYPTOCURRENCIES.is_cryptocurrency("Bitcoin-Cash-Classic")
+    assert CRYPTOCURRENCIES.cryptocurrency("Bitcoin") is Bitcoin
+    assert get_cryptocurrency("BTC") is Bitcoin
+
+    for name, (_, class_name, symbol) in MANIFEST.items():
+        cryptocurrency = CRYPTOCURRENCIES.dictionary[name]
+        assert cryptocurrency.NAME == name
+        assert cryptocurrency.__name__ == class_name
+        assert get_cryptocurrency(symbol) is cryptocurrency
+
+    with pytest.raises(CryptocurrencyError):
+        CRYPTOCURRENCIES.cryptocurrency("Bitcoin-Cash-Classic")
+    with pytest.raises(SymbolError):
+        get_cryptocurrency("BTCC")
+
+
+def test_cryptocurrencies_indexes():
+
+    with pytest.raises(TypeError):
+        SYMBOLS["BTCC"] = "Bitcoin"
+
+    assert Bitcoin.NETWORKS.get_networks() == ["mainnet", "testnet", "regtest"]
+    assert Bitcoin.NETWORKS.is_network("testnet")
+    assert not Bitcoin.NETWORKS.is_network("TESTNET")
+    assert "_index" not in vars(Bitcoin.NETWORKS)
+
+    assert Bitcoin.ADDRESSES.get_addresses() == [
+        "P2PKH", "P2SH", "P2TR", "P2WPKH", "P2WPKH-In-P2SH", "P2WSH", "P2WSH-In-P2SH"
+    ]
+    assert Bitcoin.ADDRESSES.length() == 7
+    assert Bitcoin.ADDRESSES.is_address("P2WPKH-In-P2SH")
+    assert not Bitcoin.ADDRESSES.is_address("P2WPKH_IN_P2SH")
+
+    # Callers get their own copy, the index is left untouched
+    Bitcoin.ADDRESSES.get_addresses().clear()
+    assert Bitcoin.ADDRESSES.length() == 7
+
+
+def test_cryptocurrencies_import_time():
+
+    # -X importtime reports "self | cumulative | module" on stderr for every module
+    # imported, including the cryptocurrency modules the registry loads on demand
+    report: str = subprocess.run([sys.executable, "-X", "importtime", "-c", (
+        "from hdwallet.cryptocurrencies import CRYPTOCURRENCIES, get_cryptocurrency\n"
+        "assert CRYPTOCURRENCIES.is_cryptocurrency('Bitcoin')\n"
+        "assert get_cryptocurrency('ETH').NAME == 'Ethereum'"
+    )], capture_output=True, text=True, check=True).stderr
+    modules: dict = {
+        line.split("|")[2].strip(): int(line.split("|")[1]) for line in report.splitlines()
+        if line.startswith("import time:") and line.split("|")[1].strip().isdigit()
+    }
+
+    assert "hdwallet.hdwallet" not in modules
+    assert {
+        module for module in modules if module.startswith("hdwallet.cryptocurrencies.")
+    } == {
+        "hdwallet.cryptocurrencies.icryptocurrency",
+        "hdwallet.cryptocurrencies.manifest",
+        "hdwallet.cryptocurrencies.ethereum"
+    }
@@ -9,7 +9,8 @@ import pytest
 from hdwallet.crypto import (
     hmac_sha256, hmac_sha512, blake2b, blake2b_32, blake2b_40, blake2b_160, blake2b_224, blake2b_256, blake2b_512,
     chacha20_poly1305_encrypt, chacha20_poly1305_decrypt, sha256, double_sha256, hash160, crc32, xmodem_crc, 
-    pbkdf2_hmac_sha512, kekkak256, ripemd160, sha512, sha512_256, sha3_256
+    pbkdf2_hmac_sha512, kekkak256, ripemd160, sha512, sha512_256, sha3_256, RIPEMD160_BACKENDS,
+    hmac_sha512_context, hmac_sha512_digest
 )
 
 # def test_hmac_sha256():
@@ -20,6 +21,25 @@ from hdwallet.crypto import (
 #     assert hmac_sha512("key", "data") == b'todo_mock'
 #     assert hmac_sha512(b"key", b"data") == b'todo_mock'
 
+def test_hmac_sha512_context():
+    # RFC 4231 test cases 2 and 6, the second with a key longer than the block size
+    assert hmac_sha512_digest(hmac_sha512_context(b"Jefe"), b"what do ya want for nothing?").hex() == (
+        "164b7a7bfcf819e2e395fbe73b56e0a387bd64222e831fd610270cd7ea250554"
+        "9758bf75c05a994a6d034f65f8f0e6fdcaeab1a34d4a6b4b636e070a38bce737"
+    )
+    assert hmac_sha512_digest(
+        hmac_sha512_context(b"\xaa" * 131), b"Test Using Larger Than Block-Size Key - Hash Key First"
+    ).hex() == (
+        "80b24263c7c1a3ebb71493c1dd7be8b49b46d1f41b4aeec1121b013783f8f352"
+        "6b56d037e05f2598bd0fd2215d6a1e5295e64f73f63f0aec8b915a985d786598"
+    )
+
+    # Contexts are not shared and stay reusable, every digest starts from the keyed state
+    context = hmac_sha512_context(b"\x01" * 32)
+    assert context is not hmac_sha512_context(b"\x01" * 32)
+    for data in (b"", b"\x00" * 37, b"\x02" * 200, b""):
+        assert hmac_sha512_digest(context, data) == hmac_sha512(b"\x01" * 32, data)
+
 # def test_blake2b():
 #     assert blake2b("data", 64) == b'todo_mock'
 
@@ -71,8 +91,14 @@ from hdwallet.crypto import (
 # def test_kekkak256():
 #     assert kekkak256("data") == b'todo_mock'
 
-# def test_ripemd160():
-#     assert ripemd160("data") == b'todo_mock'
+def test_ripemd160():
+    assert "pure" in RIPEMD160_BACKENDS
+    for backend in RIPEMD160_BACKENDS.values():
+        assert backend(b"") == bytes.fromhex("9c1185a5c5e9fc54612808977ee8f548b2258d31")
+        assert backend(b"message digest") == bytes.fromhex("5d0689ef49d2fae572b881b123a85ffa21595f36")
+        assert backend(bytes(range(256)) * 3) == RIPEMD160_BACKENDS["pure"](bytes(range(256)) * 3)
+    assert ripemd160(b"abc") == bytes.fromhex("8eb208f7e05d987a9b044a8e98c6b087f15a0bfc")
+    assert ripemd160("616263") == ripemd160(b"abc")
 
 # def test_sha512():
 #     assert sha512("data") == b'todo_mock'